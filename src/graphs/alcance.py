@@ -0,0 +1,148 @@
+import sys
+from array import array
+from typing import Any, Dict, List
+
+from .graph import Graph, FrozenGraph
+from .algorithms import _componentes_fortes
+from .cache import caminho_tabela, identificar_grafo, mapear_tabelas, salvar_tabelas
+
+# Índice de alcance: condensação do grafo pelas componentes fortes e o
+# fecho transitivo da condensação em bitsets.
+#
+# As componentes saem do Tarjan em ordem topológica reversa, então todo
+# arco da condensação vai de uma componente de número maior para uma de
+# número menor. Daí u só alcança v se comp[v] <= comp[u] (corte O(1)
+# sem olhar o fecho); nos demais casos o bit comp[v] da linha comp[u]
+# do fecho responde.
+#
+# O fecho ocupa k * ceil(k / 64) palavras de 64 bits para k componentes:
+# no pior caso (grafo acíclico, k = n) são ~2,6 MB para 4.533 nós; num
+# grafo com uma componente gigante fica bem menor.
+
+MAGIC_ALCANCE = b"GRAFOALC"
+VERSAO_ALCANCE = 1
+
+
+class Alcance:
+    """
+    componente[v] = componente forte do nó v (ordem do Tarjan); fecho
+    guarda, para cada componente, o bitset das componentes que ela alcança
+    (palavras por linha = ceil(k / 64)).
+    """
+
+    def __init__(self, nomes: List[str], componente, fecho, componentes: int):
+        self.nomes = nomes
+        self.indice: Dict[str, int] = {no: i for i, no in enumerate(nomes)}
+        self.componentes = componentes
+        self.palavras = (componentes + 63) // 64
+        self.componente = memoryview(componente).toreadonly()
+        self._fecho = memoryview(fecho).toreadonly()
+
+    def alcanca_ids(self, u: int, v: int) -> bool:
+        cu, cv = self.componente[u], self.componente[v]
+        if cu == cv:
+            return True
+        if cv > cu:
+            return False
+        return bool((self._fecho[cu * self.palavras + (cv >> 6)] >> (cv & 63)) & 1)
+
+    def alcanca(self, origem: str, destino: str) -> bool:
+        if origem not in self.indice:
+            raise ValueError(f"Origem: '{origem}' não está no grafo.")
+        if destino not in self.indice:
+            raise ValueError(f"Destino: '{destino}' não está no grafo.")
+        return self.alcanca_ids(self.indice[origem], self.indice[destino])
+
+    def estatisticas(self) -> Dict[str, Any]:
+        tamanhos = [0] * self.componentes
+        for c in self.componente:
+            tamanhos[c] += 1
+        return {
+            "nos": len(self.nomes),
+            "componentes": self.componentes,
+            "maior_componente": max(tamanhos, default=0),
+            "bytes": self.componente.nbytes + self._fecho.nbytes,
+        }
+
+
+def preparar_alcance(grafo: Graph | FrozenGraph) -> Alcance:
+    if isinstance(grafo, Graph):
+        grafo = grafo.congelar()
+    n = grafo.ordem()
+    vizinhos = grafo.vizinhos_ids
+    sucessores = lambda u: [v for v, _w in vizinhos(u)]
+    componentes = _componentes_fortes(range(n), sucessores)
+
+    componente = array("i", bytes(4 * n))
+    for c, nos in enumerate(componentes):
+        for v in nos:
+            componente[v] = c
+
+    # fecho por componente, na ordem do Tarjan: as componentes sucessoras
+    # (números menores) já estão prontas quando chega a vez de c
+    k = len(componentes)
+    linhas: List[int] = []
+    for c, nos in enumerate(componentes):
+        linha = 1 << c
+        for u in nos:
+            for v in sucessores(u):
+                d = componente[v]
+                if d != c:
+                    linha |= linhas[d]
+        linhas.append(linha)
+
+    palavras = (k + 63) // 64
+    fecho = array("Q")
+    for linha in linhas:
+        fecho.frombytes(linha.to_bytes(8 * palavras, "little"))
+    if sys.byteorder == "big":
+        fecho.byteswap()
+    return Alcance(list(grafo.nomes), componente, fecho, k)
+
+
+def salvar_alcance(alcance: Alcance, destino, cabecalho: Dict[str, Any] | None = None) -> None:
+    salvar_tabelas(
+        destino,
+        MAGIC_ALCANCE,
+        VERSAO_ALCANCE,
+        dict(cabecalho or {}, nomes=alcance.nomes, componentes=alcance.componentes),
+        {"componente": array("i", alcance.componente), "fecho": array("Q", alcance._fecho)},
+    )
+
+
+def _do_mapeamento(mapeado) -> Alcance:
+    cabecalho, vetores = mapeado
+    return Alcance(cabecalho["nomes"], vetores["componente"], vetores["fecho"], cabecalho["componentes"])
+
+
+def carregar_alcance(caminho) -> Alcance | None:
+    mapeado = mapear_tabelas(caminho, MAGIC_ALCANCE, VERSAO_ALCANCE)
+    return None if mapeado is None else _do_mapeamento(mapeado)
+
+
+def alcance_do_cache(grafo: FrozenGraph) -> Alcance:
+    """
+    Como preparar_alcance, mas grava o índice ao lado do cache do grafo
+    (out/cache) e o reaproveita enquanto o cache não mudar.
+    Grafos que não vieram do cache só são preparados em memória.
+    """
+    opcoes = {"indice": "fecho_scc"}
+    destino = caminho_tabela(grafo, "alc", opcoes)
+    if destino is None:
+        return preparar_alcance(grafo)
+
+    grafo_atual = identificar_grafo(grafo)
+    mapeado = mapear_tabelas(destino, MAGIC_ALCANCE, VERSAO_ALCANCE)
+    if mapeado is not None and mapeado[0].get("grafo") == grafo_atual and mapeado[0].get("opcoes") == opcoes:
+        return _do_mapeamento(mapeado)
+
+    alcance = preparar_alcance(grafo)
+    salvar_alcance(alcance, destino, {"grafo": grafo_atual, "opcoes": opcoes})
+    return carregar_alcance(destino)
+
+
+def anexar_alcance(grafo: FrozenGraph) -> Alcance:
+    # liga o índice ao grafo: as buscas de caminho mínimo passam a responder
+    # "sem caminho" em O(1) quando o destino não é alcançável
+    grafo.alcance = alcance_do_cache(grafo)
+    return grafo.alcance
@@ -1,7 +1,7 @@
 from heapq import heappush, heappop
-from typing import Callable, Dict, List, Tuple, Set, Optional, Any
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Tuple, Set, Optional, Any
 from collections import deque
-from .graph import Graph
+from .graph import Graph, FrozenGraph
 
 
 class NodeNotFound(KeyError):
@@ -47,192 +47,477 @@ def _edge_as_data(weight: float):
     return {"weight": weight}
 
 
-def dijkstra_path(grafo: Graph, origem: str, destino: str) -> List[str]:
-    if not grafo.tem_no(origem):
-        raise ValueError(f"Origem: '{origem}' não está no grafo.")
-    if not grafo.tem_no(destino):
-        raise ValueError(f"Destino: '{destino}' não está no grafo.")
-    if grafo.possui_peso_negativo():
-        raise ValueError("Peso negativo encontrado.")
+def _identidade(x):
+    return x
+
+
+def _nucleo(grafo, coluna: str | None = None, reverso: bool = False):
+    # Retorna (vizinhos, chave, nome). Com FrozenGraph (ou view sobre ele) os
+    # algoritmos rodam sobre ids inteiros e só convertem para nomes na saída.
+    # coluna escolhe qual peso os vizinhos devolvem (None = peso principal);
+    # reverso=True devolve os arcos de entrada (predecessores).
+    if grafo.usa_ids:
+        vizinhos = grafo.predecessores_ids if reverso else grafo.vizinhos_ids
+        chave, nome = grafo.indice.__getitem__, grafo.nomes.__getitem__
+    else:
+        vizinhos = grafo.predecessores_view if reverso else grafo.vizinhos_view
+        chave = nome = _identidade
+
+    if coluna is not None and coluna not in ("weight", grafo.nome_peso):
+        if not grafo.tem_coluna(coluna):
+            raise KeyError(f"Coluna de peso inexistente: {coluna}")
+        por_coluna = vizinhos
+        vizinhos = lambda u: por_coluna(u, coluna)
+
+    return vizinhos, chave, nome
+
+
+def _sem_caminho(grafo, origem: str, destino: str) -> bool:
+    # Consulta O(1) ao índice de alcance anexado ao grafo (graphs.alcance):
+    # True só quando o índice garante que destino não é alcançável.
+    alcance = getattr(grafo, "alcance", None)
+    return alcance is not None and not alcance.alcanca(origem, destino)
+
+
+class ShortestPathResult:
+# Resultado de uma busca origem -> destino: custo, caminho e, se pedida,
+# a árvore inteira (dist e pred dos nós alcançados).
+    def __init__(
+        self,
+        source: str,
+        target: str | None,
+        cost: float,
+        path: List[str],
+        dist: Optional[Dict[str, float]] = None,
+        pred: Optional[Dict[str, Optional[str]]] = None,
+        settled: Optional[int] = None,
+    ):
+        self.source = source
+        self.target = target
+        self.cost = cost
+        self.path = path
+        self.dist = dist
+        self.pred = pred
+        # nós fechados (retirados da fila) pela busca
+        self.settled = settled
 
-    custo_minimo: Dict[str, float] = {origem: 0.0}
+    def __repr__(self) -> str:
+        return f"ShortestPathResult({self.source!r} -> {self.target!r}, cost={self.cost}, path={self.path!r})"
+
+
+def _dijkstra_busca(vizinhos, fonte, alvos) -> Tuple[Dict[Any, float], Dict[Any, Any], int]:
+    # Dijkstra a partir de fonte; para quando todos os alvos saem da fila
+    # (alvos vazio = árvore completa).
+    # Retorna (custo_minimo, no_predecessor, nós fechados).
+    pendentes = set(alvos)
+    completa = not pendentes
+    fechados = 0
+
+    custo_minimo: Dict[str, float] = {fonte: 0.0}
     no_predecessor: Dict[str, str] = {}
-    fila_prioridade: List[Tuple[float, str]] = [(0.0, origem)]
-    
-    caminho_existe = False
+    fila_prioridade: List[Tuple[float, str]] = [(0.0, fonte)]
 
     while fila_prioridade:
         custo_atual, no_atual = heappop(fila_prioridade)
 
-        if no_atual == destino:
-            caminho_existe = True
-            break
+        if no_atual in pendentes:
+            pendentes.discard(no_atual)
+            if not pendentes and not completa:
+                break
 
         if custo_atual > custo_minimo.get(no_atual, float('inf')):
             continue
+        fechados += 1
 
-        for no_vizinho, peso_aresta in grafo.vizinhos(no_atual):
+        for no_vizinho, peso_aresta in vizinhos(no_atual):
             novo_custo_total = custo_atual + peso_aresta
-            
+
             if novo_custo_total < custo_minimo.get(no_vizinho, float('inf')):
                 custo_minimo[no_vizinho] = novo_custo_total
                 no_predecessor[no_vizinho] = no_atual
                 heappush(fila_prioridade, (novo_custo_total, no_vizinho))
 
-    if not caminho_existe:
-        return []
-
-    melhor_caminho = []
-    passo_atual = destino
-    
-    while passo_atual != origem:
-        melhor_caminho.append(passo_atual)
-        passo_atual = no_predecessor[passo_atual]
-        
-    melhor_caminho.append(origem)
-    
-    return melhor_caminho[::-1]
-
-def dijkstra_path_length(grafo: Graph, origem: str, destino: str) -> float:    
-    if not grafo.tem_no(origem):
-        raise ValueError(f"Origem: '{origem}' não está no grafo.")
-    if not grafo.tem_no(destino):
-        raise ValueError(f"Destino: '{destino}' não está no grafo.")
-    if grafo.possui_peso_negativo():
-        raise ValueError("Peso negativo encontrado.")
+    return custo_minimo, no_predecessor, fechados
 
-    custo_minimo: Dict[str, float] = {origem: 0.0}
-    
-    fila_prioridade: List[Tuple[float, str]] = [(0.0, origem)]
-    
-    while fila_prioridade:
-        custo_acumulado, no_atual = heappop(fila_prioridade)
 
-        if no_atual == destino:
-            return custo_acumulado
+def _dijkstra_bidirecional(vizinhos, anteriores, fonte, alvo) -> Tuple[float, List[Any], int]:
+    # Duas bolas: para frente pelos arcos de saída a partir de fonte e para
+    # trás pelos arcos de entrada a partir de alvo. Cada passo expande o lado
+    # com menor topo de fila; para quando topo_f + topo_b >= melhor custo
+    # já visto (mu). Retorna (custo, caminho em ids, nós fechados).
+    if fonte == alvo:
+        return 0.0, [fonte], 1
 
-        if custo_acumulado > custo_minimo.get(no_atual, float('inf')):
-            continue
+    dist = ({fonte: 0.0}, {alvo: 0.0})
+    pred: Tuple[Dict[Any, Any], Dict[Any, Any]] = ({}, {})
+    peso_pred: Tuple[Dict[Any, float], Dict[Any, float]] = ({}, {})
+    filas: Tuple[List[Tuple[float, Any]], List[Tuple[float, Any]]] = ([(0.0, fonte)], [(0.0, alvo)])
+    fechados = (set(), set())
+    expandir = (vizinhos, anteriores)
 
-        for no_vizinho, peso_aresta in grafo.vizinhos(no_atual):
-            novo_custo_total = custo_acumulado + peso_aresta
-            
-            if novo_custo_total < custo_minimo.get(no_vizinho, float('inf')):
-                custo_minimo[no_vizinho] = novo_custo_total
-                heappush(fila_prioridade, (novo_custo_total, no_vizinho))
+    mu = float('inf')
+    encontro = None
 
-    return float('inf')
+    while filas[0] and filas[1]:
+        if filas[0][0][0] + filas[1][0][0] >= mu:
+            break
 
-def bellman_ford(
-    G: Graph,
-    source: str,
-    target: str,
-    weight: str | Callable = "weight",
-):
-    if source not in G.nos():
-        raise NodeNotFound(source)
+        lado = 0 if filas[0][0][0] <= filas[1][0][0] else 1
+        custo_atual, u = heappop(filas[lado])
+        if u in fechados[lado]:
+            continue
+        fechados[lado].add(u)
+
+        d, p, pp, d_outro = dist[lado], pred[lado], peso_pred[lado], dist[1 - lado]
+        for v, w in expandir[lado](u):
+            novo = custo_atual + w
+            if novo < d.get(v, float('inf')):
+                d[v] = novo
+                p[v] = u
+                pp[v] = w
+                heappush(filas[lado], (novo, v))
+            if v in d_outro:
+                total = d[v] + d_outro[v]
+                if total < mu:
+                    mu, encontro = total, v
+
+    total_fechados = len(fechados[0]) + len(fechados[1])
+    if encontro is None:
+        return float('inf'), [], total_fechados
+
+    caminho = [encontro]
+    while caminho[-1] != fonte:
+        caminho.append(pred[0][caminho[-1]])
+    caminho.reverse()
+    # custo somado na ordem do caminho, como na busca unidirecional
+    custo = dist[0][encontro]
+    while caminho[-1] != alvo:
+        v = caminho[-1]
+        custo += peso_pred[1][v]
+        caminho.append(pred[1][v])
+    return custo, caminho, total_fechados
+
+
+def _resultado_dijkstra(origem, destino, fonte, alvo, custo_minimo, no_predecessor, fechados, nome) -> ShortestPathResult:
+    # Sem caminho: custo infinito e caminho vazio
+    custo = float('inf')
+    melhor_caminho: List[str] = []
+    if alvo in custo_minimo:
+        custo = custo_minimo[alvo]
+        passo_atual = alvo
+        while passo_atual != fonte:
+            melhor_caminho.append(nome(passo_atual))
+            passo_atual = no_predecessor[passo_atual]
+        melhor_caminho.append(origem)
+        melhor_caminho.reverse()
+    return ShortestPathResult(origem, destino, custo, melhor_caminho, settled=fechados)
+
+
+def dijkstra_shortest_path(
+    grafo: Graph | FrozenGraph,
+    origem: str,
+    destino: str | None,
+    weight: str | None = None,
+    arvore: bool = False,
+    bidirecional: bool = False,
+) -> ShortestPathResult:
+    # Com arvore=True a busca não para no destino e o resultado traz
+    # dist/pred de todos os nós alcançados. bidirecional=True busca ao mesmo
+    # tempo a partir do destino pelos arcos de entrada: mesmo custo, e o
+    # mesmo caminho sempre que o caminho mínimo for único.
+    if not grafo.tem_no(origem):
+        raise ValueError(f"Origem: '{origem}' não está no grafo.")
+    if destino is not None and not grafo.tem_no(destino):
+        raise ValueError(f"Destino: '{destino}' não está no grafo.")
+    if bidirecional and (arvore or destino is None):
+        raise ValueError("Busca bidirecional precisa de destino e não monta a árvore.")
 
-    weight_fn = _weight_function(weight)
+    vizinhos, chave, nome = _nucleo(grafo, weight)
+    if grafo.possui_peso_negativo(weight):
+        raise ValueError("Peso negativo encontrado.")
 
-    dist: Dict[str, float] = {source: 0.0}
-    pred: Dict[str, str] = {source: None}
-    in_queue: Set[str] = {source}
-    queue = deque([source])
-    count: Dict[str, int] = {source: 0}
+    if destino is not None and not arvore and _sem_caminho(grafo, origem, destino):
+        return ShortestPathResult(origem, destino, float('inf'), [], settled=0)
+
+    fonte = chave(origem)
+    alvo = None if destino is None else chave(destino)
+
+    if bidirecional:
+        anteriores = _nucleo(grafo, weight, reverso=True)[0]
+        custo, caminho, fechados = _dijkstra_bidirecional(vizinhos, anteriores, fonte, alvo)
+        return ShortestPathResult(origem, destino, custo, [nome(v) for v in caminho], settled=fechados)
+
+    alvos = () if arvore or alvo is None else (alvo,)
+    custo_minimo, no_predecessor, fechados = _dijkstra_busca(vizinhos, fonte, alvos)
+    resultado = _resultado_dijkstra(origem, destino, fonte, alvo, custo_minimo, no_predecessor, fechados, nome)
+
+    if arvore:
+        resultado.dist = {nome(v): d for v, d in custo_minimo.items()}
+        resultado.pred = {origem: None}
+        resultado.pred.update((nome(v), nome(u)) for v, u in no_predecessor.items())
+    return resultado
+
+
+def dijkstra_many_to_many(
+    grafo: Graph | FrozenGraph,
+    pares: Iterable[Tuple[str, str]],
+    weight: str | None = None,
+) -> List[ShortestPathResult]:
+    # Vários pares (origem, destino) com uma busca por origem distinta, que
+    # para quando todos os destinos dessa origem saem da fila. Os resultados
+    # voltam na ordem dos pares e são iguais aos de dijkstra_shortest_path.
+    pares = list(pares)
+    for origem, destino in pares:
+        if not grafo.tem_no(origem):
+            raise ValueError(f"Origem: '{origem}' não está no grafo.")
+        if not grafo.tem_no(destino):
+            raise ValueError(f"Destino: '{destino}' não está no grafo.")
+
+    vizinhos, chave, nome = _nucleo(grafo, weight)
+    if grafo.possui_peso_negativo(weight):
+        raise ValueError("Peso negativo encontrado.")
 
-    n = G.ordem()
-    max_iterations = 2 * n
-    iteration = 0
+    por_origem: Dict[str, List[int]] = {}
+    for k, (origem, _destino) in enumerate(pares):
+        por_origem.setdefault(origem, []).append(k)
+
+    resultados: List[Optional[ShortestPathResult]] = [None] * len(pares)
+    for origem, posicoes in por_origem.items():
+        # pares que o índice de alcance já descarta não entram na busca
+        alcancaveis = []
+        for k in posicoes:
+            if _sem_caminho(grafo, origem, pares[k][1]):
+                resultados[k] = ShortestPathResult(origem, pares[k][1], float('inf'), [], settled=0)
+            else:
+                alcancaveis.append(k)
+        if not alcancaveis:
+            continue
+        posicoes = alcancaveis
+        fonte = chave(origem)
+        alvos = {chave(pares[k][1]) for k in posicoes}
+        custo_minimo, no_predecessor, fechados = _dijkstra_busca(vizinhos, fonte, alvos)
+        for k in posicoes:
+            destino = pares[k][1]
+            resultados[k] = _resultado_dijkstra(
+                origem, destino, fonte, chave(destino), custo_minimo, no_predecessor, fechados, nome
+            )
+    return resultados
+
+
+def dijkstra_path(
+    grafo: Graph | FrozenGraph,
+    origem: str,
+    destino: str,
+    weight: str | None = None,
+    bidirecional: bool = False,
+) -> List[str]:
+    return dijkstra_shortest_path(grafo, origem, destino, weight, bidirecional=bidirecional).path
 
-    target_reached = False
-    target_stable_count = 0
 
-    while queue and iteration < max_iterations:
-        iteration += 1
+def dijkstra_path_length(
+    grafo: Graph | FrozenGraph,
+    origem: str,
+    destino: str,
+    weight: str | None = None,
+    bidirecional: bool = False,
+) -> float:
+    return dijkstra_shortest_path(grafo, origem, destino, weight, bidirecional=bidirecional).cost
+
+def _bellman_ford_desmontagem(custos, fontes, todos: bool = False):
+    # Bellman–Ford com fila e desmontagem de subárvores (Tarjan). A árvore
+    # de caminhos mínimos é mantida explícita (pai/filhos). Ao melhorar v
+    # por u, a subárvore de v sai da árvore (seus nós ficam inativos até
+    # melhorarem de novo); se u estiver nela, o arco u -> v fecha um ciclo
+    # negativo, detectado assim que se forma. Cada nó removido entrou na
+    # árvore antes, então a verificação tem custo amortizado.
+    # custos(u) devolve (v, peso). Retorna (dist, pai, ciclos), cada ciclo
+    # como (nós fechados [v, ..., v], custo). todos=False para no primeiro
+    # ciclo; todos=True descarta os nós de cada ciclo e continua, o que dá
+    # ciclos disjuntos (dist/pai só valem se não houver ciclo).
+    dist: Dict[Any, float] = {}
+    pai: Dict[Any, Any] = {}
+    peso_pai: Dict[Any, float] = {}
+    filhos: Dict[Any, Set[Any]] = {}
+    ativo: Set[Any] = set()
+    morto: Set[Any] = set()
+    ciclos: List[Tuple[List[Any], float]] = []
+
+    for s in fontes:
+        dist[s] = 0.0
+        pai[s] = None
+        filhos[s] = set()
+        ativo.add(s)
+    queue = deque(dist)
+    in_queue: Set[Any] = set(dist)
+
+    while queue:
         u = queue.popleft()
         in_queue.discard(u)
+        if u not in ativo or u in morto:
+            continue
+
+        d_u = dist[u]
+        for v, w in custos(u):
+            if v in morto:
+                continue
+            nova = d_u + w
+            if nova >= dist.get(v, float('inf')):
+                continue
 
-        u_dist = dist[u]
+            # subárvore de v (vazia se v está fora da árvore)
+            subarvore: List[Any] = []
+            if v in ativo:
+                pilha = [v]
+                while pilha:
+                    x = pilha.pop()
+                    subarvore.append(x)
+                    pilha.extend(filhos[x])
+
+            if u in subarvore:
+                ciclo = [u]
+                custo = w
+                while ciclo[-1] != v:
+                    x = ciclo[-1]
+                    custo += peso_pai[x]
+                    ciclo.append(pai[x])
+                ciclo.reverse()
+                ciclo.append(v)
+                ciclos.append((ciclo, custo))
+                if not todos:
+                    return dist, pai, ciclos
+                morto.update(ciclo)
+
+            for x in subarvore:
+                ativo.discard(x)
+                filhos[x] = set()
+            if v in morto:
+                # u também está no ciclo: não segue relaxando a partir dele
+                break
+            if pai.get(v) is not None and v in filhos.get(pai[v], ()):
+                filhos[pai[v]].discard(v)
+
+            dist[v] = nova
+            pai[v] = u
+            peso_pai[v] = w
+            filhos[u].add(v)
+            filhos.setdefault(v, set())
+            ativo.add(v)
+            if v not in in_queue:
+                queue.append(v)
+                in_queue.add(v)
+
+    return dist, pai, ciclos
+
+
+def _custos_bellman_ford(G, weight):
+    # (custos, chave, nome): custos(u) devolve (v, peso) já com a função de
+    # peso aplicada (pesos None pulam o arco)
+    if isinstance(weight, str) and G.tem_coluna(weight):
+        # coluna do grafo: o peso vem direto do vetor, sem montar dict por aresta
+        vizinhos, chave, nome = _nucleo(G, weight)
+        return vizinhos, chave, nome
+
+    vizinhos, chave, nome = _nucleo(G)
+    weight_fn = _weight_function(weight)
+    if callable(weight) and nome is not _identidade:
+        # funções de peso do usuário continuam recebendo nomes
+        weight_fn = lambda u, v, data: weight(nome(u), nome(v), data)
 
-        improved = False
-        for v, w in G.vizinhos(u):
+    def custos(u):
+        for v, w in vizinhos(u):
             cost = weight_fn(u, v, _edge_as_data(w))
-            if cost is None:
-                continue
+            if cost is not None:
+                yield v, cost
 
-            nova_dist = u_dist + cost
+    return custos, chave, nome
 
-            if v not in dist or nova_dist < dist[v]:
-                dist[v] = nova_dist
-                pred[v] = u
-                improved = True
 
-                if v == target:
-                    target_reached = True
-                    target_stable_count = 0
+def bellman_ford(
+    G: Graph | FrozenGraph,
+    source: str,
+    target: str,
+    weight: str | Callable = "weight",
+):
+    if not G.tem_no(source):
+        raise NodeNotFound(source)
 
-                if v not in in_queue:
-                    queue.append(v)
-                    in_queue.add(v)
+    custos, chave, nome = _custos_bellman_ford(G, weight)
 
-                    count[v] = count.get(v, 0) + 1
-                    if count[v] > n:
-                        path = []
-                        current = target if target in dist else v
-                        visited = set()
+    # Fila com desmontagem de subárvores: o ciclo negativo é detectado
+    # quando se forma, e sem ciclo a árvore final dá dist/pred. target não
+    # encurta a busca: as distâncias só são finais com a fila vazia
+    dist, pred, ciclos = _bellman_ford_desmontagem(custos, [chave(source)])
+    if ciclos:
+        ciclo, custo = ciclos[0]
+        raise NegativeCycle(
+            "Ciclo negativo detectado",
+            path=[nome(x) for x in ciclo],
+            cost=custo,
+        )
 
-                        while current is not None and current not in visited:
-                            visited.add(current)
-                            path.append(current)
-                            current = pred.get(current)
+    if nome is not _identidade:
+        dist = {nome(v): d for v, d in dist.items()}
+        pred = {nome(v): (None if u is None else nome(u)) for v, u in pred.items()}
 
-                        path.reverse()
+    return dist, pred
 
-                        raise NegativeCycle(
-                            f"Ciclo negativo detectado (nó '{v}' relaxado {count[v]} vezes)",
-                            path=path if target in dist else [],
-                            cost=dist.get(target),
-                        )
 
-        if target_reached and not improved:
-            target_stable_count += 1
-            if target_stable_count > n // 2:
-                break
+def find_negative_cycle(
+    G: Graph | FrozenGraph,
+    source: str | None = None,
+    weight: str | Callable = "weight",
+) -> Optional[Tuple[List[str], float]]:
+    # (ciclo fechado [v, ..., v], custo) ou None. Com source só procura
+    # ciclos alcançáveis a partir dele; sem source, no grafo inteiro
+    # (origem virtual ligada a todos os nós).
+    ciclos = _ciclos_negativos(G, source, weight, todos=False)
+    return ciclos[0] if ciclos else None
 
-    if iteration >= max_iterations:
-        path = []
-        if target in dist:
-            current = target
-            visited = set()
-            while current is not None and current not in visited:
-                visited.add(current)
-                path.append(current)
-                current = pred.get(current)
-            path.reverse()
 
-        raise NegativeCycle(
-            f"Limite de iterações atingido ({max_iterations}) - possível ciclo negativo",
-            path=path,
-            cost=dist.get(target),
-        )
+def find_negative_cycles(
+    G: Graph | FrozenGraph,
+    source: str | None = None,
+    weight: str | Callable = "weight",
+) -> List[Tuple[List[str], float]]:
+    # Ciclos negativos disjuntos (em nós) encontrados numa única passada
+    return _ciclos_negativos(G, source, weight, todos=True)
 
-    return dist, pred
 
-def bellman_ford_path(
-    G: Graph,
+def _ciclos_negativos(G, source, weight, todos: bool) -> List[Tuple[List[str], float]]:
+    if source is not None and not G.tem_no(source):
+        raise NodeNotFound(source)
+    custos, chave, nome = _custos_bellman_ford(G, weight)
+    fontes = [chave(no) for no in G.iter_nos()] if source is None else [chave(source)]
+    ciclos = _bellman_ford_desmontagem(custos, fontes, todos)[2]
+    return [([nome(x) for x in ciclo], custo) for ciclo, custo in ciclos]
+
+
+def bellman_ford_shortest_path(
+    G: Graph | FrozenGraph,
     source: str,
     target: str,
     weight: str | Callable = "weight",
-) -> List[str]:
-    if source not in G.nos():
+    arvore: bool = False,
+    vetorizado: bool = False,
+) -> ShortestPathResult:
+    # Uma execução do SPFA serve custo e caminho; NoPath se não alcança.
+    # vetorizado=True usa o Bellman–Ford por rodadas sobre vetores numpy
+    # (graphs.vetorizado): mesmas distâncias, só aceita colunas de peso.
+    if not G.tem_no(source):
         raise NodeNotFound(source)
-    if target not in G.nos():
+    if not G.tem_no(target):
         raise NodeNotFound(target)
+    if not arvore and _sem_caminho(G, source, target):
+        raise NoPath(f"Não há caminho de {source} para {target}", source, target)
 
-    dist, pred = bellman_ford(G, source, target, weight)
+    if vetorizado:
+        from .vetorizado import bellman_ford_vetorizado
+        dist, pred = bellman_ford_vetorizado(G, source, target, weight)
+    else:
+        dist, pred = bellman_ford(G, source, target, weight)
 
     if target not in dist:
-        raise NoPath(f"Não há caminho de {source} para {target}")
+        raise NoPath(f"Não há caminho de {source} para {target}", source, target)
 
     path = []
     current = target
@@ -246,197 +531,540 @@ def bellman_ford_path(
         current = pred.get(current)
 
     path.reverse()
-    return path
 
+    if arvore:
+        return ShortestPathResult(source, target, dist[target], path, dist, pred)
+    return ShortestPathResult(source, target, dist[target], path)
 
-def bellman_ford_path_length(
-    G: Graph,
+
+def bellman_ford_path(
+    G: Graph | FrozenGraph,
     source: str,
     target: str,
     weight: str | Callable = "weight",
-) -> float:
-    if source not in G.nos():
-        raise NodeNotFound(source)
-    if target not in G.nos():
-        raise NodeNotFound(target)
+    vetorizado: bool = False,
+) -> List[str]:
+    return bellman_ford_shortest_path(G, source, target, weight, vetorizado=vetorizado).path
 
-    dist, pred = bellman_ford(G, source, target, weight)
 
-    if target not in dist:
-        raise NoPath(f"Não há caminho de {source} para {target}")
+def bellman_ford_path_length(
+    G: Graph | FrozenGraph,
+    source: str,
+    target: str,
+    weight: str | Callable = "weight",
+    vetorizado: bool = False,
+) -> float:
+    return bellman_ford_shortest_path(G, source, target, weight, vetorizado=vetorizado).cost
 
-    return dist[target]
 
+def _potenciais_johnson(vizinhos, nos, nome) -> Dict[Any, float]:
+    # Potenciais = distâncias a partir de uma origem virtual ligada a todos
+    # os nós com peso 0 (todos começam em 0), pela mesma busca com
+    # desmontagem de subárvores de find_negative_cycle; ciclo negativo vira
+    # NegativeCycle com o ciclo exato que ela devolve
+    h, _pai, ciclos = _bellman_ford_desmontagem(vizinhos, nos, todos=True)
+    if ciclos:
+        ciclo, custo = ciclos[0]
+        raise NegativeCycle(
+            "Ciclo negativo detectado",
+            path=[nome(x) for x in ciclo],
+            cost=custo,
+        )
+    return h
+
+
+def _reponderacao_johnson(G, weight: str | None):
+    # (vizinhos reponderados, potencial, vizinhos, chave, nome); sem peso
+    # negativo os potenciais são todos 0 e o SPFA é pulado
+    vizinhos, chave, nome = _nucleo(G, weight)
+    h: Dict[Any, float] = {}
+    if G.possui_peso_negativo(weight):
+        h = _potenciais_johnson(vizinhos, [chave(no) for no in G.iter_nos()], nome)
+    h_de = h.get
+
+    def reponderados(u):
+        h_u = h_de(u, 0.0)
+        # arredondamento pode deixar -1e-16: zera para o Dijkstra
+        return ((v, max(w + h_u - h_de(v, 0.0), 0.0)) for v, w in vizinhos(u))
+
+    return reponderados, (lambda v: h_de(v, 0.0)), vizinhos, chave, nome
+
+
+def johnson_many_to_many(
+    G: Graph | FrozenGraph,
+    pares: Iterable[Tuple[str, str]],
+    weight: str | None = None,
+) -> List[ShortestPathResult]:
+    # Johnson: um SPFA da origem virtual dá potenciais h com
+    # w(u, v) + h[u] - h[v] >= 0; depois um Dijkstra por origem distinta
+    # sobre os pesos reponderados (como dijkstra_many_to_many). O custo é a
+    # soma dos pesos originais na ordem do caminho, como em bellman_ford.
+    # Sem caminho: custo infinito e caminho vazio. Ciclo negativo em
+    # qualquer parte do grafo levanta NegativeCycle.
+    pares = list(pares)
+    for origem, destino in pares:
+        if not G.tem_no(origem):
+            raise NodeNotFound(origem)
+        if not G.tem_no(destino):
+            raise NodeNotFound(destino)
+
+    reponderados, _h, vizinhos, chave, nome = _reponderacao_johnson(G, weight)
+
+    por_origem: Dict[str, List[int]] = {}
+    for k, (origem, _destino) in enumerate(pares):
+        por_origem.setdefault(origem, []).append(k)
+
+    resultados: List[Optional[ShortestPathResult]] = [None] * len(pares)
+    for origem, posicoes in por_origem.items():
+        alcancaveis = []
+        for k in posicoes:
+            if _sem_caminho(G, origem, pares[k][1]):
+                resultados[k] = ShortestPathResult(origem, pares[k][1], float('inf'), [], settled=0)
+            else:
+                alcancaveis.append(k)
+        if not alcancaveis:
+            continue
+        posicoes = alcancaveis
+        fonte = chave(origem)
+        alvos = {chave(pares[k][1]) for k in posicoes}
+        _custo, no_predecessor, fechados = _dijkstra_busca(reponderados, fonte, alvos)
+        for k in posicoes:
+            destino = pares[k][1]
+            alvo = chave(destino)
+            if alvo != fonte and alvo not in no_predecessor:
+                resultados[k] = ShortestPathResult(origem, destino, float('inf'), [], settled=fechados)
+                continue
+            caminho = [alvo]
+            while caminho[-1] != fonte:
+                caminho.append(no_predecessor[caminho[-1]])
+            caminho.reverse()
+            custo = 0.0
+            for u, v in zip(caminho, caminho[1:]):
+                custo += min(w for x, w in vizinhos(u) if x == v)
+            resultados[k] = ShortestPathResult(origem, destino, custo, [nome(v) for v in caminho], settled=fechados)
+    return resultados
+
+
+def johnson(
+    G: Graph | FrozenGraph,
+    origens: Iterable[str] | None = None,
+    weight: str | None = None,
+) -> Dict[str, Dict[str, float]]:
+    # Distâncias de cada origem (todas por padrão) para os nós alcançáveis
+    origens = G.nos() if origens is None else list(origens)
+    for origem in origens:
+        if not G.tem_no(origem):
+            raise NodeNotFound(origem)
+
+    reponderados, h, _vizinhos, chave, nome = _reponderacao_johnson(G, weight)
+
+    distancias: Dict[str, Dict[str, float]] = {}
+    for origem in origens:
+        fonte = chave(origem)
+        h_f = h(fonte)
+        custo_minimo = _dijkstra_busca(reponderados, fonte, ())[0]
+        distancias[origem] = {nome(v): d - h_f + h(v) for v, d in custo_minimo.items()}
+    return distancias
+
+
+def ancestors(G: Graph | FrozenGraph, node: str) -> Set[str]:
+    # Nós que alcançam node (busca para trás pelo índice reverso)
+    if not G.tem_no(node):
+        raise NodeNotFound(node)
+
+    if G.usa_ids:
+        anteriores, chave, nome = G.predecessores_ids, G.indice.__getitem__, G.nomes.__getitem__
+    else:
+        anteriores, chave, nome = G.predecessores_view, _identidade, _identidade
+
+    inicio = chave(node)
+    vistos = {inicio}
+    fila = deque([inicio])
+    while fila:
+        v = fila.popleft()
+        for u, _w in anteriores(v):
+            if u not in vistos:
+                vistos.add(u)
+                fila.append(u)
 
+    vistos.discard(inicio)
+    return {nome(u) for u in vistos}
 
 
-def bfs_ordem_camadas_ciclos_dir(
-    G: Graph,
-    source: str,
-    max_cycles: int = 10,
-):
-    if source not in G.nos():
-        raise NodeNotFound(source)
+def _componentes_fortes(nos: Iterable[Any], vizinhos) -> List[List[Any]]:
+    # Tarjan iterativo: componentes fortemente conexas em O(V + E), na ordem
+    # em que fecham (ordem topológica reversa da condensação).
+    # vizinhos(u) devolve só os nós sucessores.
+    indice: Dict[Any, int] = {}
+    baixo: Dict[Any, int] = {}
+    na_pilha: Set[Any] = set()
+    pilha: List[Any] = []
+    componentes: List[List[Any]] = []
+    contador = 0
 
-    visited: Set[str] = {source}
-    parent: Dict[str, Optional[str]] = {source: None}
-    dist: Dict[str, int] = {source: 0}
-    ordem: List[str] = []
-    cycles: List[List[str]] = []
-    seen_cycles: Set[Tuple[str, ...]] = set()
+    for raiz in nos:
+        if raiz in indice:
+            continue
+        indice[raiz] = baixo[raiz] = contador
+        contador += 1
+        pilha.append(raiz)
+        na_pilha.add(raiz)
+        chamadas = [(raiz, iter(vizinhos(raiz)))]
+
+        while chamadas:
+            u, it = chamadas[-1]
+            avancou = False
+            for v in it:
+                if v not in indice:
+                    indice[v] = baixo[v] = contador
+                    contador += 1
+                    pilha.append(v)
+                    na_pilha.add(v)
+                    chamadas.append((v, iter(vizinhos(v))))
+                    avancou = True
+                    break
+                if v in na_pilha and indice[v] < baixo[u]:
+                    baixo[u] = indice[v]
+            if avancou:
+                continue
 
+            chamadas.pop()
+            if chamadas:
+                pai = chamadas[-1][0]
+                if baixo[u] < baixo[pai]:
+                    baixo[pai] = baixo[u]
+            if baixo[u] == indice[u]:
+                componente = []
+                while True:
+                    x = pilha.pop()
+                    na_pilha.discard(x)
+                    componente.append(x)
+                    if x == u:
+                        break
+                componentes.append(componente)
+    return componentes
+
+
+_FIM = object()
+
+
+def _registrar_ciclo(caminho, direcionado: bool, vistos: Set[Tuple[Any, ...]], ciclos: List[List[Any]]) -> None:
+    # chave pela rotação canônica (menor nó primeiro; sem direção, o sentido
+    # também conta); o ciclo sai como foi achado, começando no nó da busca
+    k = caminho.index(min(caminho))
+    ciclo = caminho[k:] + caminho[:k]
+    chave = tuple(ciclo)
+    if not direcionado:
+        inverso = tuple([ciclo[0]] + ciclo[:0:-1])
+        chave = min(chave, inverso)
+    if chave not in vistos:
+        vistos.add(chave)
+        ciclos.append(list(caminho))
+
+
+def _caminho_de_volta(sucessores, permitidos, fonte, inicio, proibidos_nos, proibidos_arcos):
+    # menor caminho (em arcos, BFS) de inicio de volta até fonte sem passar
+    # por proibidos_nos nem usar proibidos_arcos; [inicio, ..., fonte] ou None
+    anterior = {inicio: None}
+    fila = deque([inicio])
+    while fila:
+        u = fila.popleft()
+        for v in sucessores[u]:
+            if (u, v) in proibidos_arcos:
+                continue
+            if v == fonte:
+                caminho = [fonte, u]
+                while anterior[caminho[-1]] is not None:
+                    caminho.append(anterior[caminho[-1]])
+                caminho.reverse()
+                return caminho
+            if v in permitidos and v not in anterior and v not in proibidos_nos:
+                anterior[v] = u
+                fila.append(v)
+    return None
+
+
+def _ciclos_por(sucessores, permitidos, fonte) -> Iterator[List[Any]]:
+    # Ciclos simples por fonte (demais nós em permitidos) em tamanho não
+    # decrescente: os k menores caminhos simples de Yen de fonte até ela
+    # mesma. Cada ciclo custa O(tamanho * (V + E)), então parar cedo sai
+    # barato mesmo quando a fonte está em poucos ciclos.
+    primeiro = _caminho_de_volta(sucessores, permitidos, fonte, fonte, (), ())
+    if primeiro is None:
+        return
+    achados = [primeiro]
+    candidatos: List[Tuple[int, int, List[Any]]] = []
+    vistos = {tuple(primeiro)}
+    contador = 0
+    while True:
+        yield achados[-1][:-1]
+        ultimo = achados[-1]
+        for i in range(len(ultimo) - 1):
+            raiz = ultimo[:i + 1]
+            proibidos_arcos = {(c[i], c[i + 1]) for c in achados if c[:i + 1] == raiz}
+            desvio = _caminho_de_volta(
+                sucessores, permitidos, fonte, ultimo[i], set(raiz[1:i]), proibidos_arcos
+            )
+            if desvio is None:
+                continue
+            caminho = raiz[:-1] + desvio
+            chave = tuple(caminho)
+            if chave not in vistos:
+                vistos.add(chave)
+                contador += 1
+                heappush(candidatos, (len(caminho), contador, caminho))
+        if not candidatos:
+            return
+        achados.append(heappop(candidatos)[2])
+
+
+def _ciclos_simples(
+    nos: Iterable[Any],
+    vizinhos,
+    max_cycles: int,
+    direcionado: bool = True,
+    min_tamanho: int = 3,
+) -> List[List[Any]]:
+    # Até max_cycles ciclos simples (min_tamanho+ nós), na ordem de nos:
+    # primeiro os que passam por nos[0] (a fonte, no percurso), do mais curto
+    # para o mais longo; depois os que passam por nos[1] sem usar nos[0], e
+    # assim por diante. Cada ciclo sai uma vez, começando no primeiro dos
+    # seus nós em nos; em grafo não direcionado o sentido inverso conta como
+    # o mesmo ciclo. vizinhos(u) devolve só os nós sucessores; arcos para
+    # fora de nos são ignorados.
+    ciclos: List[List[Any]] = []
+    if max_cycles <= 0:
+        return ciclos
+    vistos: Set[Tuple[Any, ...]] = set()
+
+    nos = list(nos)
+    posicao = {u: i for i, u in enumerate(nos)}
+    sucessores = {u: [v for v in vizinhos(u) if v in posicao] for u in nos}
+    membros_de: Dict[Any, List[Any]] = {}
+    for membros in _componentes_fortes(nos, sucessores.__getitem__):
+        if len(membros) >= min_tamanho:
+            for u in membros:
+                membros_de[u] = membros
+
+    for s in nos:
+        membros = membros_de.get(s)
+        if membros is None:
+            continue
+        # só nós da mesma componente que vêm depois de s em nos
+        p = posicao[s]
+        permitidos = {u for u in membros if posicao[u] > p}
+        for ciclo in _ciclos_por(sucessores, permitidos, s):
+            if len(ciclo) >= min_tamanho:
+                _registrar_ciclo(ciclo, direcionado, vistos, ciclos)
+                if len(ciclos) >= max_cycles:
+                    return ciclos
+    return ciclos
+
+
+class Evento(NamedTuple):
+    # um passo de bfs_eventos/dfs_eventos
+    tipo: str  # "descoberta", "arco_arvore", "arco_fora", "fim" ou "camada"
+    no: Any  # nó descoberto/finalizado ou ponta de chegada do arco
+    origem: Any = None  # pai do nó descoberto ou ponta de saída do arco
+    profundidade: int = 0  # do nó (nos arcos, da origem)
+    camada: Optional[List[Any]] = None  # nós da camada (só em "camada")
+
+
+def _eventos_bfs(sucessores, source) -> Iterator[Tuple]:
+    # tuplas na ordem dos campos de Evento. "camada" d sai quando o primeiro nó da profundidade d deixa a fila:
+    # nesse ponto todos os nós dela já foram descobertos
+    dist: Dict[Any, int] = {source: 0}
+    yield ("descoberta", source, None, 0, None)
+    camada: List[Any] = [source]
+    atual = -1
     fila = deque([source])
-
-    def path_to_root(node: str) -> List[str]:
-        path: List[str] = []
-        while node is not None:
-            path.append(node)
-            node = parent.get(node)
-        return path
-
     while fila:
         v = fila.popleft()
-        ordem.append(v)
-
-        # Grafo direcionado: segue arestas v -> u
-        for u, _w in G.vizinhos(v):
-            if u not in visited:
-                # Aresta de árvore
-                visited.add(u)
-                parent[u] = v
-                dist[u] = dist[v] + 1
+        d = dist[v]
+        if d > atual:
+            atual = d
+            yield ("camada", None, None, d, camada)
+            camada = []
+        for u in sucessores(v):
+            if u in dist:
+                yield ("arco_fora", u, v, d, None)
+            else:
+                dist[u] = d + 1
+                camada.append(u)
                 fila.append(u)
+                yield ("arco_arvore", u, v, d, None)
+                yield ("descoberta", u, v, d + 1, None)
+        yield ("fim", v, None, d, None)
+
+
+def _eventos_dfs(sucessores, source) -> Iterator[Tuple]:
+    # pré-ordem iterativa; profundidade = nível na árvore da DFS, então as
+    # camadas só ficam completas (e saem) no fim do percurso
+    depth: Dict[Any, int] = {source: 0}
+    yield ("descoberta", source, None, 0, None)
+    camadas: List[List[Any]] = [[source]]
+    stack = [(source, iter(sucessores(source)))]
+    while stack:
+        v, neighbors_iter = stack[-1]
+        d = depth[v]
+        for u in neighbors_iter:
+            if u in depth:
+                yield ("arco_fora", u, v, d, None)
+                continue
+            depth[u] = d + 1
+            if d + 1 == len(camadas):
+                camadas.append([])
+            camadas[d + 1].append(u)
+            stack.append((u, iter(sucessores(u))))
+            yield ("arco_arvore", u, v, d, None)
+            yield ("descoberta", u, v, d + 1, None)
+            break
+        else:
+            stack.pop()
+            yield ("fim", v, None, d, None)
+    for d, camada in enumerate(camadas):
+        yield ("camada", None, None, d, camada)
 
-            # Aresta não-árvore: pode indicar ciclo direcionado
-            elif parent[v] != u:
-                if len(cycles) >= max_cycles:
-                    # Atingiu limite de ciclos
-                    continue
-
-                pv = path_to_root(v)
-                pu = path_to_root(u)
-                set_pu = set(pu)
-
-                # Encontra o menor ancestral comum
-                lca = next((x for x in pv if x in set_pu), None)
-                if lca is None:
-                    continue
 
-                iv = pv.index(lca)
-                iu = pu.index(lca)
+def _percurso(G, source, eventos) -> Tuple[Iterator[Tuple], Callable]:
+    # eventos sobre ids; as versões públicas nomeiam cada evento
+    if not G.tem_no(source):
+        raise NodeNotFound(source)
+    vizinhos, chave, nome = _nucleo(G)
+    return eventos(lambda u: [v for v, _w in vizinhos(u)], chave(source)), nome
+
+
+def _nomear_eventos(eventos: Iterator[Tuple], nome) -> Iterator[Evento]:
+    # os geradores internos soltam tuplas cruas (mais baratas); aqui viram
+    # Evento, com ids convertidos de volta para nomes
+    if nome is _identidade:
+        yield from map(Evento._make, eventos)
+        return
+    for tipo, no, origem, profundidade, camada in eventos:
+        yield Evento(
+            tipo,
+            None if no is None else nome(no),
+            None if origem is None else nome(origem),
+            profundidade,
+            None if camada is None else [nome(v) for v in camada],
+        )
 
-                path_v = pv[: iv + 1]  # de v até LCA
-                path_u = pu[:iu]       # de u até antes do LCA
-                cycle = path_v + path_u[::-1]
 
-                # Ciclos de pelo menos 3 nós
-                if len(cycle) < 3:
-                    continue
+def bfs_eventos(G: Graph | FrozenGraph, source: str) -> Iterator[Evento]:
+    # BFS preguiçosa: quem consome pode parar a qualquer momento (break)
+    # sem pagar pelo resto do percurso
+    eventos, nome = _percurso(G, source, _eventos_bfs)
+    return _nomear_eventos(eventos, nome)
 
-                key = tuple(cycle)
-                key_rev = tuple(reversed(cycle))
-                if key not in seen_cycles and key_rev not in seen_cycles:
-                    seen_cycles.add(key)
-                    cycles.append(cycle)
 
-    # Monta camadas a partir das distâncias
-    layers_dict: Dict[int, List[str]] = {}
-    for node, d in dist.items():
-        layers_dict.setdefault(d, []).append(node)
+def dfs_eventos(G: Graph | FrozenGraph, source: str) -> Iterator[Evento]:
+    # DFS preguiçosa (pré-ordem iterativa), mesmos eventos da BFS
+    eventos, nome = _percurso(G, source, _eventos_dfs)
+    return _nomear_eventos(eventos, nome)
 
-    camadas: List[List[str]] = [layers_dict[d] for d in sorted(layers_dict)]
 
-    return ordem, camadas, cycles
+def alcanca(G: Graph | FrozenGraph, source: str, target: str) -> bool:
+    # BFS que para assim que target é descoberto (O(1) com índice de alcance)
+    if not G.tem_no(source):
+        raise NodeNotFound(source)
+    if not G.tem_no(target):
+        raise NodeNotFound(target)
+    alcance = getattr(G, "alcance", None)
+    if alcance is not None:
+        return alcance.alcanca(source, target)
+    eventos, _nome = _percurso(G, source, _eventos_bfs)
+    alvo = G.indice[target] if G.usa_ids else target
+    for tipo, no, _origem, _d, _camada in eventos:
+        if no == alvo and tipo == "descoberta":
+            return True
+    return False
+
+
+def bfs_primeiras_camadas(G: Graph | FrozenGraph, source: str, k: int) -> List[List[str]]:
+    # só as camadas 0..k-1; a BFS para antes de expandir a camada k
+    camadas: List[List[str]] = []
+    if k <= 0:
+        return camadas
+    for ev in bfs_eventos(G, source):
+        if ev.tipo == "camada":
+            camadas.append(ev.camada)
+            if len(camadas) == k:
+                break
+    return camadas
+
+
+def _percurso_e_ciclos(G, source, max_cycles, eventos):
+    # ordem de descoberta e camadas vêm dos eventos; os ciclos vêm da
+    # parte alcançada, buscados na ordem do percurso: primeiro os que passam
+    # pela fonte, dos mais curtos para os mais longos
+    percurso, nome = _percurso(G, source, eventos)
+    ordem: List[Any] = []
+    camadas: List[List[Any]] = []
+    for tipo, no, _origem, _d, camada in percurso:
+        if tipo == "descoberta":
+            ordem.append(no)
+        elif tipo == "camada":
+            camadas.append(camada)
+
+    vizinhos = _nucleo(G)[0]
+    cycles = _ciclos_simples(
+        ordem,
+        lambda u: [v for v, _w in vizinhos(u)],
+        max_cycles,
+        direcionado=G.direcionado,
+    )
+    return _nomear_percurso(nome, ordem, camadas, cycles)
+
+
+def strongly_connected_components(G: Graph | FrozenGraph) -> List[List[str]]:
+    # Componentes fortemente conexas (Tarjan iterativo, O(V + E))
+    vizinhos, chave, nome = _nucleo(G)
+    componentes = _componentes_fortes(
+        (chave(no) for no in G.iter_nos()),
+        lambda u: [v for v, _w in vizinhos(u)],
+    )
+    return [[nome(v) for v in c] for c in componentes]
+
+
+def simple_cycles(G: Graph | FrozenGraph, max_cycles: int = 10) -> List[List[str]]:
+    # Até max_cycles ciclos simples (3+ nós) do grafo inteiro, sem repetição,
+    # na ordem dos nós e dos mais curtos para os mais longos em cada um
+    vizinhos, chave, nome = _nucleo(G)
+    ciclos = _ciclos_simples(
+        [chave(no) for no in G.iter_nos()],
+        lambda u: [v for v, _w in vizinhos(u)],
+        max_cycles,
+        direcionado=G.direcionado,
+    )
+    return [[nome(v) for v in c] for c in ciclos]
 
 
-def dfs_ordem_camadas_ciclos_dir(
-    G: Graph,
+def bfs_ordem_camadas_ciclos_dir(
+    G: Graph | FrozenGraph,
     source: str,
     max_cycles: int = 10,
 ):
-    if source not in G.nos():
-        raise NodeNotFound(source)
-
-    visited: Set[str] = set()
-    parent: Dict[str, Optional[str]] = {source: None}
-    depth: Dict[str, int] = {source: 0}
-    ordem: List[str] = []
-    cycles: List[List[str]] = []
-    seen_cycles: Set[Tuple[str, ...]] = set()
-
-    def path_to_root(node: str) -> List[str]:
-        path: List[str] = []
-        while node is not None:
-            path.append(node)
-            node = parent.get(node)
-        return path
+    # ordem de visita, camadas por distância em arcos e até max_cycles
+    # ciclos reais (3+ nós) entre os nós alcançados
+    return _percurso_e_ciclos(G, source, max_cycles, _eventos_bfs)
 
-    # Pilha: (nó atual, iterador de vizinhos)
-    stack: List[Tuple[str, Any]] = []
 
-    visited.add(source)
-    ordem.append(source)
-    stack.append((source, iter(G.vizinhos(source))))
-
-    while stack:
-        v, neighbors_iter = stack[-1]
-        try:
-            u, _w = next(neighbors_iter)
-        except StopIteration:
-            # Terminou vizinhos de v, desempilha
-            stack.pop()
-            continue
-
-        if u not in visited:
-            # Aresta de árvore (v -> u)
-            visited.add(u)
-            parent[u] = v
-            depth[u] = depth[v] + 1
-            ordem.append(u)
-            stack.append((u, iter(G.vizinhos(u))))
-        elif parent[v] != u:
-            # Aresta não-árvore: possível ciclo
-            if len(cycles) >= max_cycles:
-                return _montar_camadas_dfs(ordem, depth, cycles)
-
-            pv = path_to_root(v)
-            pu = path_to_root(u)
-            set_pu = set(pu)
-
-            # Encontra o menor ancestral comum
-            lca = next((x for x in pv if x in set_pu), None)
-            if lca is None:
-                continue
-
-            iv = pv.index(lca)
-            iu = pu.index(lca)
-
-            path_v = pv[: iv + 1]
-            path_u = pu[:iu]  # Exclui lca
-            cycle = path_v + path_u[::-1]
-
-            if len(cycle) < 3:
-                continue
-
-            key = tuple(cycle)
-            key_rev = tuple(reversed(cycle))
-            if key not in seen_cycles and key_rev not in seen_cycles:
-                seen_cycles.add(key)
-                cycles.append(cycle)
-
-    camadas = _montar_camadas_dfs(ordem, depth, cycles)[1]
-    return ordem, camadas, cycles
-
-
-def _montar_camadas_dfs(
-    ordem: List[str],
-    depth: Dict[str, int],
-    cycles: List[List[str]],
+def dfs_ordem_camadas_ciclos_dir(
+    G: Graph | FrozenGraph,
+    source: str,
+    max_cycles: int = 10,
 ):
-    # Monta as camadas a partir da profundidade
-    layers_dict: Dict[int, List[str]] = {}
-    for node, d in depth.items():
-        layers_dict.setdefault(d, []).append(node)
-        
-    camadas: List[List[str]] = [layers_dict[d] for d in sorted(layers_dict)]
-    return ordem, camadas, cycles
+    # pré-ordem da DFS, camadas por profundidade na árvore e até max_cycles
+    # ciclos reais (3+ nós) entre os nós alcançados
+    return _percurso_e_ciclos(G, source, max_cycles, _eventos_dfs)
+
+
+def _nomear_percurso(nome, ordem, camadas, cycles):
+    # Converte ids internos de volta para nomes (no Graph comum não faz nada)
+    if nome is _identidade:
+        return ordem, camadas, cycles
+    return (
+        [nome(v) for v in ordem],
+        [[nome(v) for v in camada] for camada in camadas],
+        [[nome(v) for v in ciclo] for ciclo in cycles],
+    )
@@ -0,0 +1,142 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from .graph import Graph, FrozenGraph
+from .algorithms import _dijkstra_busca, _nucleo
+from .cache import mapear_grafo
+
+# Matriz de distâncias de todos para todos: um Dijkstra por origem,
+# espalhado em um pool de processos. Cada processo abre o grafo somente
+# leitura (mapeando o mesmo arquivo de cache quando o grafo veio de um) e
+# escreve suas linhas direto na matriz float32 de um .npy mapeado em
+# memória, então nada volta pelo pool além da contagem de linhas.
+#
+# Pares sem caminho ficam com infinito. float32 guarda ~7 dígitos
+# significativos: para 4.533 municípios a matriz tem ~82 MB.
+
+LINHAS_POR_TAREFA = 64
+
+# estado de cada processo do pool (preenchido por _iniciar_trabalhador)
+_ESTADO: Dict[str, Any] = {}
+
+
+def _fonte_do_grafo(grafo: FrozenGraph, weight: str | None):
+    # o que os processos recebem para reabrir o grafo: o caminho do cache
+    # (mapeado de novo, páginas compartilhadas) ou os vetores CSR da coluna
+    if grafo.arquivo is not None:
+        return str(grafo.arquivo)
+    pesos = grafo._pesos_da_coluna(weight)
+    return (
+        list(grafo.nomes),
+        array("q", grafo.offsets),
+        array("i", grafo.alvos),
+        array("d", pesos),
+        grafo.direcionado,
+    )
+
+
+def _iniciar_trabalhador(fonte, weight: str | None, saida: str, alvos) -> None:
+    if isinstance(fonte, str):
+        grafo = mapear_grafo(Path(fonte))
+    else:
+        nomes, offsets, alvos_csr, pesos, direcionado = fonte
+        grafo = FrozenGraph(nomes, offsets, alvos_csr, pesos, direcionado)
+        weight = None  # os vetores já são os da coluna pedida
+    _ESTADO["vizinhos"] = _nucleo(grafo, weight)[0]
+    _ESTADO["n"] = grafo.ordem()
+    _ESTADO["matriz"] = np.load(saida, mmap_mode="r+")
+    _ESTADO["alvos"] = None if alvos is None else np.asarray(alvos, dtype=np.int64)
+    _ESTADO["pendentes"] = () if alvos is None else frozenset(alvos)
+
+
+def _preencher(linhas: Tuple[int, List[int]]) -> int:
+    # calcula as linhas [inicio, inicio + len(fontes)) da matriz
+    inicio, fontes = linhas
+    vizinhos, matriz, alvos = _ESTADO["vizinhos"], _ESTADO["matriz"], _ESTADO["alvos"]
+    distancias = np.empty(_ESTADO["n"], dtype=np.float64)
+    for k, fonte in enumerate(fontes):
+        custo_minimo = _dijkstra_busca(vizinhos, fonte, _ESTADO["pendentes"])[0]
+        distancias.fill(np.inf)
+        distancias[np.fromiter(custo_minimo.keys(), np.int64, len(custo_minimo))] = np.fromiter(
+            custo_minimo.values(), np.float64, len(custo_minimo)
+        )
+        matriz[inicio + k] = distancias if alvos is None else distancias[alvos]
+    matriz.flush()
+    return len(fontes)
+
+
+def _ids(grafo: FrozenGraph, nos: Iterable[str] | None, papel: str) -> Tuple[List[str], List[int] | None]:
+    if nos is None:
+        return list(grafo.nomes), None
+    nos = list(nos)
+    for no in nos:
+        if not grafo.tem_no(no):
+            raise ValueError(f"{papel}: '{no}' não está no grafo.")
+    return nos, [grafo.indice[no] for no in nos]
+
+
+def matriz_distancias(
+    grafo: Graph | FrozenGraph,
+    destino,
+    origens: Iterable[str] | None = None,
+    alvos: Iterable[str] | None = None,
+    weight: str | None = None,
+    processos: int | None = None,
+    linhas_por_tarefa: int = LINHAS_POR_TAREFA,
+) -> Tuple[np.memmap, List[str], List[str]]:
+    """
+    Grava em destino (.npy) a matriz float32 com matriz[i, j] = custo do
+    caminho mínimo de origens[i] até alvos[j] (infinito se não há caminho)
+    e devolve (matriz mapeada somente leitura, origens, alvos).
+
+    origens/alvos None = todos os nós, na ordem dos ids do FrozenGraph.
+    Com alvos restritos cada busca para quando todos eles saem da fila.
+    processos None = um por núcleo; 1 roda tudo no processo atual.
+    """
+    if isinstance(grafo, Graph):
+        grafo = grafo.congelar()
+    if grafo.possui_peso_negativo(weight):
+        raise ValueError("Peso negativo encontrado.")
+    _nucleo(grafo, weight)  # valida a coluna antes de abrir o pool
+
+    nomes_origens, ids_origens = _ids(grafo, origens, "Origem")
+    nomes_alvos, ids_alvos = _ids(grafo, alvos, "Destino")
+    if ids_origens is None:
+        ids_origens = list(range(grafo.ordem()))
+
+    destino = Path(destino)
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    matriz = np.lib.format.open_memmap(
+        destino, mode="w+", dtype=np.float32, shape=(len(nomes_origens), len(nomes_alvos))
+    )
+    del matriz  # cada processo reabre o arquivo
+
+    tarefas = [
+        (i, ids_origens[i:i + linhas_por_tarefa])
+        for i in range(0, len(ids_origens), linhas_por_tarefa)
+    ]
+    args = (_fonte_do_grafo(grafo, weight), weight, str(destino), ids_alvos)
+
+    processos = processos or os.cpu_count() or 1
+    if processos > 1 and len(tarefas) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(processos, len(tarefas)),
+            initializer=_iniciar_trabalhador,
+            initargs=args,
+        ) as pool:
+            for _ in pool.map(_preencher, tarefas):
+                pass
+    else:
+        _iniciar_trabalhador(*args)
+        try:
+            for tarefa in tarefas:
+                _preencher(tarefa)
+        finally:
+            _ESTADO.clear()
+
+    return np.load(destino, mmap_mode="r"), nomes_origens, nomes_alvos
@@ -0,0 +1,270 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+from .graph import Graph, FrozenGraph
+
+# Cache binário do grafo compilado (CSR + tabela de nomes).
+#
+# Layout do arquivo:
+#   MAGIC | u32 versão | u64 tamanho do cabeçalho | cabeçalho JSON
+#   | padding até múltiplo de 8 | offsets (int64) | alvos (int32) | pesos (float64)
+#   | uma coluna float64 por peso extra, na ordem de "colunas" no cabeçalho
+#
+# O cabeçalho guarda a identificação do CSV de origem (tamanho, mtime, sha256)
+# e as opções de carga; se algo mudar o arquivo é recompilado.
+#
+# Tabelas derivadas do grafo (landmarks, hierarquias...) ficam ao lado do
+# cache, com o mesmo prefixo e o próprio MAGIC; o cabeçalho lista os vetores
+# ("vetores": [[nome, typecode, tamanho], ...]) e identifica o arquivo do
+# grafo de que foram calculadas.
+
+MAGIC = b"GRAFOCSR"
+VERSAO_FORMATO = 2
+PASTA_CACHE = Path(__file__).resolve().parent.parent.parent / "out" / "cache"
+
+_PREFIXO = struct.Struct("<8sIQ")
+
+
+def _alinhar(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _sha256(caminho: Path) -> str:
+    h = hashlib.sha256()
+    with open(caminho, "rb") as f:
+        for bloco in iter(lambda: f.read(1 << 20), b""):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def _identificar_fonte(caminho: Path, com_hash: bool = True) -> Dict[str, Any]:
+    st = caminho.stat()
+    fonte = {"tamanho": st.st_size, "mtime_ns": st.st_mtime_ns}
+    if com_hash:
+        fonte["sha256"] = _sha256(caminho)
+    return fonte
+
+
+def caminho_cache(caminho_csv: Path, opcoes: Dict[str, Any], pasta: Path | None = None) -> Path:
+    pasta = Path(pasta) if pasta is not None else PASTA_CACHE
+    chave = json.dumps(opcoes, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return pasta / f"{Path(caminho_csv).stem}__{hashlib.sha1(chave).hexdigest()[:12]}.grafo"
+
+
+def salvar_grafo(destino: Path, grafo: FrozenGraph, cabecalho: Dict[str, Any]) -> None:
+    n = grafo.ordem()
+    m = len(grafo.alvos)
+    cabecalho = dict(
+        cabecalho,
+        n=n,
+        m=m,
+        direcionado=grafo.direcionado,
+        peso_minimo=grafo._peso_minimo,
+        nome_peso=grafo.nome_peso,
+        colunas=list(grafo.colunas),
+        minimos=grafo._minimos,
+        byteorder=sys.byteorder,
+        nomes=grafo.nomes,
+    )
+    bruto = json.dumps(cabecalho, ensure_ascii=False).encode("utf-8")
+    inicio = _alinhar(_PREFIXO.size + len(bruto))
+
+    destino = Path(destino)
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    tmp = destino.with_suffix(destino.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_PREFIXO.pack(MAGIC, VERSAO_FORMATO, len(bruto)))
+        f.write(bruto)
+        f.write(b"\0" * (inicio - _PREFIXO.size - len(bruto)))
+        f.write(array("q", grafo.offsets).tobytes())
+        alvos = array("i", grafo.alvos).tobytes()
+        f.write(alvos)
+        f.write(b"\0" * (_alinhar(len(alvos)) - len(alvos)))
+        f.write(array("d", grafo.pesos).tobytes())
+        for c in grafo.colunas:
+            f.write(array("d", grafo.valores_colunas[c]).tobytes())
+    os.replace(tmp, destino)
+
+
+def ler_cabecalho(
+    caminho: Path,
+    magic_esperado: bytes = MAGIC,
+    versao_esperada: int = VERSAO_FORMATO,
+) -> Tuple[Dict[str, Any], int] | None:
+    # Retorna (cabeçalho, início dos vetores) ou None se o arquivo não for um cache válido
+    try:
+        with open(caminho, "rb") as f:
+            prefixo = f.read(_PREFIXO.size)
+            if len(prefixo) < _PREFIXO.size:
+                return None
+            magic, versao, tamanho = _PREFIXO.unpack(prefixo)
+            if magic != magic_esperado or versao != versao_esperada:
+                return None
+            cabecalho = json.loads(f.read(tamanho).decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+    if cabecalho.get("byteorder") != sys.byteorder:
+        return None
+    return cabecalho, _alinhar(_PREFIXO.size + tamanho)
+
+
+def mapear_grafo(caminho: Path) -> FrozenGraph:
+    lido = ler_cabecalho(caminho)
+    if lido is None:
+        raise ValueError(f"Cache de grafo inválido: {caminho}")
+    cabecalho, inicio = lido
+    n, m = cabecalho["n"], cabecalho["m"]
+
+    with open(caminho, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    buf = memoryview(mm)
+
+    fim_offsets = inicio + 8 * (n + 1)
+    fim_alvos = fim_offsets + 4 * m
+    inicio_pesos = _alinhar(fim_alvos)
+
+    offsets = buf[inicio:fim_offsets].cast("q")
+    alvos = buf[fim_offsets:fim_alvos].cast("i")
+    pesos = buf[inicio_pesos:inicio_pesos + 8 * m].cast("d")
+
+    colunas = {}
+    pos = inicio_pesos + 8 * m
+    for c in cabecalho["colunas"]:
+        colunas[c] = buf[pos:pos + 8 * m].cast("d")
+        pos += 8 * m
+
+    grafo = FrozenGraph(
+        cabecalho["nomes"],
+        offsets,
+        alvos,
+        pesos,
+        direcionado=cabecalho["direcionado"],
+        peso_minimo=cabecalho["peso_minimo"],
+        colunas=colunas,
+        nome_peso=cabecalho["nome_peso"],
+        minimos=cabecalho["minimos"],
+    )
+    grafo.arquivo = Path(caminho)
+    return grafo
+
+
+def salvar_tabelas(
+    destino: Path,
+    magic: bytes,
+    versao: int,
+    cabecalho: Dict[str, Any],
+    vetores: Dict[str, array],
+) -> None:
+    # mesmo layout do cache do grafo: prefixo, cabeçalho JSON e vetores
+    # alinhados a 8 bytes, na ordem de "vetores"
+    cabecalho = dict(
+        cabecalho,
+        byteorder=sys.byteorder,
+        vetores=[[nome, v.typecode, len(v)] for nome, v in vetores.items()],
+    )
+    bruto = json.dumps(cabecalho, ensure_ascii=False).encode("utf-8")
+    inicio = _alinhar(_PREFIXO.size + len(bruto))
+
+    destino = Path(destino)
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    tmp = destino.with_suffix(destino.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_PREFIXO.pack(magic, versao, len(bruto)))
+        f.write(bruto)
+        f.write(b"\0" * (inicio - _PREFIXO.size - len(bruto)))
+        for v in vetores.values():
+            dados = v.tobytes()
+            f.write(dados)
+            f.write(b"\0" * (_alinhar(len(dados)) - len(dados)))
+    os.replace(tmp, destino)
+
+
+def mapear_tabelas(
+    caminho: Path,
+    magic: bytes,
+    versao: int,
+) -> Tuple[Dict[str, Any], Dict[str, memoryview]] | None:
+    # (cabeçalho, {nome: vetor mapeado}) ou None se o arquivo não servir
+    lido = ler_cabecalho(caminho, magic, versao) if Path(caminho).exists() else None
+    if lido is None:
+        return None
+    cabecalho, pos = lido
+
+    with open(caminho, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    buf = memoryview(mm)
+
+    vetores = {}
+    for nome, typecode, tamanho in cabecalho["vetores"]:
+        n_bytes = array(typecode).itemsize * tamanho
+        vetores[nome] = buf[pos:pos + n_bytes].cast(typecode)
+        pos = _alinhar(pos + n_bytes)
+    return cabecalho, vetores
+
+
+def identificar_grafo(grafo: FrozenGraph) -> Dict[str, Any] | None:
+    # identifica o arquivo de cache de onde o grafo foi mapeado (None se não veio de um)
+    arquivo = getattr(grafo, "arquivo", None)
+    if arquivo is None:
+        return None
+    ident = _identificar_fonte(Path(arquivo), com_hash=False)
+    ident["arquivo"] = Path(arquivo).name
+    return ident
+
+
+def caminho_tabela(grafo: FrozenGraph, tipo: str, opcoes: Dict[str, Any]) -> Path | None:
+    # arquivo da tabela derivada ao lado do cache do grafo
+    arquivo = getattr(grafo, "arquivo", None)
+    if arquivo is None:
+        return None
+    arquivo = Path(arquivo)
+    chave = json.dumps(opcoes, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return arquivo.with_name(f"{arquivo.stem}.{tipo}-{hashlib.sha1(chave).hexdigest()[:12]}")
+
+
+def _cache_valido(cabecalho: Dict[str, Any], caminho_csv: Path, opcoes: Dict[str, Any]) -> bool:
+    # compara já no formato do JSON (tuplas viram listas)
+    if cabecalho.get("opcoes") != json.loads(json.dumps(opcoes)):
+        return False
+    salvo = cabecalho.get("fonte", {})
+    atual = _identificar_fonte(caminho_csv, com_hash=False)
+    if salvo.get("tamanho") != atual["tamanho"]:
+        return False
+    if salvo.get("mtime_ns") == atual["mtime_ns"]:
+        return True
+    # mtime mudou (cópia, checkout...): confere o conteúdo antes de recompilar
+    return salvo.get("sha256") == _sha256(caminho_csv)
+
+
+def carregar_ou_compilar(
+    caminho_csv: Path,
+    opcoes: Dict[str, Any],
+    construir: Callable[[], Graph | FrozenGraph],
+    pasta: Path | None = None,
+) -> FrozenGraph:
+    """
+    Devolve o grafo compilado do CSV, mapeado em memória a partir do cache.
+    Se o cache não existir ou estiver desatualizado, chama construir(),
+    congela o grafo resultante (se ainda não vier congelado) e grava um
+    novo cache.
+    """
+    caminho_csv = Path(caminho_csv)
+    destino = caminho_cache(caminho_csv, opcoes, pasta)
+
+    lido = ler_cabecalho(destino) if destino.exists() else None
+    if lido is not None and _cache_valido(lido[0], caminho_csv, opcoes):
+        return mapear_grafo(destino)
+
+    fonte = _identificar_fonte(caminho_csv)
+    grafo = construir()
+    if isinstance(grafo, Graph):
+        grafo = grafo.congelar()
+    salvar_grafo(destino, grafo, {"fonte": fonte, "opcoes": opcoes})
+    return mapear_grafo(destino)
@@ -0,0 +1,312 @@
+from array import array
+from heapq import heappush, heappop
+from typing import Any, Dict, List, Tuple
+
+from .graph import Graph, FrozenGraph, SubgraphView, INF
+from .algorithms import ShortestPathResult, _nucleo
+from .cache import caminho_tabela, identificar_grafo, mapear_tabelas, salvar_tabelas
+
+# Contraction Hierarchies: os nós são contraídos um a um (menor diferença
+# de arestas primeiro); ao contrair v, cada par u -> v -> x sem caminho
+# alternativo tão curto ("testemunha") ganha um atalho u -> x. A consulta
+# é um Dijkstra bidirecional que só sobe na hierarquia: para frente pelos
+# arcos que vão a nós de ordem maior e para trás pelos que chegam deles.
+#
+# Cada arco guarda o nó do meio (-1 para arco original), o que permite
+# desempacotar o caminho nos municípios originais.
+
+MAGIC_CH = b"GRAFOCHS"
+VERSAO_CH = 1
+MAX_FECHADOS_TESTEMUNHA = 500
+
+
+def _coluna_normalizada(grafo, weight: str | None) -> str | None:
+    if weight is None or weight == "weight" or weight == grafo.nome_peso:
+        return None
+    return weight
+
+
+def _testemunhas(saida, fonte: int, ignorado: int, limite: float) -> Dict[int, float]:
+    # Dijkstra local a partir de fonte sem passar por ignorado, até o custo
+    # limite (ou MAX_FECHADOS_TESTEMUNHA nós). As distâncias devolvidas são
+    # de caminhos reais, então servem de testemunha mesmo incompletas.
+    dist = {fonte: 0.0}
+    fila = [(0.0, fonte)]
+    fechados = 0
+    while fila:
+        d, u = heappop(fila)
+        if d > dist[u]:
+            continue
+        if d > limite or fechados >= MAX_FECHADOS_TESTEMUNHA:
+            break
+        fechados += 1
+        for v, (w, _meio) in saida[u].items():
+            if v == ignorado:
+                continue
+            nd = d + w
+            if nd < dist.get(v, INF):
+                dist[v] = nd
+                heappush(fila, (nd, v))
+    return dist
+
+
+def _atalhos(saida, entrada, v: int) -> List[Tuple[int, int, float]]:
+    # atalhos (u, x, custo) necessários para contrair v
+    novos = []
+    if not saida[v]:
+        return novos
+    maior_saida = max(w for w, _ in saida[v].values())
+    for u, (w_uv, _) in entrada[v].items():
+        dist = _testemunhas(saida, u, v, w_uv + maior_saida)
+        for x, (w_vx, _) in saida[v].items():
+            if x == u:
+                continue
+            custo = w_uv + w_vx
+            if dist.get(x, INF) > custo:
+                novos.append((u, x, custo))
+    return novos
+
+
+def _csr(listas: List[List[Tuple[int, float, int]]]) -> Tuple[array, array, array, array]:
+    offsets = array("q", [0])
+    alvos = array("i")
+    pesos = array("d")
+    meios = array("i")
+    for itens in listas:
+        for x, w, meio in sorted(itens):
+            alvos.append(x)
+            pesos.append(w)
+            meios.append(meio)
+        offsets.append(len(alvos))
+    return offsets, alvos, pesos, meios
+
+
+class ContractionHierarchy:
+    """
+    Hierarquia pronta para consulta. ordem[v] é a posição de contração do nó
+    v; sobe_* guarda, em CSR, os arcos v -> x com ordem[x] > ordem[v] e
+    desce_* os arcos u -> v com ordem[u] > ordem[v] (indexados por v).
+    """
+
+    def __init__(self, nomes: List[str], ordem, sobe, desce, weight: str | None = None):
+        self.nomes = nomes
+        self.indice: Dict[str, int] = {no: i for i, no in enumerate(nomes)}
+        self.ordem = ordem
+        self.weight = weight
+        self._sobe = tuple(memoryview(v).toreadonly() for v in sobe)
+        self._desce = tuple(memoryview(v).toreadonly() for v in desce)
+
+    def num_atalhos(self) -> int:
+        return sum(1 for m in self._sobe[3] if m >= 0) + sum(1 for m in self._desce[3] if m >= 0)
+
+    def _arcos(self, csr, v: int):
+        offsets, alvos, pesos, meios = csr
+        a, b = offsets[v], offsets[v + 1]
+        return zip(alvos[a:b], pesos[a:b], meios[a:b])
+
+    def _arco(self, u: int, x: int) -> Tuple[float, int]:
+        # (peso, meio) do arco u -> x; fica em sobe[u] ou em desce[x]
+        if self.ordem[u] < self.ordem[x]:
+            for y, w, meio in self._arcos(self._sobe, u):
+                if y == x:
+                    return w, meio
+        else:
+            for y, w, meio in self._arcos(self._desce, x):
+                if y == u:
+                    return w, meio
+        raise KeyError(f"Arco inexistente na hierarquia: {u} -> {x}")
+
+    def _desempacotar(self, caminho: List[int]) -> Tuple[List[int], float]:
+        # troca atalhos pelos arcos originais e soma os pesos na ordem do caminho
+        nos = [caminho[0]]
+        custo = 0.0
+        pilha = [(u, x) for u, x in zip(reversed(caminho[:-1]), reversed(caminho[1:]))]
+        while pilha:
+            u, x = pilha.pop()
+            w, meio = self._arco(u, x)
+            if meio < 0:
+                nos.append(x)
+                custo += w
+            else:
+                pilha.append((meio, x))
+                pilha.append((u, meio))
+        return nos, custo
+
+    def consultar(self, fonte: int, alvo: int) -> Tuple[float, List[int], int]:
+        # (custo, caminho em ids, nós fechados)
+        if fonte == alvo:
+            return 0.0, [fonte], 1
+
+        dist = ({fonte: 0.0}, {alvo: 0.0})
+        pred: Tuple[Dict[int, int], Dict[int, int]] = ({}, {})
+        filas = ([(0.0, fonte)], [(0.0, alvo)])
+        arcos = (self._sobe, self._desce)
+        mu = INF
+        encontro = -1
+        fechados = 0
+
+        while True:
+            ativos = [lado for lado in (0, 1) if filas[lado] and filas[lado][0][0] < mu]
+            if not ativos:
+                break
+            lado = min(ativos, key=lambda l: filas[l][0][0])
+            d, u = heappop(filas[lado])
+            if d > dist[lado][u]:
+                continue
+            fechados += 1
+            outro = dist[1 - lado].get(u)
+            if outro is not None and d + outro < mu:
+                mu, encontro = d + outro, u
+            dl, pl = dist[lado], pred[lado]
+            for x, w, _meio in self._arcos(arcos[lado], u):
+                nd = d + w
+                if nd < dl.get(x, INF):
+                    dl[x] = nd
+                    pl[x] = u
+                    heappush(filas[lado], (nd, x))
+
+        if encontro < 0:
+            return INF, [], fechados
+
+        caminho = [encontro]
+        while caminho[-1] != fonte:
+            caminho.append(pred[0][caminho[-1]])
+        caminho.reverse()
+        while caminho[-1] != alvo:
+            caminho.append(pred[1][caminho[-1]])
+        nos, custo = self._desempacotar(caminho)
+        return custo, nos, fechados
+
+
+def preparar_hierarquia(grafo: Graph | FrozenGraph | SubgraphView, weight: str | None = None) -> ContractionHierarchy:
+    if not isinstance(grafo, FrozenGraph):
+        grafo = grafo.congelar()
+    weight = _coluna_normalizada(grafo, weight)
+    if grafo.possui_peso_negativo(weight):
+        raise ValueError("Peso negativo encontrado.")
+
+    n = grafo.ordem()
+    vizinhos = _nucleo(grafo, weight)[0]
+    # grafo de trabalho: saida[u][x] = entrada[x][u] = (peso, meio)
+    saida: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(n)]
+    entrada: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(n)]
+    for u in range(n):
+        for x, w in vizinhos(u):
+            if x != u:
+                saida[u][x] = entrada[x][u] = (w, -1)
+
+    contraidos_vizinhos = [0] * n
+
+    def prioridade(v: int) -> Tuple[int, List[Tuple[int, int, float]]]:
+        novos = _atalhos(saida, entrada, v)
+        return len(novos) - len(saida[v]) - len(entrada[v]) + contraidos_vizinhos[v], novos
+
+    fila = [(prioridade(v)[0], v) for v in range(n)]
+    fila.sort()
+    ordem = array("i", [0]) * n
+    sobe: List[List[Tuple[int, float, int]]] = [[] for _ in range(n)]
+    desce: List[List[Tuple[int, float, int]]] = [[] for _ in range(n)]
+    contraido = bytearray(n)
+    posicao = 0
+
+    while fila:
+        _p, v = heappop(fila)
+        if contraido[v]:
+            continue
+        # atualização preguiçosa: se a prioridade piorou, volta para a fila
+        p, novos = prioridade(v)
+        if fila and p > fila[0][0]:
+            heappush(fila, (p, v))
+            continue
+
+        contraido[v] = 1
+        ordem[v] = posicao
+        posicao += 1
+        sobe[v] = [(x, w, meio) for x, (w, meio) in saida[v].items()]
+        desce[v] = [(u, w, meio) for u, (w, meio) in entrada[v].items()]
+        for u in entrada[v]:
+            del saida[u][v]
+            contraidos_vizinhos[u] += 1
+        for x in saida[v]:
+            del entrada[x][v]
+            contraidos_vizinhos[x] += 1
+        saida[v] = {}
+        entrada[v] = {}
+
+        for u, x, custo in novos:
+            atual = saida[u].get(x)
+            if atual is None or custo < atual[0]:
+                saida[u][x] = entrada[x][u] = (custo, v)
+
+    return ContractionHierarchy(list(grafo.nomes), ordem, _csr(sobe), _csr(desce), weight)
+
+
+def salvar_hierarquia(hierarquia: ContractionHierarchy, destino, cabecalho: Dict[str, Any] | None = None) -> None:
+    vetores = {"ordem": array("i", hierarquia.ordem)}
+    for prefixo, csr in (("sobe", hierarquia._sobe), ("desce", hierarquia._desce)):
+        for nome, v, tipo in zip(("offsets", "alvos", "pesos", "meios"), csr, "qidi"):
+            vetores[f"{prefixo}_{nome}"] = array(tipo, v)
+    salvar_tabelas(
+        destino,
+        MAGIC_CH,
+        VERSAO_CH,
+        dict(cabecalho or {}, nomes=hierarquia.nomes, weight=hierarquia.weight),
+        vetores,
+    )
+
+
+def carregar_hierarquia(caminho) -> ContractionHierarchy | None:
+    mapeado = mapear_tabelas(caminho, MAGIC_CH, VERSAO_CH)
+    if mapeado is None:
+        return None
+    cabecalho, vetores = mapeado
+    campos = ("offsets", "alvos", "pesos", "meios")
+    return ContractionHierarchy(
+        cabecalho["nomes"],
+        vetores["ordem"],
+        tuple(vetores[f"sobe_{c}"] for c in campos),
+        tuple(vetores[f"desce_{c}"] for c in campos),
+        cabecalho["weight"],
+    )
+
+
+def hierarquia_do_cache(grafo: FrozenGraph, weight: str | None = None) -> ContractionHierarchy:
+    """
+    Como preparar_hierarquia, mas grava a hierarquia ao lado do cache do
+    grafo (out/cache) e a reaproveita enquanto o cache não mudar.
+    Grafos que não vieram do cache só são preparados em memória.
+    """
+    weight = _coluna_normalizada(grafo, weight)
+    opcoes = {"weight": weight, "max_fechados_testemunha": MAX_FECHADOS_TESTEMUNHA}
+    destino = caminho_tabela(grafo, "ch", opcoes)
+    if destino is None:
+        return preparar_hierarquia(grafo, weight)
+
+    grafo_atual = identificar_grafo(grafo)
+    mapeado = mapear_tabelas(destino, MAGIC_CH, VERSAO_CH)
+    if mapeado is not None and mapeado[0].get("grafo") == grafo_atual and mapeado[0].get("opcoes") == opcoes:
+        return carregar_hierarquia(destino)
+
+    hierarquia = preparar_hierarquia(grafo, weight)
+    salvar_hierarquia(hierarquia, destino, {"grafo": grafo_atual, "opcoes": opcoes})
+    return carregar_hierarquia(destino)
+
+
+def ch_shortest_path(hierarquia: ContractionHierarchy, origem: str, destino: str) -> ShortestPathResult:
+    # mesmas regras de dijkstra_shortest_path: sem caminho = custo infinito
+    if origem not in hierarquia.indice:
+        raise ValueError(f"Origem: '{origem}' não está no grafo.")
+    if destino not in hierarquia.indice:
+        raise ValueError(f"Destino: '{destino}' não está no grafo.")
+
+    custo, caminho, fechados = hierarquia.consultar(hierarquia.indice[origem], hierarquia.indice[destino])
+    nomes = hierarquia.nomes
+    return ShortestPathResult(origem, destino, custo, [nomes[v] for v in caminho], settled=fechados)
+
+
+def ch_path(hierarquia: ContractionHierarchy, origem: str, destino: str) -> List[str]:
+    return ch_shortest_path(hierarquia, origem, destino).path
+
+
+def ch_path_length(hierarquia: ContractionHierarchy, origem: str, destino: str) -> float:
+    return ch_shortest_path(hierarquia, origem, destino).cost
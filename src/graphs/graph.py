@@ -1,42 +1,361 @@
+from array import array
+from bisect import bisect_right
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Set, Tuple
+
+_SEM_VIZINHOS: Dict[str, float] = {}
+INF = float("inf")
+
+
+class Mutacao(NamedTuple):
+    # uma entrada do log de mudanças do Graph
+    versao: int
+    operacao: str  # "adicionar_no", "adicionar", "remover" ou "atualizar"
+    origem: str
+    destino: str | None = None
+    peso: float | None = None
+    extras: Dict[str, float] | None = None
+
 
 class Graph:
-    def __init__(self, direcionado: bool = False):
+    # os algoritmos rodam sobre nomes (FrozenGraph: sobre ids inteiros)
+    usa_ids = False
+
+    def __init__(
+        self,
+        direcionado: bool = False,
+        colunas: Iterable[str] = (),
+        nome_peso: str = "weight",
+        indice_reverso: bool = False,
+    ):
         # usar dict para evita duplicar arestas e facilita manter o menor peso
         self.adj: Dict[str, Dict[str, float]] = defaultdict(dict)
         self.direcionado = direcionado
+        # O peso principal fica em adj (nome_peso, "weight" também vale).
+        # Colunas extras (ex.: "tempo" além de "custo") ficam em vetores
+        # paralelos indexados pelo id do arco.
+        self.nome_peso = nome_peso
+        self.colunas: Tuple[str, ...] = tuple(colunas)
+        self._arco_id: Dict[str, Dict[str, int]] = {}
+        self._valores: Dict[str, array] = {c: array("d") for c in self.colunas}
+        self._minimos: Dict[str, float] = {c: INF for c in self.colunas}
+        # invariantes mantidos a cada adicionar_aresta (consultas em O(1))
+        self._num_arcos = 0
+        self._num_negativos = 0
+        self._peso_minimo = INF
+        self._grau_entrada: Dict[str, int] = {}
+        # mínimos que uma remoção pode ter invalidado (None = peso principal);
+        # enquanto sujo, o valor guardado é só um limite inferior
+        self._sujos: Set[str | None] = set()
+        # índice reverso (destino -> {origem: peso}) só existe se pedido;
+        # depois de criado é mantido a cada arco inserido
+        self._radj: Dict[str, Dict[str, float]] | None = None
+
+        # versão e log de mudanças: caches derivados comparam a versão. O log
+        # só começa no primeiro snapshot/congelar (antes dele ninguém tem uma
+        # versão antiga para pedir deltas); _log_desde é essa versão
+        self.versao = 0
+        self._log: List[Mutacao] = []
+        self._log_desde: int | None = None
+        self._somente_leitura = False
+        # copy-on-write depois do primeiro snapshot: linhas (tabela, nó) já
+        # copiadas na geração atual e vetores de colunas abaixo do limite
+        # continuam compartilhados com os snapshots
+        self._cow = False
+        self._donos: Set[Tuple[str, str]] = set()
+        self._limite_valores = 0
+        self._snapshot: "Graph | None" = None
+        self._congelado: "FrozenGraph | None" = None
+        if indice_reverso:
+            self.habilitar_indice_reverso()
+
+    def _registrar(self, operacao: str, origem: str, destino=None, peso=None, extras=None) -> None:
+        if self._somente_leitura:
+            raise TypeError("Snapshot do grafo é somente leitura.")
+        self.versao += 1
+        if self._log_desde is not None:
+            self._log.append(Mutacao(self.versao, operacao, origem, destino, peso, extras or None))
+
+    def _iniciar_log(self) -> None:
+        if self._log_desde is None:
+            self._log_desde = self.versao
+
+    def _linha(self, tabela: Dict[str, Dict], tag: str, no: str) -> Dict:
+        # linha de tabela pronta para escrita (copia se um snapshot a usa)
+        linha = tabela.get(no)
+        if self._cow and (tag, no) not in self._donos:
+            linha = {} if linha is None else dict(linha)
+            tabela[no] = linha
+            self._donos.add((tag, no))
+        elif linha is None:
+            linha = tabela[no] = {}
+        return linha
 
     def adicionar_no(self, no: str) -> None:
+        if no in self.adj:
+            return
+        self._registrar("adicionar_no", no)
         _ = self.adj[no]  # força criação
 
-    def adicionar_aresta(self, origem: str, destino: str, peso: float) -> None:
+    def adicionar_aresta(self, origem: str, destino: str, peso: float, **extras: float) -> None:
+        # extras: valores das colunas declaradas (coluna ausente fica infinita)
+        for c in extras:
+            if c not in self._valores:
+                raise KeyError(f"Coluna de peso não declarada no grafo: {c}")
+        if not self._somente_leitura and self._sem_efeito(origem, destino, peso, extras):
+            return
+        self._registrar("adicionar", origem, destino, peso, extras)
+
         # origem -> destino
-        if destino in self.adj[origem]:
-            self.adj[origem][destino] = min(self.adj[origem][destino], peso)
-        else:
-            self.adj[origem][destino] = peso
+        self._inserir_arco(origem, destino, peso, extras)
 
         if not self.direcionado:
-            if origem in self.adj[destino]:
-                self.adj[destino][origem] = min(self.adj[destino][origem], peso)
-            else:
-                self.adj[destino][origem] = peso
+            self._inserir_arco(destino, origem, peso, extras)
+        elif destino not in self.adj:
+            # destino sem arcos de saída também é nó (como no FrozenGraph)
+            self._linha(self.adj, "adj", destino)
+
+    def _sem_efeito(self, origem: str, destino: str, peso: float, extras: Dict[str, float]) -> bool:
+        # arco já existente sem nenhum peso menor: nada muda (nem a versão)
+        atual = self.adj.get(origem, _SEM_VIZINHOS).get(destino)
+        if atual is None or peso < atual:
+            return False
+        if not extras:
+            return True
+        idx = self._arco_id[origem][destino]
+        return all(w >= self._valores[c][idx] for c, w in extras.items())
+
+    def _inserir_arco(self, origem: str, destino: str, peso: float, extras: Dict[str, float]) -> None:
+        # mantém só o menor peso entre arcos paralelos (cada coluna por si)
+        vs = self._linha(self.adj, "adj", origem)
+        if destino in vs:
+            atual = vs[destino]
+            if peso < atual:
+                vs[destino] = peso
+                if self._radj is not None:
+                    self._linha(self._radj, "radj", destino)[origem] = peso
+                if peso < 0 <= atual:
+                    self._num_negativos += 1
+            if extras:
+                col = self._valores
+                idx = self._arco_id[origem][destino]
+                menores = {c: w for c, w in extras.items() if w < col[c][idx]}
+                if menores:
+                    self._gravar_valores(origem, destino, menores)
+        else:
+            vs[destino] = peso
+            if self._radj is not None:
+                self._linha(self._radj, "radj", destino)[origem] = peso
+            self._num_arcos += 1
+            self._grau_entrada[destino] = self._grau_entrada.get(destino, 0) + 1
+            if peso < 0:
+                self._num_negativos += 1
+            if self.colunas:
+                ids = self._linha(self._arco_id, "ids", origem)
+                ids[destino] = len(self._valores[self.colunas[0]])
+                for c in self.colunas:
+                    w = extras.get(c, INF)
+                    self._valores[c].append(w)
+                    if w < self._minimos[c]:
+                        self._minimos[c] = w
+                        self._sujos.discard(c)
+
+        if peso < self._peso_minimo:
+            self._peso_minimo = peso
+            self._sujos.discard(None)
+
+    def _gravar_valores(self, origem: str, destino: str, valores: Dict[str, float]) -> None:
+        # posições abaixo do limite são vistas por snapshots: o arco ganha
+        # uma posição nova no fim dos vetores em vez de sobrescrever
+        idx = self._arco_id[origem][destino]
+        if idx < self._limite_valores:
+            novo = len(self._valores[self.colunas[0]])
+            for col in self._valores.values():
+                col.append(col[idx])
+            self._linha(self._arco_id, "ids", origem)[destino] = idx = novo
+        for c, w in valores.items():
+            col = self._valores[c]
+            if w > col[idx] <= self._minimos[c]:
+                self._sujos.add(c)
+            col[idx] = w
+            if w < self._minimos[c]:
+                self._minimos[c] = w
+                self._sujos.discard(c)
+
+    def remover_aresta(self, origem: str, destino: str) -> None:
+        if destino not in self.adj.get(origem, _SEM_VIZINHOS):
+            raise KeyError(f"Aresta inexistente: {origem} -> {destino}")
+        self._registrar("remover", origem, destino)
+
+        self._remover_arco(origem, destino)
+        if not self.direcionado and origem != destino:
+            self._remover_arco(destino, origem)
+
+    def _remover_arco(self, origem: str, destino: str) -> None:
+        peso = self._linha(self.adj, "adj", origem).pop(destino)
+        if self._radj is not None:
+            self._linha(self._radj, "radj", destino).pop(origem, None)
+        self._num_arcos -= 1
+        self._grau_entrada[destino] -= 1
+        if peso < 0:
+            self._num_negativos -= 1
+        # o menor peso pode ter saído: recalcula só quando for consultado
+        if peso <= self._peso_minimo:
+            self._sujos.add(None)
+        if self.colunas:
+            idx = self._linha(self._arco_id, "ids", origem).pop(destino)
+            for c in self.colunas:
+                if self._valores[c][idx] <= self._minimos[c]:
+                    self._sujos.add(c)
+
+    def atualizar_peso(self, origem: str, destino: str, peso: float | None = None, **extras: float) -> None:
+        # troca o peso de um arco existente (ao contrário de adicionar_aresta,
+        # que só mantém o menor); peso None mantém o principal
+        if destino not in self.adj.get(origem, _SEM_VIZINHOS):
+            raise KeyError(f"Aresta inexistente: {origem} -> {destino}")
+        for c in extras:
+            if c not in self._valores:
+                raise KeyError(f"Coluna de peso não declarada no grafo: {c}")
+        self._registrar("atualizar", origem, destino, peso, extras)
+
+        self._atualizar_arco(origem, destino, peso, extras)
+        if not self.direcionado and origem != destino:
+            self._atualizar_arco(destino, origem, peso, extras)
+
+    def _atualizar_arco(self, origem: str, destino: str, peso: float | None, extras: Dict[str, float]) -> None:
+        if peso is not None:
+            vs = self._linha(self.adj, "adj", origem)
+            atual = vs[destino]
+            vs[destino] = peso
+            if self._radj is not None:
+                self._linha(self._radj, "radj", destino)[origem] = peso
+            self._num_negativos += (peso < 0) - (atual < 0)
+            if peso > atual <= self._peso_minimo:
+                self._sujos.add(None)
+            if peso < self._peso_minimo:
+                self._peso_minimo = peso
+                self._sujos.discard(None)
+        if extras:
+            self._gravar_valores(origem, destino, extras)
+
+    def mudancas_desde(self, versao: int) -> List[Mutacao]:
+        # entradas do log depois de versao (até a versão deste grafo); só
+        # cobre versões a partir do primeiro snapshot/congelar
+        if self._log_desde is None or versao < self._log_desde:
+            raise ValueError(
+                f"Log de mudanças não cobre a versão {versao}: ele começa no primeiro snapshot/congelar."
+            )
+        log = self._log
+        inicio = bisect_right(log, versao, key=attrgetter("versao"))
+        fim = bisect_right(log, self.versao, key=attrgetter("versao"))
+        return log[inicio:fim]
+
+    def snapshot(self) -> "Graph":
+        """
+        Cópia somente leitura da versão atual, sem copiar as arestas: o
+        snapshot compartilha as linhas de adjacência e o grafo vivo copia
+        cada linha só na primeira escrita depois do snapshot.
+        """
+        if self._somente_leitura:
+            return self
+        if self._snapshot is not None and self._snapshot.versao == self.versao:
+            return self._snapshot
+
+        self._iniciar_log()
+        snap = Graph.__new__(Graph)
+        snap.__dict__.update(self.__dict__)
+        # só os dicts externos são copiados (O(V) referências)
+        snap.adj = defaultdict(dict, self.adj)
+        snap._arco_id = dict(self._arco_id)
+        snap._valores = dict(self._valores)
+        snap._minimos = dict(self._minimos)
+        snap._grau_entrada = dict(self._grau_entrada)
+        snap._sujos = set(self._sujos)
+        if self._radj is not None:
+            snap._radj = dict(self._radj)
+        snap._somente_leitura = True
+        snap._snapshot = None
+
+        # nova geração: nenhuma linha pertence mais só ao grafo vivo
+        self._cow = True
+        self._donos = set()
+        self._limite_valores = len(self._valores[self.colunas[0]]) if self.colunas else 0
+        self._snapshot = snap
+        return snap
+
+    def tem_coluna(self, coluna: str) -> bool:
+        return coluna in ("weight", self.nome_peso) or coluna in self._valores
+
+    def _coluna(self, coluna: str | None) -> str | None:
+        # None para o peso principal, o nome para colunas extras
+        if coluna is None or coluna == "weight" or coluna == self.nome_peso:
+            return None
+        if coluna not in self._valores:
+            raise KeyError(f"Coluna de peso inexistente: {coluna}")
+        return coluna
+
+    def peso(self, origem: str, destino: str, coluna: str | None = None) -> float:
+        c = self._coluna(coluna)
+        if c is None:
+            return self.adj[origem][destino]
+        return self._valores[c][self._arco_id[origem][destino]]
 
     def vizinhos(self, no: str) -> List[Tuple[str, float]]:
         return list(self.adj[no].items())
 
+    def vizinhos_view(self, no: str, coluna: str | None = None) -> Iterable[Tuple[str, float]]:
+        # view somente leitura sobre o dict de adjacência (sem cópia)
+        c = self._coluna(coluna)
+        if c is None:
+            return self.adj.get(no, _SEM_VIZINHOS).items()
+        col = self._valores[c]
+        return ((v, col[i]) for v, i in self._arco_id.get(no, _SEM_VIZINHOS).items())
+
+    def habilitar_indice_reverso(self) -> None:
+        if self._radj is not None or not self.direcionado:
+            return  # não direcionado: predecessores são os próprios vizinhos
+        radj: Dict[str, Dict[str, float]] = {}
+        for u, vs in self.adj.items():
+            for v, w in vs.items():
+                radj.setdefault(v, {})[u] = w
+        self._radj = radj
+        # linhas novas, de nenhum snapshot: já pertencem à geração atual
+        if self._cow:
+            self._donos.update(("radj", v) for v in radj)
+
+    def predecessores(self, no: str) -> List[Tuple[str, float]]:
+        return list(self.predecessores_view(no))
+
+    def predecessores_view(self, no: str, coluna: str | None = None) -> Iterable[Tuple[str, float]]:
+        # arcos que chegam em no, como (origem, peso); cria o índice na 1ª chamada
+        if not self.direcionado:
+            return self.vizinhos_view(no, coluna)
+        self.habilitar_indice_reverso()
+        entrada = self._radj.get(no, _SEM_VIZINHOS)
+        c = self._coluna(coluna)
+        if c is None:
+            return entrada.items()
+        col = self._valores[c]
+        return ((u, col[self._arco_id[u][no]]) for u in entrada)
+
     def nos(self) -> List[str]:
         return list(self.adj.keys())
 
+    def iter_nos(self) -> Iterator[str]:
+        return iter(self.adj)
+
     def tem_no(self, no: str) -> bool:
         return no in self.adj
 
+    def __contains__(self, no: str) -> bool:
+        return no in self.adj
+
     def ordem(self) -> int:
         return len(self.adj)
 
     def tamanho(self) -> int:
-        m = sum(len(vs) for vs in self.adj.values())
+        m = self._num_arcos
         if self.direcionado:
             return m
         return m // 2
@@ -44,12 +363,74 @@ class Graph:
     def grau(self, no: str) -> int:
         return len(self.adj[no])
 
-    def possui_peso_negativo(self) -> bool:
-        for u, vs in self.adj.items():
-            for v, w in vs.items():
-                if w < 0:
-                    return True
-        return False
+    def grau_saida(self, no: str) -> int:
+        return len(self.adj.get(no, ()))
+
+    def grau_entrada(self, no: str) -> int:
+        return self._grau_entrada.get(no, 0)
+
+    def peso_minimo(self, coluna: str | None = None) -> float:
+        c = self._coluna(coluna)
+        if c in self._sujos:
+            self._recalcular_minimo(c)
+        if c is None:
+            return self._peso_minimo
+        return self._minimos[c]
+
+    def _recalcular_minimo(self, c: str | None) -> None:
+        if c is None:
+            self._peso_minimo = min((w for vs in self.adj.values() for w in vs.values()), default=INF)
+        else:
+            col = self._valores[c]
+            self._minimos[c] = min((col[i] for ids in self._arco_id.values() for i in ids.values()), default=INF)
+        self._sujos.discard(c)
+
+    def possui_peso_negativo(self, coluna: str | None = None) -> bool:
+        if self._coluna(coluna) is None:
+            return self._num_negativos > 0
+        return self.peso_minimo(coluna) < 0
+
+    def subgraph_view(self, filtro: Iterable[str] | Callable[[str], bool]) -> "SubgraphView":
+        # subgrafo induzido por uma coleção de nós ou por um predicado, sem cópia
+        return SubgraphView(self, filtro)
+
+    def congelar(self) -> "FrozenGraph":
+        # snapshot imutável em CSR: ids inteiros na ordem alfabética dos nomes;
+        # reaproveitado enquanto a versão do grafo não mudar
+        if self._congelado is not None and self._congelado.versao == self.versao:
+            return self._congelado
+        self._iniciar_log()
+        nomes = sorted(self.adj)
+        indice = {no: i for i, no in enumerate(nomes)}
+
+        offsets = array("q", [0])
+        alvos = array("i")
+        pesos = array("d")
+        colunas = {c: array("d") for c in self.colunas}
+        for no in nomes:
+            vs = self.adj.get(no)
+            if vs:
+                alvos.extend(indice[v] for v in vs)
+                pesos.extend(vs.values())
+                ids = self._arco_id.get(no)
+                for c, col in colunas.items():
+                    valores = self._valores[c]
+                    col.extend(valores[ids[v]] for v in vs)
+            offsets.append(len(alvos))
+
+        congelado = FrozenGraph(
+            nomes,
+            offsets,
+            alvos,
+            pesos,
+            self.direcionado,
+            peso_minimo=self.peso_minimo() if len(pesos) else None,
+            colunas=colunas,
+            nome_peso=self.nome_peso,
+            versao=self.versao,
+        )
+        self._congelado = congelado
+        return congelado
 
     @classmethod
     def from_arestas(cls, arestas: List[Tuple[str, str, float]], direcionado: bool = False):
@@ -57,3 +438,355 @@ class Graph:
         for u, v, w in arestas:
             g.adicionar_aresta(u, v, w)
         return g
+
+
+class FrozenGraph:
+    """
+    Snapshot imutável do Graph em formato CSR (compressed sparse row).
+    Os vizinhos do nó de id i ficam em alvos[offsets[i]:offsets[i + 1]],
+    com os pesos correspondentes em pesos[...] e em cada vetor de
+    colunas[nome]. Os vetores podem ser array.array ou memoryview
+    (quando mapeados do cache em disco).
+    """
+
+    usa_ids = True
+
+    def __init__(
+        self,
+        nomes: List[str],
+        offsets: array,
+        alvos: array,
+        pesos: array,
+        direcionado: bool = False,
+        peso_minimo: float | None = None,
+        colunas: Dict[str, array] | None = None,
+        nome_peso: str = "weight",
+        minimos: Dict[str, float] | None = None,
+        versao: int = 0,
+    ):
+        self.nomes = nomes
+        # versão do Graph de origem no momento do congelamento
+        self.versao = versao
+        # arquivo de cache de onde foi mapeado (tabelas derivadas ficam ao lado)
+        self.arquivo = None
+        # índice de alcance (graphs.alcance), se anexado
+        self.alcance = None
+        self.indice: Dict[str, int] = {no: i for i, no in enumerate(nomes)}
+        self.offsets = offsets
+        self.alvos = alvos
+        self.pesos = pesos
+        # fatias de memoryview não copiam os vetores
+        self._alvos_mv = memoryview(alvos).toreadonly()
+        self._pesos_mv = memoryview(pesos).toreadonly()
+        self.direcionado = direcionado
+        if peso_minimo is None:
+            peso_minimo = min(pesos) if len(pesos) else 0.0
+        self._peso_minimo = peso_minimo
+        self._graus_entrada: array | None = None
+        # CSR reverso (criado sob demanda): fontes dos arcos que chegam em
+        # cada nó e a posição do arco nos vetores diretos
+        self._r_offsets: array | None = None
+        self._r_fontes: memoryview | None = None
+        self._r_arcos: memoryview | None = None
+
+        self.nome_peso = nome_peso
+        colunas = colunas or {}
+        self.colunas: Tuple[str, ...] = tuple(colunas)
+        self.valores_colunas = colunas
+        self._colunas_mv = {c: memoryview(v).toreadonly() for c, v in colunas.items()}
+        if minimos is None:
+            minimos = {c: (min(v) if len(v) else 0.0) for c, v in colunas.items()}
+        self._minimos = minimos
+
+    # ids <-> nomes
+    def id_de(self, no: str) -> int:
+        return self.indice[no]
+
+    def nome_de(self, i: int) -> str:
+        return self.nomes[i]
+
+    def tem_coluna(self, coluna: str) -> bool:
+        return coluna in ("weight", self.nome_peso) or coluna in self._colunas_mv
+
+    def _pesos_da_coluna(self, coluna: str | None) -> memoryview:
+        if coluna is None or coluna == "weight" or coluna == self.nome_peso:
+            return self._pesos_mv
+        if coluna not in self._colunas_mv:
+            raise KeyError(f"Coluna de peso inexistente: {coluna}")
+        return self._colunas_mv[coluna]
+
+    def vizinhos_ids(self, i: int, coluna: str | None = None) -> Iterable[Tuple[int, float]]:
+        a, b = self.offsets[i], self.offsets[i + 1]
+        pesos = self._pesos_mv if coluna is None else self._pesos_da_coluna(coluna)
+        return zip(self._alvos_mv[a:b], pesos[a:b])
+
+    def fatia_vizinhos(self, i: int, coluna: str | None = None) -> Tuple[memoryview, memoryview]:
+        # (alvos, pesos) do nó i como buffers somente leitura, sem cópia
+        a, b = self.offsets[i], self.offsets[i + 1]
+        return self._alvos_mv[a:b], self._pesos_da_coluna(coluna)[a:b]
+
+    def habilitar_indice_reverso(self) -> None:
+        if self._r_offsets is not None or not self.direcionado:
+            return
+        n, m = len(self.nomes), len(self.alvos)
+        offsets = array("q", bytes(8 * (n + 1)))
+        for v in self._alvos_mv:
+            offsets[v + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        proximo = array("q", offsets[:n])
+        fontes = array("i", bytes(4 * m))
+        arcos = array("q", bytes(8 * m))
+        off = self.offsets
+        for u in range(n):
+            for arco in range(off[u], off[u + 1]):
+                v = self._alvos_mv[arco]
+                k = proximo[v]
+                fontes[k] = u
+                arcos[k] = arco
+                proximo[v] = k + 1
+
+        self._r_offsets = offsets
+        self._r_fontes = memoryview(fontes).toreadonly()
+        self._r_arcos = memoryview(arcos).toreadonly()
+        self._graus_entrada = array("q", (offsets[i + 1] - offsets[i] for i in range(n)))
+
+    def csr_reverso(self) -> Tuple[array, memoryview, memoryview | None]:
+        # (offsets, fontes, arcos) dos arcos que chegam em cada nó: os que
+        # chegam em v são fontes[offsets[v]:offsets[v + 1]], e arcos dá a
+        # posição de cada um no CSR de saída (para os pesos). Não direcionado:
+        # o próprio CSR de saída, com arcos = None
+        if not self.direcionado:
+            return self.offsets, self._alvos_mv, None
+        self.habilitar_indice_reverso()
+        return self._r_offsets, self._r_fontes, self._r_arcos
+
+    def predecessores_ids(self, i: int, coluna: str | None = None) -> Iterable[Tuple[int, float]]:
+        if not self.direcionado:
+            return self.vizinhos_ids(i, coluna)
+        self.habilitar_indice_reverso()
+        a, b = self._r_offsets[i], self._r_offsets[i + 1]
+        pesos = self._pesos_da_coluna(coluna)
+        return ((u, pesos[arco]) for u, arco in zip(self._r_fontes[a:b], self._r_arcos[a:b]))
+
+    # mesma API de leitura do Graph
+    def vizinhos(self, no: str) -> List[Tuple[str, float]]:
+        return list(self.vizinhos_view(no))
+
+    def vizinhos_view(self, no: str, coluna: str | None = None) -> Iterator[Tuple[str, float]]:
+        nomes = self.nomes
+        return ((nomes[v], w) for v, w in self.vizinhos_ids(self.indice[no], coluna))
+
+    def predecessores(self, no: str) -> List[Tuple[str, float]]:
+        return list(self.predecessores_view(no))
+
+    def predecessores_view(self, no: str, coluna: str | None = None) -> Iterator[Tuple[str, float]]:
+        nomes = self.nomes
+        return ((nomes[u], w) for u, w in self.predecessores_ids(self.indice[no], coluna))
+
+    def nos(self) -> List[str]:
+        return list(self.nomes)
+
+    def iter_nos(self) -> Iterator[str]:
+        return iter(self.nomes)
+
+    def tem_no(self, no: str) -> bool:
+        return no in self.indice
+
+    def __contains__(self, no: str) -> bool:
+        return no in self.indice
+
+    def ordem(self) -> int:
+        return len(self.nomes)
+
+    def tamanho(self) -> int:
+        m = len(self.alvos)
+        if self.direcionado:
+            return m
+        return m // 2
+
+    def grau(self, no: str) -> int:
+        i = self.indice[no]
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def grau_saida(self, no: str) -> int:
+        return self.grau(no)
+
+    def grau_entrada(self, no: str) -> int:
+        if self._graus_entrada is None:
+            graus = array("q", bytes(8 * len(self.nomes)))
+            for v in self.alvos:
+                graus[v] += 1
+            self._graus_entrada = graus
+        return self._graus_entrada[self.indice[no]]
+
+    def peso_minimo(self, coluna: str | None = None) -> float:
+        if coluna is None or coluna == "weight" or coluna == self.nome_peso:
+            return self._peso_minimo
+        if coluna not in self._minimos:
+            raise KeyError(f"Coluna de peso inexistente: {coluna}")
+        return self._minimos[coluna]
+
+    def possui_peso_negativo(self, coluna: str | None = None) -> bool:
+        return self.peso_minimo(coluna) < 0
+
+    def subgraph_view(self, filtro: Iterable[str] | Callable[[str], bool]) -> "SubgraphView":
+        return SubgraphView(self, filtro)
+
+
+class SubgraphView:
+    """
+    Subgrafo induzido somente leitura sobre um Graph ou FrozenGraph.
+    Não copia a adjacência: os vizinhos do grafo pai são filtrados na hora.
+    Sobre um FrozenGraph o filtro vira uma máscara de bytes indexada pelo
+    id do nó (os ids continuam os do pai). filtro é uma coleção de nós ou
+    um predicado sobre o nome do nó; nós fora do pai são ignorados.
+    """
+
+    def __init__(self, pai: Graph | FrozenGraph, filtro: Iterable[str] | Callable[[str], bool]):
+        self._pai = pai
+        self.direcionado = pai.direcionado
+        self.nome_peso = pai.nome_peso
+        self.colunas = pai.colunas
+        self.usa_ids = pai.usa_ids
+
+        if self.usa_ids:
+            mascara = bytearray(len(pai.nomes))
+            if callable(filtro):
+                for i, no in enumerate(pai.nomes):
+                    if filtro(no):
+                        mascara[i] = 1
+            else:
+                for no in filtro:
+                    i = pai.indice.get(no)
+                    if i is not None:
+                        mascara[i] = 1
+            self._mascara = mascara
+            self._ordem = mascara.count(1)
+            self.nomes = pai.nomes
+            self.indice = pai.indice
+            indice = pai.indice
+
+            def aceita(no: str) -> bool:
+                i = indice.get(no)
+                return i is not None and mascara[i] == 1
+
+            self._aceita = aceita
+        else:
+            # Graph pode mudar depois: o filtro é avaliado a cada consulta
+            self._aceita = filtro if callable(filtro) else frozenset(filtro).__contains__
+        self._congelado: FrozenGraph | None = None
+
+    # ids <-> nomes (só sobre FrozenGraph)
+    def id_de(self, no: str) -> int:
+        return self.indice[no]
+
+    def nome_de(self, i: int) -> str:
+        return self.nomes[i]
+
+    def vizinhos_ids(self, i: int, coluna: str | None = None) -> Iterator[Tuple[int, float]]:
+        m = self._mascara
+        if not m[i]:
+            return iter(())
+        return ((v, w) for v, w in self._pai.vizinhos_ids(i, coluna) if m[v])
+
+    def predecessores_ids(self, i: int, coluna: str | None = None) -> Iterator[Tuple[int, float]]:
+        m = self._mascara
+        if not m[i]:
+            return iter(())
+        return ((u, w) for u, w in self._pai.predecessores_ids(i, coluna) if m[u])
+
+    # mesma API de leitura do Graph
+    def tem_coluna(self, coluna: str) -> bool:
+        return self._pai.tem_coluna(coluna)
+
+    def vizinhos(self, no: str) -> List[Tuple[str, float]]:
+        return list(self.vizinhos_view(no))
+
+    def vizinhos_view(self, no: str, coluna: str | None = None) -> Iterator[Tuple[str, float]]:
+        aceita = self._aceita
+        if not aceita(no):
+            return iter(())
+        return ((v, w) for v, w in self._pai.vizinhos_view(no, coluna) if aceita(v))
+
+    def predecessores(self, no: str) -> List[Tuple[str, float]]:
+        return list(self.predecessores_view(no))
+
+    def predecessores_view(self, no: str, coluna: str | None = None) -> Iterator[Tuple[str, float]]:
+        aceita = self._aceita
+        if not aceita(no):
+            return iter(())
+        return ((u, w) for u, w in self._pai.predecessores_view(no, coluna) if aceita(u))
+
+    def nos(self) -> List[str]:
+        return list(self.iter_nos())
+
+    def iter_nos(self) -> Iterator[str]:
+        aceita = self._aceita
+        return (no for no in self._pai.iter_nos() if aceita(no))
+
+    def tem_no(self, no: str) -> bool:
+        return self._pai.tem_no(no) and self._aceita(no)
+
+    def __contains__(self, no: str) -> bool:
+        return self.tem_no(no)
+
+    def ordem(self) -> int:
+        if self.usa_ids:
+            return self._ordem
+        return sum(1 for _ in self.iter_nos())
+
+    def _arcos(self, coluna: str | None = None) -> Iterator[Tuple[str, str, float]]:
+        for u in self.iter_nos():
+            for v, w in self.vizinhos_view(u, coluna):
+                yield u, v, w
+
+    def tamanho(self) -> int:
+        # percorre os arcos do subgrafo (não há contador para manter); mesma
+        # conta do grafo pai
+        m = sum(1 for _ in self._arcos())
+        if self.direcionado:
+            return m
+        return m // 2
+
+    def grau(self, no: str) -> int:
+        return sum(1 for _ in self.vizinhos_view(no))
+
+    def grau_saida(self, no: str) -> int:
+        return self.grau(no)
+
+    def grau_entrada(self, no: str) -> int:
+        return sum(1 for _ in self.predecessores_view(no))
+
+    def peso_minimo(self, coluna: str | None = None) -> float:
+        return min((w for _u, _v, w in self._arcos(coluna)), default=INF)
+
+    def possui_peso_negativo(self, coluna: str | None = None) -> bool:
+        # sem negativos no pai não há o que procurar
+        if not self._pai.possui_peso_negativo(coluna):
+            return False
+        return any(w < 0 for _u, _v, w in self._arcos(coluna))
+
+    def congelar(self) -> "FrozenGraph":
+        # FrozenGraph do subgrafo induzido (ids próprios, todas as colunas),
+        # reaproveitado enquanto a versão do pai não mudar
+        if self._congelado is not None and self._congelado.versao == self._pai.versao:
+            return self._congelado
+        copia = Graph(direcionado=self.direcionado, colunas=self.colunas, nome_peso=self.nome_peso)
+        for u in self.iter_nos():
+            copia.adicionar_no(u)
+            extras = {c: dict(self.vizinhos_view(u, c)) for c in self.colunas}
+            for v, w in self.vizinhos_view(u):
+                copia.adicionar_aresta(u, v, w, **{c: extras[c][v] for c in self.colunas})
+        congelado = copia.congelar()
+        congelado.versao = self._pai.versao
+        self._congelado = congelado
+        return congelado
+
+    def subgraph_view(self, filtro: Iterable[str] | Callable[[str], bool]) -> "SubgraphView":
+        # compõe os filtros sobre o mesmo pai (sem view de view)
+        aceita = self._aceita
+        if callable(filtro):
+            return SubgraphView(self._pai, lambda no: aceita(no) and filtro(no))
+        return SubgraphView(self._pai, [no for no in filtro if aceita(no)])
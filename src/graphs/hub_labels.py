@@ -0,0 +1,237 @@
+from array import array
+from heapq import heappush, heappop
+from typing import Any, Dict, List, Tuple
+
+from .graph import Graph, FrozenGraph, SubgraphView, INF
+from .algorithms import _nucleo
+from .cache import caminho_tabela, identificar_grafo, mapear_tabelas, salvar_tabelas
+
+# Rótulos de 2 saltos (hub labeling) por pruned landmark labeling.
+# Os nós viram hubs em ordem decrescente de grau; de cada hub h sai um
+# Dijkstra podado: ao fechar v com distância d, se os rótulos já montados
+# respondem d(h, v) <= d, a busca não passa por v; senão (h, d) entra no
+# rótulo de v. Então
+#   d(s, t) = min sobre hubs comuns h de saida[s][h] + entrada[t][h],
+# onde saida[v] guarda d(v, h) e entrada[v] guarda d(h, v). No grafo não
+# direcionado os dois rótulos são o mesmo.
+#
+# Cada rótulo é uma fatia ordenada pelo posto do hub em vetores CSR
+# (offsets, hubs, distâncias), o que permite responder com uma intersecção
+# linear de duas listas ordenadas.
+
+MAGIC_PLL = b"GRAFOPLL"
+VERSAO_PLL = 1
+
+
+def _coluna_normalizada(grafo, weight: str | None) -> str | None:
+    if weight is None or weight == "weight" or weight == grafo.nome_peso:
+        return None
+    return weight
+
+
+def _csr(rotulos: List[Tuple[array, array]]) -> Tuple[array, array, array]:
+    offsets = array("q", [0])
+    hubs = array("i")
+    dists = array("d")
+    for h, d in rotulos:
+        hubs.extend(h)
+        dists.extend(d)
+        offsets.append(len(hubs))
+    return offsets, hubs, dists
+
+
+class HubLabels:
+    """
+    Oráculo de distâncias. postos[v] é a posição de v na ordem dos hubs;
+    os rótulos guardam postos (não ids) para já saírem ordenados.
+    """
+
+    def __init__(self, nomes: List[str], postos, saida, entrada, direcionado: bool, weight: str | None = None):
+        self.nomes = nomes
+        self.indice: Dict[str, int] = {no: i for i, no in enumerate(nomes)}
+        self.postos = postos
+        self.direcionado = direcionado
+        self.weight = weight
+        self._saida = tuple(memoryview(v).toreadonly() for v in saida)
+        self._entrada = tuple(memoryview(v).toreadonly() for v in entrada) if direcionado else self._saida
+
+    def _rotulo(self, csr, v: int):
+        offsets, hubs, dists = csr
+        a, b = offsets[v], offsets[v + 1]
+        return hubs[a:b], dists[a:b]
+
+    def distancia_ids(self, s: int, t: int) -> float:
+        if s == t:
+            return 0.0
+        hs, ds = self._rotulo(self._saida, s)
+        ht, dt = self._rotulo(self._entrada, t)
+        melhor = INF
+        i = j = 0
+        ns, nt = len(hs), len(ht)
+        while i < ns and j < nt:
+            a, b = hs[i], ht[j]
+            if a == b:
+                d = ds[i] + dt[j]
+                if d < melhor:
+                    melhor = d
+                i += 1
+                j += 1
+            elif a < b:
+                i += 1
+            else:
+                j += 1
+        return melhor
+
+    def distancia(self, origem: str, destino: str) -> float:
+        if origem not in self.indice:
+            raise ValueError(f"Origem: '{origem}' não está no grafo.")
+        if destino not in self.indice:
+            raise ValueError(f"Destino: '{destino}' não está no grafo.")
+        return self.distancia_ids(self.indice[origem], self.indice[destino])
+
+    def estatisticas(self) -> Dict[str, Any]:
+        # tamanho dos rótulos (entradas por nó) e memória dos vetores
+        n = len(self.nomes)
+        conjuntos = [self._saida] if not self.direcionado else [self._saida, self._entrada]
+        tamanhos = [csr[0][v + 1] - csr[0][v] for csr in conjuntos for v in range(n)]
+        total = sum(tamanhos)
+        memoria = sum(v.nbytes for csr in conjuntos for v in csr)
+        return {
+            "nos": n,
+            "entradas": total,
+            "media_por_no": total / n if n else 0.0,
+            "maximo_por_no": max(tamanhos, default=0),
+            "bytes": memoria,
+        }
+
+
+def preparar_rotulos(grafo: Graph | FrozenGraph | SubgraphView, weight: str | None = None) -> HubLabels:
+    if not isinstance(grafo, FrozenGraph):
+        grafo = grafo.congelar()
+    weight = _coluna_normalizada(grafo, weight)
+    if grafo.possui_peso_negativo(weight):
+        raise ValueError("Peso negativo encontrado.")
+
+    n = grafo.ordem()
+    direcionado = grafo.direcionado
+    frente = _nucleo(grafo, weight)[0]
+    tras = _nucleo(grafo, weight, reverso=True)[0] if direcionado else frente
+
+    # hubs em ordem decrescente de grau (entrada + saída), empate pelo id
+    grau = [grafo.grau_saida(no) for no in grafo.nomes]
+    if direcionado:
+        grau = [g + grafo.grau_entrada(no) for no, g in zip(grafo.nomes, grau)]
+    ordem = sorted(range(n), key=lambda v: (-grau[v], v))
+    postos = array("i", [0]) * n
+    for posto, v in enumerate(ordem):
+        postos[v] = posto
+
+    # rótulos em construção: (postos dos hubs, distâncias) por nó
+    saida = [(array("i"), array("d")) for _ in range(n)]
+    entrada = [(array("i"), array("d")) for _ in range(n)] if direcionado else saida
+    temporario = array("d", [INF]) * n  # distâncias do rótulo do hub atual, por posto
+
+    def podar(h: int, posto: int, vizinhos, rotulo_hub, rotulos) -> None:
+        # Dijkstra podado a partir de h; rotulo_hub é o rótulo de h do lado
+        # oposto (usado para testar a poda), rotulos recebe as novas entradas
+        hs, ds = rotulo_hub
+        for k, d in zip(hs, ds):
+            temporario[k] = d
+        temporario[posto] = 0.0
+
+        dist = {h: 0.0}
+        fila = [(0.0, h)]
+        while fila:
+            d, v = heappop(fila)
+            if d > dist[v]:
+                continue
+            hv, dv = rotulos[v]
+            if any(temporario[k] + x <= d for k, x in zip(hv, dv)):
+                continue
+            hv.append(posto)
+            dv.append(d)
+            for x, w in vizinhos(v):
+                nd = d + w
+                if nd < dist.get(x, INF):
+                    dist[x] = nd
+                    heappush(fila, (nd, x))
+
+        for k in hs:
+            temporario[k] = INF
+        temporario[posto] = INF
+
+    for posto, h in enumerate(ordem):
+        # para frente: d(h, v) vai para entrada[v]; para trás: d(v, h) vai para saida[v]
+        podar(h, posto, frente, saida[h], entrada)
+        if direcionado:
+            podar(h, posto, tras, entrada[h], saida)
+
+    return HubLabels(
+        list(grafo.nomes),
+        postos,
+        _csr(saida),
+        _csr(entrada) if direcionado else None,
+        direcionado,
+        weight,
+    )
+
+
+def salvar_rotulos(rotulos: HubLabels, destino, cabecalho: Dict[str, Any] | None = None) -> None:
+    vetores = {"postos": array("i", rotulos.postos)}
+    conjuntos = [("saida", rotulos._saida)]
+    if rotulos.direcionado:
+        conjuntos.append(("entrada", rotulos._entrada))
+    for prefixo, csr in conjuntos:
+        for nome, v, tipo in zip(("offsets", "hubs", "dists"), csr, "qid"):
+            vetores[f"{prefixo}_{nome}"] = array(tipo, v)
+    salvar_tabelas(
+        destino,
+        MAGIC_PLL,
+        VERSAO_PLL,
+        dict(cabecalho or {}, nomes=rotulos.nomes, direcionado=rotulos.direcionado, weight=rotulos.weight),
+        vetores,
+    )
+
+
+def carregar_rotulos(caminho) -> HubLabels | None:
+    mapeado = mapear_tabelas(caminho, MAGIC_PLL, VERSAO_PLL)
+    if mapeado is None:
+        return None
+    cabecalho, vetores = mapeado
+    campos = ("offsets", "hubs", "dists")
+    direcionado = cabecalho["direcionado"]
+    return HubLabels(
+        cabecalho["nomes"],
+        vetores["postos"],
+        tuple(vetores[f"saida_{c}"] for c in campos),
+        tuple(vetores[f"entrada_{c}"] for c in campos) if direcionado else None,
+        direcionado,
+        cabecalho["weight"],
+    )
+
+
+def rotulos_do_cache(grafo: FrozenGraph, weight: str | None = None) -> HubLabels:
+    """
+    Como preparar_rotulos, mas grava os rótulos ao lado do cache do grafo
+    (out/cache) e os reaproveita enquanto o cache não mudar.
+    Grafos que não vieram do cache só são preparados em memória.
+    """
+    weight = _coluna_normalizada(grafo, weight)
+    opcoes = {"weight": weight, "ordem": "grau"}
+    destino = caminho_tabela(grafo, "pll", opcoes)
+    if destino is None:
+        return preparar_rotulos(grafo, weight)
+
+    grafo_atual = identificar_grafo(grafo)
+    mapeado = mapear_tabelas(destino, MAGIC_PLL, VERSAO_PLL)
+    if mapeado is not None and mapeado[0].get("grafo") == grafo_atual and mapeado[0].get("opcoes") == opcoes:
+        return carregar_rotulos(destino)
+
+    rotulos = preparar_rotulos(grafo, weight)
+    salvar_rotulos(rotulos, destino, {"grafo": grafo_atual, "opcoes": opcoes})
+    return carregar_rotulos(destino)
+
+
+def hub_path_length(rotulos: HubLabels, origem: str, destino: str) -> float:
+    # mesma resposta de dijkstra_path_length (infinito se não há caminho)
+    return rotulos.distancia(origem, destino)
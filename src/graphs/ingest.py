@@ -0,0 +1,258 @@
+import csv
+import os
+import sys
+import time
+import warnings
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from .graph import FrozenGraph
+from .io import DATASETS, NORMALIZACOES
+
+# Ingestão paralela de bases grandes de ligações: o CSV é dividido em faixas
+# de bytes alinhadas em fim de linha, cada faixa é lida em um processo e as
+# colunas são separadas (np.loadtxt) e convertidas com numpy. O resultado é
+# montado direto nos vetores CSR do FrozenGraph, sem passar pelo Graph de
+# dicts.
+#
+# Supõe que nenhum campo do CSV tem quebra de linha dentro de aspas (vale
+# para as bases LRH do IBGE).
+
+TAMANHO_BLOCO = 8 << 20  # 8 MiB por faixa
+
+
+def _faixas(caminho: Path, tamanho_bloco: int) -> Tuple[List[str], List[Tuple[int, int]]]:
+    tamanho = os.path.getsize(caminho)
+    faixas = []
+    with open(caminho, "rb") as f:
+        cabecalho = next(csv.reader([f.readline().decode("utf-8")]))
+        inicio = f.tell()
+        while inicio < tamanho:
+            f.seek(min(inicio + tamanho_bloco, tamanho))
+            f.readline()  # estende a faixa até o fim da linha corrente
+            fim = min(f.tell(), tamanho)
+            faixas.append((inicio, fim))
+            inicio = fim
+    return cabecalho, faixas
+
+
+def _para_float(valores: np.ndarray) -> np.ndarray:
+    # texto -> float64 com NaN para vazio/inválido
+    valores = np.char.strip(valores)
+    saida = np.full(len(valores), np.nan)
+    preenchidos = valores != ""
+    try:
+        saida[preenchidos] = valores[preenchidos].astype(np.float64)
+    except ValueError:
+        convertidos = []
+        for x in valores[preenchidos].tolist():
+            try:
+                convertidos.append(float(x))
+            except ValueError:
+                convertidos.append(np.nan)
+        saida[preenchidos] = convertidos
+    return saida
+
+
+def _separar(linhas: List[str], usadas: Tuple[int, ...]) -> List[np.ndarray]:
+    # Só as colunas usadas, como vetores de texto. O parser em C do
+    # np.loadtxt (com aspas) separa os campos; se alguma linha tiver menos
+    # campos que o necessário, a faixa volta ao csv.reader, que descarta
+    # essas linhas.
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)  # linhas em branco / faixa vazia
+            tabela = np.loadtxt(
+                linhas, dtype=str, delimiter=",", quotechar='"', comments=None, usecols=usadas, ndmin=2
+            )
+        return [tabela[:, k] for k in range(len(usadas))]
+    except ValueError:
+        largura = max(usadas) + 1
+        validas = [r for r in csv.reader(linhas) if len(r) >= largura]
+        return [np.array([r[i] for r in validas], dtype=str) for i in usadas]
+
+
+def _ler_faixa(
+    caminho: str,
+    inicio: int,
+    fim: int,
+    indices: Tuple[int, int],
+    indices_pesos: List[int],
+    normalizar: str | None,
+    descartar_nao_positivos: bool,
+    peso_padrao: float | None,
+) -> Dict[str, Any]:
+    with open(caminho, "rb") as f:
+        f.seek(inicio)
+        texto = f.read(fim - inicio).decode("utf-8")
+
+    colunas = _separar(texto.splitlines(), indices + tuple(indices_pesos))
+    del texto
+    lidas = len(colunas[0])
+    if not lidas:
+        return {"lidas": 0, "nomes": [], "origem": None, "destino": None, "pesos": []}
+
+    origem, destino = colunas[0], colunas[1]
+    pesos = [_para_float(c) for c in colunas[2:]]
+    del colunas
+
+    principal = pesos[0]
+    if peso_padrao is not None:
+        principal[np.isnan(principal)] = peso_padrao
+    for extra in pesos[1:]:
+        extra[np.isnan(extra)] = np.inf
+
+    # normaliza só os nomes distintos e reindexa
+    n = len(origem)
+    distintos, inv = np.unique(np.concatenate([origem, destino]), return_inverse=True)
+    norm = NORMALIZACOES[normalizar]
+    normalizados = np.array([norm(x) for x in distintos.tolist()] or [""], dtype=str)
+    nomes, inv2 = np.unique(normalizados[: len(distintos)], return_inverse=True)
+    codigos = inv2[inv]
+    cod_origem, cod_destino = codigos[:n], codigos[n:]
+
+    validas = (nomes[cod_origem] != "") & (nomes[cod_destino] != "") & ~np.isnan(principal)
+    if descartar_nao_positivos:
+        validas &= principal > 0
+
+    cod_origem, cod_destino = cod_origem[validas], cod_destino[validas]
+    pesos = [p[validas] for p in pesos]
+
+    # só os nomes que sobraram em alguma linha válida
+    usados, compacto = np.unique(np.concatenate([cod_origem, cod_destino]), return_inverse=True)
+    m = len(cod_origem)
+    return {
+        "lidas": lidas,
+        "nomes": nomes[usados].tolist(),
+        "origem": compacto[:m].astype(np.int64),
+        "destino": compacto[m:].astype(np.int64),
+        "pesos": pesos,
+    }
+
+
+def _pico_memoria() -> int | None:
+    # maior RSS do processo principal + maior RSS entre os filhos (Unix)
+    try:
+        import resource
+    except ImportError:
+        return None
+    escala = 1 if sys.platform == "darwin" else 1024
+    proprio = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    filhos = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return (proprio + filhos) * escala
+
+
+def _para_array(codigo: str, valores: np.ndarray) -> array:
+    saida = array(codigo)
+    saida.frombytes(np.ascontiguousarray(valores).tobytes())
+    return saida
+
+
+def ingerir_csv(
+    dataset: str = "lrh2016",
+    peso: str | None = None,
+    direcionado: bool = False,
+    normalizar: str | None = None,
+    descartar_nao_positivos: bool = False,
+    peso_padrao: float | None = None,
+    arquivo: Path | None = None,
+    colunas: Tuple[str, ...] = (),
+    processos: int | None = None,
+    tamanho_bloco: int = TAMANHO_BLOCO,
+) -> Tuple[FrozenGraph, Dict[str, Any]]:
+    """
+    Lê o CSV em faixas paralelas e devolve (FrozenGraph, relatório).
+
+    Aceita as mesmas opções de io.ler_grafo e gera o mesmo grafo que
+    ler_grafo(...).congelar(): arcos paralelos ficam com o menor peso (cada
+    coluna por si) e os vizinhos mantêm a ordem da primeira ocorrência.
+    O relatório traz linhas lidas, tempo, linhas/s e pico de memória.
+    """
+    inicio_total = time.perf_counter()
+    spec = DATASETS[dataset]
+    arquivo = Path(arquivo or spec["arquivo"])
+    peso = peso or spec["pesos"][0]
+    colunas = tuple(c for c in colunas if c != peso)
+
+    cabecalho, faixas = _faixas(arquivo, tamanho_bloco)
+    indices = (cabecalho.index(spec["origem"]), cabecalho.index(spec["destino"]))
+    indices_pesos = [cabecalho.index(c) for c in (peso,) + colunas]
+    args = (indices, indices_pesos, normalizar, descartar_nao_positivos, peso_padrao)
+
+    processos = processos or os.cpu_count() or 1
+    if processos > 1 and len(faixas) > 1:
+        with ProcessPoolExecutor(max_workers=min(processos, len(faixas))) as pool:
+            futuros = [pool.submit(_ler_faixa, str(arquivo), a, b, *args) for a, b in faixas]
+            partes = [f.result() for f in futuros]
+    else:
+        partes = [_ler_faixa(str(arquivo), a, b, *args) for a, b in faixas]
+
+    lidas = sum(p["lidas"] for p in partes)
+    partes = [p for p in partes if p["nomes"]]
+
+    # tabela global de nomes (ordem alfabética, como em Graph.congelar)
+    nomes = np.unique(np.concatenate([np.array(p["nomes"], dtype=str) for p in partes])) if partes else np.array([], dtype=str)
+    n = len(nomes)
+    origem_l, destino_l = [], []
+    for p in partes:
+        mapa = np.searchsorted(nomes, np.array(p["nomes"], dtype=str))
+        origem_l.append(mapa[p["origem"]])
+        destino_l.append(mapa[p["destino"]])
+    origem = np.concatenate(origem_l) if origem_l else np.array([], dtype=np.int64)
+    destino = np.concatenate(destino_l) if destino_l else np.array([], dtype=np.int64)
+    valores = [
+        np.concatenate([p["pesos"][k] for p in partes]) if partes else np.array([])
+        for k in range(1 + len(colunas))
+    ]
+
+    # "instante" de inserção de cada arco, como no adicionar_aresta linha a linha
+    linhas = np.arange(len(origem), dtype=np.int64)
+    if direcionado:
+        u, v, instante = origem, destino, linhas
+    else:
+        u = np.concatenate([origem, destino])
+        v = np.concatenate([destino, origem])
+        instante = np.concatenate([2 * linhas, 2 * linhas + 1])
+        valores = [np.concatenate([x, x]) for x in valores]
+
+    # arcos paralelos: agrupa por (u, v) e fica com o mínimo de cada coluna
+    chave = u * n + v
+    ordem = np.lexsort((instante, chave))
+    chave = chave[ordem]
+    inicios = np.flatnonzero(np.r_[True, chave[1:] != chave[:-1]]) if len(chave) else np.array([], dtype=np.int64)
+    chave_g = chave[inicios]
+    primeiro = instante[ordem][inicios]
+    minimos = [np.minimum.reduceat(x[ordem], inicios) if len(inicios) else x[:0] for x in valores]
+
+    # CSR com os vizinhos na ordem da primeira ocorrência
+    u_g, v_g = chave_g // max(n, 1), chave_g % max(n, 1)
+    ordem_csr = np.lexsort((primeiro, u_g))
+    u_g, v_g = u_g[ordem_csr], v_g[ordem_csr]
+    minimos = [x[ordem_csr] for x in minimos]
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(u_g, minlength=n), out=offsets[1:])
+
+    grafo = FrozenGraph(
+        nomes.tolist(),
+        _para_array("q", offsets),
+        _para_array("i", v_g.astype(np.int32)),
+        _para_array("d", minimos[0].astype(np.float64)),
+        direcionado,
+        colunas={c: _para_array("d", x.astype(np.float64)) for c, x in zip(colunas, minimos[1:])},
+        nome_peso=peso,
+    )
+
+    segundos = time.perf_counter() - inicio_total
+    relatorio = {
+        "linhas": lidas,
+        "faixas": len(faixas),
+        "processos": min(processos, len(faixas)),
+        "segundos": segundos,
+        "linhas_por_segundo": lidas / segundos if segundos > 0 else float("inf"),
+        "pico_memoria_bytes": _pico_memoria(),
+    }
+    return grafo, relatorio
@@ -1,7 +1,13 @@
-import pandas as pd
+import csv
 import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Tuple
 
-dt = pd.read_csv("data/bairros_recife.csv")
+from .graph import Graph, FrozenGraph
+from .cache import carregar_ou_compilar
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+LRH2016_CSV = BASE_DIR / "data" / "dataset_parte2" / "LRH2016_00_Base_Completa.csv"
 
 dados = {
   "bairro": [],
@@ -9,6 +15,8 @@ dados = {
 }
 
 def montarDataframe(dt):
+  import pandas as pd
+
   for i in range(dt.shape[1]):  # pega cada coluna
     microrregiao = dt.columns[i]  
         
@@ -22,7 +30,203 @@ def normalizarNome(bairro):
   texto = "".join(c for c in texto if not unicodedata.combining(c))
   return texto.replace("ç", "c").strip().lower()
 
-montarDataframe(dt) 
 
-df_final = pd.DataFrame(dados)
-df_final.to_csv("out/bairros_unique.csv", index=False, encoding="utf-8")
+# Datasets conhecidos: arquivo, colunas de origem/destino e colunas de peso
+# disponíveis (a primeira é o padrão).
+DATASETS = {
+  "bairros": {
+    "arquivo": BASE_DIR / "data" / "adjacencias_bairros.csv",
+    "origem": "bairro_origem",
+    "destino": "bairro_destino",
+    "pesos": ("peso",),
+  },
+  "lrh2016": {
+    "arquivo": LRH2016_CSV,
+    "origem": "nomemun_a",
+    "destino": "nomemun_b",
+    "pesos": ("custo", "tempo"),
+  },
+}
+
+
+def _minusculas(nome: str) -> str:
+  return nome.strip().lower()
+
+
+NORMALIZACOES = {
+  None: str.strip,
+  "minusculas": _minusculas,
+  "sem_acentos": normalizarNome,
+}
+
+# Registro em memória: (dataset, arquivo, opções) -> grafo já carregado
+_REGISTRO: Dict[Tuple, Graph | FrozenGraph] = {}
+_ROTULOS: Dict[Tuple, Dict[str, str]] = {}
+
+
+def _spec(dataset: str) -> Dict[str, Any]:
+  if dataset not in DATASETS:
+    raise KeyError(f"Dataset desconhecido: {dataset}")
+  return DATASETS[dataset]
+
+
+def ler_grafo(
+  dataset: str = "lrh2016",
+  peso: str | None = None,
+  direcionado: bool = False,
+  normalizar: str | None = None,
+  descartar_nao_positivos: bool = False,
+  peso_padrao: float | None = None,
+  arquivo: Path | None = None,
+  colunas: Tuple[str, ...] = (),
+) -> Graph:
+  """
+  Lê o CSV do dataset em um Graph, sem passar por cache nem registro.
+
+  peso: coluna usada como peso (padrão: a primeira coluna de peso do dataset).
+  direcionado: False guarda ida e volta (equivale a espelhar os arcos).
+  normalizar: None (só strip), "minusculas" ou "sem_acentos".
+  descartar_nao_positivos: ignora arestas com peso <= 0.
+  peso_padrao: peso para linhas sem peso válido (None descarta a linha).
+  colunas: outras colunas de peso guardadas no mesmo grafo (ex.: ("tempo",)
+  com peso="custo"); valor inválido numa coluna extra vira infinito.
+  """
+  spec = _spec(dataset)
+  peso = peso or spec["pesos"][0]
+  norm = NORMALIZACOES[normalizar]
+  col_origem, col_destino = spec["origem"], spec["destino"]
+
+  colunas = tuple(c for c in colunas if c != peso)
+  G = Graph(direcionado=direcionado, colunas=colunas, nome_peso=peso)
+  with open(arquivo or spec["arquivo"], newline="", encoding="utf-8") as f:
+    reader = csv.DictReader(f)
+    for row in reader:
+      u = norm(row.get(col_origem) or "")
+      v = norm(row.get(col_destino) or "")
+      if not u or not v:
+        continue
+
+      try:
+        w = float(row.get(peso) or "")
+      except ValueError:
+        if peso_padrao is None:
+          continue
+        w = peso_padrao
+
+      if descartar_nao_positivos and w <= 0:
+        continue
+
+      extras = {}
+      for c in colunas:
+        try:
+          extras[c] = float(row.get(c) or "")
+        except ValueError:
+          extras[c] = float("inf")
+
+      G.adicionar_aresta(u, v, w, **extras)
+  return G
+
+
+def carregar_grafo(
+  dataset: str = "lrh2016",
+  peso: str | None = None,
+  direcionado: bool = False,
+  normalizar: str | None = None,
+  descartar_nao_positivos: bool = False,
+  peso_padrao: float | None = None,
+  arquivo: Path | None = None,
+  colunas: Tuple[str, ...] = (),
+  compilado: bool = True,
+  paralelo: bool = False,
+  pasta_cache: Path | None = None,
+  alcance: bool = False,
+) -> Graph | FrozenGraph:
+  """
+  Ponto único de carga dos grafos do projeto (mesmas opções de ler_grafo).
+
+  Cada combinação de dataset/opções é carregada uma vez por processo e
+  reaproveitada nas chamadas seguintes. Com compilado=True devolve um
+  FrozenGraph vindo do cache binário em out/cache; com compilado=False
+  devolve um Graph comum (compartilhado: não deve ser alterado).
+  paralelo=True compila o cache com a ingestão em faixas paralelas
+  (graphs.ingest, requer numpy); só vale com compilado=True.
+  alcance=True anexa ao FrozenGraph o índice de alcance (graphs.alcance),
+  gravado ao lado do cache: destinos inalcançáveis falham em O(1).
+  """
+  if paralelo and not compilado:
+    raise ValueError("paralelo=True exige compilado=True")
+  if alcance and not compilado:
+    raise ValueError("alcance=True exige compilado=True")
+
+  spec = _spec(dataset)
+  arquivo = Path(arquivo or spec["arquivo"])
+  if not arquivo.exists():
+    raise FileNotFoundError(f"Dataset não encontrado: {arquivo}")
+
+  opcoes = {
+    "peso": peso or spec["pesos"][0],
+    "direcionado": direcionado,
+    "normalizar": normalizar,
+    "descartar_nao_positivos": descartar_nao_positivos,
+    "peso_padrao": peso_padrao,
+    "colunas": tuple(colunas),
+  }
+  chave = (dataset, str(arquivo.resolve()), compilado, tuple(sorted(opcoes.items())))
+  if chave not in _REGISTRO:
+    def construir() -> Graph | FrozenGraph:
+      if paralelo:
+        from .ingest import ingerir_csv
+        return ingerir_csv(dataset, arquivo=arquivo, **opcoes)[0]
+      return ler_grafo(dataset, arquivo=arquivo, **opcoes)
+
+    if compilado:
+      _REGISTRO[chave] = carregar_ou_compilar(arquivo, opcoes, construir, pasta_cache)
+    else:
+      _REGISTRO[chave] = construir()
+
+  G = _REGISTRO[chave]
+  if alcance and G.alcance is None:
+    from .alcance import anexar_alcance
+    anexar_alcance(G)
+  return G
+
+
+def rotulos_originais(
+  dataset: str = "bairros",
+  normalizar: str | None = "sem_acentos",
+  arquivo: Path | None = None,
+) -> Dict[str, str]:
+  """Nome normalizado -> primeira grafia encontrada no CSV (para exibição)."""
+  spec = _spec(dataset)
+  arquivo = Path(arquivo or spec["arquivo"])
+  chave = (dataset, str(arquivo.resolve()), normalizar)
+  if chave in _ROTULOS:
+    return _ROTULOS[chave]
+
+  norm = NORMALIZACOES[normalizar]
+  rotulos: Dict[str, str] = {}
+  with open(arquivo, newline="", encoding="utf-8") as f:
+    for row in csv.DictReader(f):
+      for col in (spec["origem"], spec["destino"]):
+        bruto = (row.get(col) or "").strip()
+        if bruto:
+          rotulos.setdefault(norm(bruto), bruto)
+
+  _ROTULOS[chave] = rotulos
+  return rotulos
+
+
+def limpar_registro() -> None:
+  _REGISTRO.clear()
+  _ROTULOS.clear()
+
+
+if __name__ == "__main__":
+  import pandas as pd
+
+  dt = pd.read_csv("data/bairros_recife.csv")
+
+  montarDataframe(dt) 
+
+  df_final = pd.DataFrame(dados)
+  df_final.to_csv("out/bairros_unique.csv", index=False, encoding="utf-8")
@@ -0,0 +1,368 @@
+import random
+from array import array
+from heapq import heappush, heappop
+from typing import Any, Dict, List, Tuple
+
+from .graph import Graph, FrozenGraph, SubgraphView, INF
+from .algorithms import ShortestPathResult, _nucleo, _sem_caminho
+from .cache import caminho_tabela, identificar_grafo, mapear_tabelas, salvar_tabelas
+
+# ALT: A* com limites inferiores vindos de landmarks e da desigualdade
+# triangular. Para cada landmark L guardamos d(L, v) e d(v, L) para todo
+# nó v (no grafo não direcionado as duas tabelas são a mesma), e então
+#   d(v, t) >= max(d(L, t) - d(L, v), d(v, L) - d(t, L)).
+#
+# As tabelas usam os ids do FrozenGraph (ordem alfabética dos nomes) e só
+# valem para ele: alt_shortest_path recusa (ValueError) qualquer outro
+# grafo, inclusive subgrafos, views e versões alteradas do mesmo Graph.
+# Para esses, calcule landmarks novos sobre o grafo a consultar.
+
+MAGIC_ALT = b"GRAFOALT"
+VERSAO_ALT = 1
+SELECOES = ("farthest", "avoid")
+ATIVOS = 4  # landmarks usados por consulta (os de melhor limite para o par)
+
+
+def _coluna_normalizada(grafo, weight: str | None) -> str | None:
+    if weight is None or weight == "weight" or weight == grafo.nome_peso:
+        return None
+    return weight
+
+
+def _arvore(vizinhos, fontes: List[int], n: int) -> Tuple[array, array, List[int]]:
+    # Dijkstra completo (multi-fonte) sobre ids: (dist, pred, ordem de fechamento)
+    dist = array("d", [INF]) * n
+    pred = array("i", [-1]) * n
+    ordem: List[int] = []
+    fila: List[Tuple[float, int]] = []
+    for f in fontes:
+        dist[f] = 0.0
+        fila.append((0.0, f))
+
+    while fila:
+        d, u = heappop(fila)
+        if d > dist[u]:
+            continue
+        ordem.append(u)
+        for v, w in vizinhos(u):
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                heappush(fila, (nd, v))
+    return dist, pred, ordem
+
+
+class Landmarks:
+    """
+    Tabelas de distância de/para k landmarks sobre um FrozenGraph.
+    para[i * n + v] = d(L_i, v) e de[i * n + v] = d(v, L_i).
+    """
+
+    def __init__(
+        self,
+        grafo: FrozenGraph,
+        ids: List[int],
+        para,
+        de,
+        weight: str | None = None,
+        selecao: str = "avoid",
+    ):
+        self.grafo = grafo
+        self.n = len(grafo.nomes)
+        self.ids = list(ids)
+        self.para = para
+        self.de = de
+        self.weight = weight
+        self.selecao = selecao
+        maior = max((x for x in para if x != INF), default=0.0)
+        # margem contra arredondamento: o limite nunca passa da distância real
+        self._folga = 1e-9 * maior
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def nomes(self) -> List[str]:
+        return [self.grafo.nomes[i] for i in self.ids]
+
+    def _linhas(self, i: int):
+        n = self.n
+        return self.para[i * n:(i + 1) * n], self.de[i * n:(i + 1) * n]
+
+    def limite(self, v: int, t: int) -> float:
+        # limite inferior de d(v, t) usando todos os landmarks
+        melhor = 0.0
+        for i in range(len(self.ids)):
+            para, de = self._linhas(i)
+            if para[v] != INF:
+                melhor = max(melhor, para[t] - para[v])
+            if de[t] != INF:
+                melhor = max(melhor, de[v] - de[t])
+        return melhor
+
+    def heuristica(self, fonte: int, alvo: int, ativos: int = ATIVOS):
+        # h(v) para o alvo fixo, com os landmarks de melhor limite para o par
+        candidatos = []
+        for i in range(len(self.ids)):
+            para, de = self._linhas(i)
+            b = 0.0
+            if para[fonte] != INF:
+                b = max(b, para[alvo] - para[fonte])
+            if de[alvo] != INF:
+                b = max(b, de[fonte] - de[alvo])
+            candidatos.append((b, i))
+        candidatos.sort(reverse=True)
+
+        termos_para = []
+        termos_de = []
+        for _b, i in candidatos[:ativos]:
+            para, de = self._linhas(i)
+            termos_para.append((para, para[alvo]))
+            if de[alvo] != INF:
+                termos_de.append((de, de[alvo]))
+        folga = self._folga
+
+        def h(v: int) -> float:
+            melhor = 0.0
+            for para, d_alvo in termos_para:
+                x = para[v]
+                if x != INF and d_alvo - x > melhor:
+                    melhor = d_alvo - x  # d_alvo infinito: v não alcança o alvo
+            for de, d_alvo in termos_de:
+                x = de[v] - d_alvo
+                if x > melhor:
+                    melhor = x
+            return melhor - folga if melhor > folga else 0.0
+
+        return h
+
+
+def preparar_landmarks(
+    grafo: Graph | FrozenGraph | SubgraphView,
+    k: int = 16,
+    selecao: str = "avoid",
+    weight: str | None = None,
+    semente: int = 0,
+) -> Landmarks:
+    """
+    Escolhe k landmarks e calcula as tabelas (2 Dijkstras completos por
+    landmark no grafo direcionado, 1 no não direcionado).
+    selecao="farthest": cada landmark é o nó mais distante dos já escolhidos.
+    selecao="avoid": cada landmark é a folha que "evita" as regiões já bem
+    cobertas, na árvore de caminhos mínimos de uma raiz sorteada.
+    """
+    if selecao not in SELECOES:
+        raise ValueError(f"Seleção de landmarks desconhecida: {selecao} (use {', '.join(SELECOES)})")
+    if not isinstance(grafo, FrozenGraph):
+        grafo = grafo.congelar()
+    weight = _coluna_normalizada(grafo, weight)
+
+    n = grafo.ordem()
+    k = min(k, n)
+    frente = _nucleo(grafo, weight)[0]
+    tras = _nucleo(grafo, weight, reverso=True)[0] if grafo.direcionado else frente
+    sorteio = random.Random(semente)
+
+    ids: List[int] = []
+    para = array("d")
+    de = array("d")
+
+    def incluir(landmark: int) -> None:
+        ids.append(landmark)
+        para.extend(_arvore(frente, [landmark], n)[0])
+        if grafo.direcionado:
+            de.extend(_arvore(tras, [landmark], n)[0])
+
+    while len(ids) < k:
+        if selecao == "farthest":
+            fontes = ids or [sorteio.randrange(n)]
+            dist = _arvore(frente, fontes, n)[0]
+            escolhido = max(
+                (v for v in range(n) if dist[v] != INF and v not in ids),
+                key=dist.__getitem__,
+                default=None,
+            )
+        else:
+            escolhido = _folha_avoid(grafo, frente, ids, para, de, n, sorteio.randrange(n))
+        if escolhido is None or escolhido in ids:
+            # componente já coberto: recomeça de um nó qualquer ainda livre
+            livres = [v for v in range(n) if v not in ids]
+            if not livres:
+                break
+            escolhido = sorteio.choice(livres)
+        incluir(escolhido)
+
+    return Landmarks(grafo, ids, para, de if grafo.direcionado else para, weight, selecao)
+
+
+def _folha_avoid(grafo, frente, ids, para, de, n, raiz) -> int | None:
+    dist, pred, ordem = _arvore(frente, [raiz], n)
+    de = de if grafo.direcionado else para
+
+    # peso(v) = d(r, v) - limite(r, v): quanto os landmarks atuais erram
+    peso = array("d", bytes(8 * n))
+    for v in ordem:
+        melhor = 0.0
+        for i in range(len(ids)):
+            base = i * n
+            if para[base + raiz] != INF and para[base + v] != INF:
+                melhor = max(melhor, para[base + v] - para[base + raiz])
+            if de[base + v] != INF and de[base + raiz] != INF:
+                melhor = max(melhor, de[base + raiz] - de[base + v])
+        peso[v] = dist[v] - melhor
+
+    # tamanho(v) = soma dos pesos da subárvore; 0 se ela contém um landmark
+    tamanho = array("d", peso)
+    tem_landmark = bytearray(n)
+    for L in ids:
+        tem_landmark[L] = 1
+    for v in reversed(ordem):
+        p = pred[v]
+        if tem_landmark[v]:
+            tamanho[v] = 0.0
+            if p >= 0:
+                tem_landmark[p] = 1
+        elif p >= 0:
+            tamanho[p] += tamanho[v]
+
+    filhos: Dict[int, List[int]] = {}
+    for v in ordem:
+        if pred[v] >= 0:
+            filhos.setdefault(pred[v], []).append(v)
+
+    if tamanho[raiz] == 0.0:
+        return None
+    v = raiz
+    while filhos.get(v):
+        v = max(filhos[v], key=tamanho.__getitem__)
+        if tamanho[v] == 0.0:
+            break
+    return v
+
+
+def salvar_landmarks(landmarks: Landmarks, destino, cabecalho: Dict[str, Any] | None = None) -> None:
+    vetores = {"ids": array("i", landmarks.ids), "para": array("d", landmarks.para)}
+    if landmarks.grafo.direcionado:
+        vetores["de"] = array("d", landmarks.de)
+    salvar_tabelas(
+        destino,
+        MAGIC_ALT,
+        VERSAO_ALT,
+        dict(cabecalho or {}, n=landmarks.n, weight=landmarks.weight, selecao=landmarks.selecao),
+        vetores,
+    )
+
+
+def carregar_landmarks(caminho, grafo: FrozenGraph) -> Landmarks | None:
+    mapeado = mapear_tabelas(caminho, MAGIC_ALT, VERSAO_ALT)
+    if mapeado is None:
+        return None
+    cabecalho, vetores = mapeado
+    if cabecalho["n"] != grafo.ordem():
+        return None
+    para = vetores["para"]
+    de = vetores.get("de", para)
+    return Landmarks(grafo, list(vetores["ids"]), para, de, cabecalho["weight"], cabecalho["selecao"])
+
+
+def landmarks_do_cache(
+    grafo: FrozenGraph,
+    k: int = 16,
+    selecao: str = "avoid",
+    weight: str | None = None,
+    semente: int = 0,
+) -> Landmarks:
+    """
+    Como preparar_landmarks, mas persiste as tabelas ao lado do cache do
+    grafo (out/cache) e as reaproveita enquanto o cache não mudar.
+    Grafos que não vieram do cache só são calculados em memória.
+    """
+    weight = _coluna_normalizada(grafo, weight)
+    opcoes = {"k": k, "selecao": selecao, "weight": weight, "semente": semente}
+    destino = caminho_tabela(grafo, "alt", opcoes)
+    if destino is None:
+        return preparar_landmarks(grafo, k, selecao, weight, semente)
+
+    grafo_atual = identificar_grafo(grafo)
+    mapeado = mapear_tabelas(destino, MAGIC_ALT, VERSAO_ALT)
+    if mapeado is not None and mapeado[0].get("grafo") == grafo_atual and mapeado[0].get("opcoes") == opcoes:
+        carregado = carregar_landmarks(destino, grafo)
+        if carregado is not None:
+            return carregado
+
+    landmarks = preparar_landmarks(grafo, k, selecao, weight, semente)
+    salvar_landmarks(landmarks, destino, {"grafo": grafo_atual, "opcoes": opcoes})
+    return carregar_landmarks(destino, grafo)
+
+
+def alt_shortest_path(
+    grafo: Graph | FrozenGraph | SubgraphView,
+    origem: str,
+    destino: str,
+    landmarks: Landmarks,
+    weight: str | None = None,
+) -> ShortestPathResult:
+    # A* com o limite dos landmarks; custo e caminho exatos (mesmas regras de
+    # dijkstra_shortest_path: sem caminho = custo infinito e caminho vazio).
+    # As tabelas só valem para o FrozenGraph de que foram calculadas: um
+    # Graph ou uma SubgraphView é aceito enquanto não mudar desde esse
+    # congelamento.
+    if not isinstance(grafo, FrozenGraph):
+        grafo = grafo.congelar()
+    if grafo is not landmarks.grafo:
+        raise ValueError("Os landmarks foram calculados sobre outro grafo (ou outra versão dele).")
+    if not grafo.tem_no(origem):
+        raise ValueError(f"Origem: '{origem}' não está no grafo.")
+    if not grafo.tem_no(destino):
+        raise ValueError(f"Destino: '{destino}' não está no grafo.")
+    if _coluna_normalizada(grafo, weight) != landmarks.weight:
+        raise ValueError("Os landmarks foram calculados para outra coluna de peso.")
+
+    vizinhos, chave, nome = _nucleo(grafo, weight)
+    if grafo.possui_peso_negativo(weight):
+        raise ValueError("Peso negativo encontrado.")
+    if _sem_caminho(grafo, origem, destino):
+        return ShortestPathResult(origem, destino, INF, [], settled=0)
+
+    fonte, alvo = chave(origem), chave(destino)
+    h = landmarks.heuristica(fonte, alvo)
+    custo_minimo: Dict[Any, float] = {fonte: 0.0}
+    no_predecessor: Dict[Any, Any] = {}
+    fila: List[Tuple[float, float, Any]] = [(h(fonte), 0.0, fonte)]
+    fechados = 0
+
+    while fila:
+        _f, custo_atual, u = heappop(fila)
+        if custo_atual > custo_minimo[u]:
+            continue
+        fechados += 1
+        if u == alvo:
+            break
+        for v, w in vizinhos(u):
+            novo = custo_atual + w
+            if novo < custo_minimo.get(v, INF):
+                hv = h(v)
+                if hv == INF:
+                    continue  # v não alcança o destino
+                custo_minimo[v] = novo
+                no_predecessor[v] = u
+                heappush(fila, (novo + hv, novo, v))
+
+    if alvo not in custo_minimo:
+        return ShortestPathResult(origem, destino, INF, [], settled=fechados)
+
+    caminho = [alvo]
+    while caminho[-1] != fonte:
+        caminho.append(no_predecessor[caminho[-1]])
+    caminho.reverse()
+    return ShortestPathResult(
+        origem, destino, custo_minimo[alvo], [nome(v) for v in caminho], settled=fechados
+    )
+
+
+def alt_path(grafo, origem: str, destino: str, landmarks: Landmarks, weight: str | None = None) -> List[str]:
+    return alt_shortest_path(grafo, origem, destino, landmarks, weight).path
+
+
+def alt_path_length(grafo, origem: str, destino: str, landmarks: Landmarks, weight: str | None = None) -> float:
+    return alt_shortest_path(grafo, origem, destino, landmarks, weight).cost
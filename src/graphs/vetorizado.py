@@ -0,0 +1,401 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .graph import Graph, FrozenGraph
+from .algorithms import NegativeCycle, NodeNotFound
+
+# Bellman–Ford vetorizado: os arcos viram vetores numpy (fonte, alvo, peso)
+# ordenados por alvo, e cada rodada relaxa todos de uma vez:
+#   candidato = dist[fonte] + peso
+#   novo[v]   = min(dist[v], min dos candidatos dos arcos que chegam em v)
+# (o mínimo por alvo é um minimum.reduceat sobre os grupos de arcos).
+# Para quando uma rodada não muda nada; se a rodada n ainda melhora alguma
+# distância há ciclo negativo alcançável a partir da origem.
+
+
+class ArcosPorAlvo:
+    """
+    Arcos do FrozenGraph agrupados por alvo. fontes/alvos/pesos estão na
+    ordem dos grupos; inicios[k] é o primeiro arco do grupo do nó
+    com_entrada[k] (só nós com pelo menos um arco chegando). saida e
+    destinos são o CSR de saída original (offsets/alvos do FrozenGraph).
+    """
+
+    def __init__(self, grafo: FrozenGraph, weight: str | None = None):
+        n = grafo.ordem()
+        offsets = np.frombuffer(grafo.offsets, dtype=np.int64)
+        alvos = np.frombuffer(grafo.alvos, dtype=np.int32).astype(np.int64)
+        pesos = np.frombuffer(grafo._pesos_da_coluna(weight), dtype=np.float64)
+        fontes = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets))
+
+        ordem = np.argsort(alvos, kind="stable")
+        self.n = n
+        self.nomes = grafo.nomes
+        self.indice = grafo.indice
+        self.saida = offsets
+        self.destinos = alvos
+        self.fontes = fontes[ordem]
+        self.alvos = alvos[ordem]
+        self.pesos = pesos[ordem]
+        if len(ordem):
+            self.inicios = np.flatnonzero(np.r_[True, self.alvos[1:] != self.alvos[:-1]])
+        else:
+            self.inicios = np.array([], dtype=np.int64)
+        self.com_entrada = self.alvos[self.inicios]
+        # grupo de cada arco (posição em com_entrada)
+        self.grupo = np.repeat(np.arange(len(self.inicios)), np.diff(np.r_[self.inicios, len(ordem)]))
+
+
+def _coluna(grafo, weight) -> str | None:
+    if callable(weight):
+        raise TypeError("Bellman–Ford vetorizado só aceita colunas de peso do grafo, não funções.")
+    if weight is None or weight == "weight" or weight == grafo.nome_peso:
+        return None
+    if not grafo.tem_coluna(weight):
+        raise KeyError(f"Coluna de peso inexistente: {weight}")
+    return weight
+
+
+def _ciclo(arcos: ArcosPorAlvo, pred: np.ndarray, inicios) -> Tuple[List[int], float | None]:
+    # Ciclo no grafo de predecessores (existe quando a rodada n ainda melhora):
+    # sobe pelos predecessores a partir de cada nó melhorado até repetir um nó
+    # desta subida (ciclo) ou chegar em nó já visto / sem predecessor.
+    visto = np.zeros(arcos.n, dtype=bool)
+    for v in inicios:
+        v = int(v)
+        subida: Dict[int, int] = {}
+        while v not in subida and not visto[v] and pred[v] >= 0:
+            subida[v] = len(subida)
+            v = int(arcos.fontes[pred[v]])
+        if v in subida:
+            ciclo = [v]
+            custo = 0.0
+            u = v
+            while True:
+                k = pred[u]
+                custo += float(arcos.pesos[k])
+                u = int(arcos.fontes[k])
+                ciclo.append(u)
+                if u == v:
+                    break
+            ciclo.reverse()
+            return ciclo, custo
+        for u in subida:
+            visto[u] = True
+    return [], None
+
+
+def bellman_ford_vetorizado(
+    G: Graph | FrozenGraph,
+    source: str,
+    target: str | None = None,
+    weight: str | None = "weight",
+    arcos: ArcosPorAlvo | None = None,
+) -> Tuple[Dict[str, float], Dict[str, str | None]]:
+    """
+    Mesmo retorno de algorithms.bellman_ford: (dist, pred) só com os nós
+    alcançados a partir de source. Em ciclo negativo levanta NegativeCycle
+    com o ciclo fechado (primeiro nó repetido no fim) e o custo dele.
+    arcos permite reaproveitar os vetores entre várias origens.
+    """
+    if not G.tem_no(source):
+        raise NodeNotFound(source)
+    if isinstance(G, Graph):
+        G = G.congelar()
+    if arcos is None:
+        arcos = ArcosPorAlvo(G, _coluna(G, weight))
+
+    n = arcos.n
+    fonte = G.indice[source]
+    dist = np.full(n, np.inf)
+    dist[fonte] = 0.0
+    pred = np.full(n, -1, dtype=np.int64)  # arco (posição em arcos) que chega no nó
+    com_entrada = arcos.com_entrada
+
+    for rodada in range(1, n + 1):
+        candidatos = dist[arcos.fontes] + arcos.pesos
+        if not len(candidatos):
+            break
+        minimos = np.minimum.reduceat(candidatos, arcos.inicios)
+        melhorou = minimos < dist[com_entrada]
+        if not melhorou.any():
+            break
+
+        # primeiro arco de cada grupo melhorado que atinge o mínimo
+        acerta = melhorou[arcos.grupo] & (candidatos == minimos[arcos.grupo])
+        posicoes = np.flatnonzero(acerta)
+        grupos, primeiro = np.unique(arcos.grupo[posicoes], return_index=True)
+        nos = com_entrada[grupos]
+        dist[nos] = minimos[grupos]
+        pred[nos] = posicoes[primeiro]
+
+        if rodada == n:
+            ciclo, custo = _ciclo(arcos, pred, nos)
+            nome = arcos.nomes
+            raise NegativeCycle(
+                f"Ciclo negativo detectado (distâncias ainda caem na rodada {n})",
+                path=[nome[v] for v in ciclo],
+                cost=custo,
+            )
+
+    nome = arcos.nomes
+    alcancados = np.flatnonzero(np.isfinite(dist))
+    dist_nomes = {nome[v]: float(dist[v]) for v in alcancados}
+    pred_nomes: Dict[str, str | None] = {}
+    for v in alcancados:
+        k = pred[v]
+        pred_nomes[nome[v]] = None if k < 0 else nome[arcos.fontes[k]]
+    return dist_nomes, pred_nomes
+
+
+# BFS por níveis com direção otimizada (Beamer): a fronteira e os visitados
+# são máscaras booleanas sobre o CSR. Cada nível é expandido
+#   - de cima para baixo: todos os arcos de saída da fronteira de uma vez;
+#   - de baixo para cima: cada nó não visitado procura um arco de entrada
+#     vindo da fronteira; a k-ésima rodada testa o k-ésimo arco de entrada
+#     dos nós que ainda não acharam pai, então a busca para cedo como no
+#     algoritmo original.
+# Troca para baixo-para-cima quando os arcos da fronteira (m_f) passam de
+# m_u / alpha (m_u = arcos de entrada dos não visitados) e volta quando a
+# fronteira encolhe para menos de n / beta nós.
+
+ALPHA_BFS = 14
+BETA_BFS = 24
+
+
+def _de_cima(fronteira, offsets, alvos, graus, visitado):
+    tamanhos = graus[fronteira]
+    total = int(tamanhos.sum())
+    if total == 0:
+        return fronteira[:0], fronteira[:0]
+    # posições dos arcos de cada nó da fronteira, na ordem da fronteira
+    desloc = offsets[fronteira] - (np.cumsum(tamanhos) - tamanhos)
+    arcos = np.repeat(desloc, tamanhos) + np.arange(total)
+    alvos_f = alvos[arcos]
+    fontes_f = np.repeat(fronteira, tamanhos)
+    novos = ~visitado[alvos_f]
+    alvos_f, fontes_f = alvos_f[novos], fontes_f[novos]
+    # primeira descoberta de cada nó, na ordem da descoberta (como a fila)
+    nos, primeiro = np.unique(alvos_f, return_index=True)
+    ordem = np.argsort(primeiro, kind="stable")
+    return nos[ordem], fontes_f[primeiro[ordem]]
+
+
+def _de_baixo(fronteira, r_offsets, r_fontes, graus_entrada, visitado, n):
+    na_fronteira = np.zeros(n, dtype=bool)
+    na_fronteira[fronteira] = True
+    candidatos = np.flatnonzero(~visitado & (graus_entrada > 0))
+    pos = r_offsets[candidatos]
+    fim = r_offsets[candidatos + 1]
+    achados, pais = [], []
+    while len(candidatos):
+        u = r_fontes[pos]
+        acertou = na_fronteira[u]
+        achados.append(candidatos[acertou])
+        pais.append(u[acertou])
+        pos = pos + 1
+        segue = ~acertou & (pos < fim)
+        candidatos, pos, fim = candidatos[segue], pos[segue], fim[segue]
+    if not achados:
+        return fronteira[:0], fronteira[:0]
+    nos, pais = np.concatenate(achados), np.concatenate(pais)
+    # ordena pela posição do pai na fronteira (empate pelo id)
+    posto = np.empty(n, dtype=np.int64)
+    posto[fronteira] = np.arange(len(fronteira))
+    ordem = np.lexsort((nos, posto[pais]))
+    return nos[ordem], pais[ordem]
+
+
+def bfs_direcional(
+    G: Graph | FrozenGraph,
+    source: str,
+    pais: bool = False,
+    alpha: float = ALPHA_BFS,
+    beta: float = BETA_BFS,
+) -> Tuple[List[List[str]], Dict[str, str | None] | None]:
+    """
+    (camadas, pais): camadas como em bfs_ordem_camadas_ciclos_dir (camada k
+    = nós a k arcos de source, com os mesmos nós). Nos níveis expandidos de
+    cima para baixo a ordem dentro da camada é a mesma da fila; nos de
+    baixo para cima segue a posição do pai na camada anterior. pais=True
+    devolve também o pai de cada nó na árvore da busca (source -> None).
+    """
+    if not G.tem_no(source):
+        raise NodeNotFound(source)
+    if isinstance(G, Graph):
+        G = G.congelar()
+
+    n = G.ordem()
+    offsets = np.frombuffer(G.offsets, dtype=np.int64)
+    alvos = np.frombuffer(G.alvos, dtype=np.int32)
+    r_offsets, r_fontes, _ = G.csr_reverso()
+    r_offsets = np.frombuffer(r_offsets, dtype=np.int64)
+    r_fontes = np.frombuffer(r_fontes, dtype=np.int32)
+    graus = np.diff(offsets)
+    graus_entrada = np.diff(r_offsets)
+
+    fonte = G.indice[source]
+    visitado = np.zeros(n, dtype=bool)
+    visitado[fonte] = True
+    pai = np.full(n, -1, dtype=np.int64)
+    fronteira = np.array([fonte], dtype=np.int64)
+    camadas_ids = [fronteira]
+
+    m_u = int(graus_entrada.sum()) - int(graus_entrada[fonte])
+    de_baixo = False
+    anterior = 0
+    while len(fronteira):
+        m_f = int(graus[fronteira].sum())
+        if not de_baixo and m_f * alpha > m_u:
+            de_baixo = True
+        elif de_baixo and len(fronteira) < n / beta and len(fronteira) < anterior:
+            de_baixo = False
+        anterior = len(fronteira)
+
+        if de_baixo:
+            nos, pais_nivel = _de_baixo(fronteira, r_offsets, r_fontes, graus_entrada, visitado, n)
+        else:
+            nos, pais_nivel = _de_cima(fronteira, offsets, alvos, graus, visitado)
+        if not len(nos):
+            break
+        visitado[nos] = True
+        pai[nos] = pais_nivel
+        m_u -= int(graus_entrada[nos].sum())
+        camadas_ids.append(nos)
+        fronteira = nos.astype(np.int64)
+
+    nome = G.nomes
+    camadas = [[nome[v] for v in camada.tolist()] for camada in camadas_ids]
+    if not pais:
+        return camadas, None
+    arvore: Dict[str, str | None] = {source: None}
+    for camada in camadas_ids[1:]:
+        for v in camada.tolist():
+            arvore[nome[v]] = nome[pai[v]]
+    return camadas, arvore
+
+
+# BFS de várias fontes em paralelo de bits (MS-BFS): até 64 fontes por
+# vez, com uma palavra uint64 por nó em que o bit b diz se a fonte b já
+# viu o nó (visto) ou o tem na fronteira. Um nível é um OU das fronteiras
+# dos predecessores de cada nó, sem os bits já vistos.
+#
+# Fronteira pequena: só os arcos que saem dela (CSR de saída) entram no
+# OU (bitwise_or.at nos alvos). Fronteira grande (seus arcos passam de
+# 1/8 de E): um bitwise_or.reduceat sobre todos os arcos agrupados por
+# alvo sai mais barato que o at. Assim cada nível custa
+# O(arcos da fronteira) salvo nos níveis largos, e não O(E).
+
+MAX_FONTES_MSBFS = 64
+
+
+def ms_bfs_distancias(
+    G: Graph | FrozenGraph,
+    fontes: List[str],
+    arcos: ArcosPorAlvo | None = None,
+) -> np.ndarray:
+    """
+    Distâncias em arcos de cada fonte (até 64) para todos os nós: matriz
+    int32 (fontes x nós, ids do FrozenGraph), -1 onde não alcança.
+    """
+    if len(fontes) > MAX_FONTES_MSBFS:
+        raise ValueError(f"MS-BFS aceita até {MAX_FONTES_MSBFS} fontes por vez.")
+    for fonte in fontes:
+        if not G.tem_no(fonte):
+            raise NodeNotFound(fonte)
+    if isinstance(G, Graph):
+        G = G.congelar()
+    if arcos is None:
+        arcos = ArcosPorAlvo(G)
+
+    n, k = arcos.n, len(fontes)
+    dist = np.full((k, n), -1, dtype=np.int32)
+    visto = np.zeros(n, dtype=np.uint64)
+    for b, fonte in enumerate(fontes):
+        i = G.indice[fonte]
+        visto[i] |= np.uint64(1) << np.uint64(b)
+        dist[b, i] = 0
+    fronteira = visto.copy()
+    bits = np.uint64(1) << np.arange(k, dtype=np.uint64)
+
+    saida, destinos = arcos.saida, arcos.destinos
+    limite = len(destinos) // 8
+    nivel = 0
+    ativos = np.flatnonzero(fronteira)
+    while len(arcos.inicios) and len(ativos):
+        nivel += 1
+        proxima = np.zeros(n, dtype=np.uint64)
+        graus = saida[ativos + 1] - saida[ativos]
+        total = int(graus.sum())
+        if total > limite:
+            proxima[arcos.com_entrada] = np.bitwise_or.reduceat(fronteira[arcos.fontes], arcos.inicios)
+        elif total:
+            # posições dos arcos de saída dos ativos no CSR
+            primeiros = np.repeat(saida[ativos] - np.cumsum(graus) + graus, graus)
+            posicoes = primeiros + np.arange(total)
+            np.bitwise_or.at(proxima, destinos[posicoes], np.repeat(fronteira[ativos], graus))
+        proxima &= ~visto
+        visto |= proxima
+        fronteira = proxima
+
+        nos = ativos = np.flatnonzero(proxima)
+        if len(nos):
+            # fonte b alcança os nós com o bit b ligado neste nível
+            acertos = (proxima[nos][None, :] & bits[:, None]) != 0
+            linhas, colunas = np.nonzero(acertos)
+            dist[linhas, nos[colunas]] = nivel
+    return dist
+
+
+def ms_bfs(
+    G: Graph | FrozenGraph,
+    fontes: List[str],
+) -> List[Tuple[List[List[str]], Dict[str, int]]]:
+    """
+    (camadas, distâncias) de cada fonte, na ordem de fontes, com lotes de
+    64 fontes por passada. As camadas têm os mesmos nós das de
+    bfs_ordem_camadas_ciclos_dir, em ordem de id dentro de cada camada.
+    """
+    if isinstance(G, Graph):
+        G = G.congelar()
+    arcos = ArcosPorAlvo(G)
+    nome = G.nomes
+    resultados = []
+    for inicio in range(0, len(fontes), MAX_FONTES_MSBFS):
+        dist = ms_bfs_distancias(G, fontes[inicio:inicio + MAX_FONTES_MSBFS], arcos)
+        for linha in dist:
+            alcancados = np.flatnonzero(linha >= 0)
+            niveis = linha[alcancados]
+            ordem = np.lexsort((alcancados, niveis))
+            camadas: List[List[str]] = [[] for _ in range(int(niveis.max()) + 1)]
+            for v, d in zip(alcancados[ordem].tolist(), niveis[ordem].tolist()):
+                camadas[d].append(nome[v])
+            resultados.append((camadas, {nome[v]: int(d) for v, d in zip(alcancados.tolist(), niveis.tolist())}))
+    return resultados
+
+
+def perfis_de_camadas(
+    G: Graph | FrozenGraph,
+    fontes: List[str] | None = None,
+) -> Dict[str, List[int]]:
+    # tamanho de cada camada da BFS de cada fonte (todas por padrão)
+    if isinstance(G, Graph):
+        G = G.congelar()
+    fontes = G.nos() if fontes is None else list(fontes)
+    arcos = ArcosPorAlvo(G)
+    perfis: Dict[str, List[int]] = {}
+    for inicio in range(0, len(fontes), MAX_FONTES_MSBFS):
+        lote = fontes[inicio:inicio + MAX_FONTES_MSBFS]
+        dist = ms_bfs_distancias(G, lote, arcos)
+        for fonte, linha in zip(lote, dist):
+            perfis[fonte] = np.bincount(linha[linha >= 0]).tolist()
+    return perfis
+
+
+def excentricidades(
+    G: Graph | FrozenGraph,
+    fontes: List[str] | None = None,
+) -> Dict[str, int]:
+    # maior distância em arcos até um nó alcançável, por fonte
+    return {fonte: len(perfil) - 1 for fonte, perfil in perfis_de_camadas(G, fontes).items()}
@@ -1,7 +1,7 @@
-import csv
 import os
 from typing import Dict
 from src.graphs.graph import Graph
+from src.graphs.io import carregar_grafo as _carregar_dataset
 from src.viz import (
     mapa_cores,
     subgrafo_top10_grau,
@@ -13,47 +13,15 @@ DATA_DIR = "data"
 OUT_DIR = os.path.join("out", "visualizacoesPt1")
 
 
-def _achar_coluna(opcoes, nomes):
-    nomes = [n.strip().lower() for n in nomes or []]
-    for opc in opcoes:
-        if opc in nomes:
-            return opc
-    return None
-
-
 def carregar_grafo() -> Graph:
     """Carrega o grafo a partir do arquivo data/adjacencias_bairros.csv"""
-    G = Graph()
-    caminho = os.path.join(DATA_DIR, "adjacencias_bairros.csv")
-    if not os.path.exists(caminho):
-        raise FileNotFoundError(f"Arquivo não encontrado: {caminho}")
-
-    with open(caminho, encoding="utf-8") as f:
-        leitor = csv.DictReader(f)
-        if not leitor.fieldnames:
-            raise ValueError("O CSV de adjacências está vazio ou sem cabeçalho.")
-
-        col_origem = _achar_coluna(["bairro_origem", "origem", "source"], leitor.fieldnames)
-        col_destino = _achar_coluna(["bairro_destino", "destino", "target"], leitor.fieldnames)
-        col_peso = _achar_coluna(["peso", "weight"], leitor.fieldnames)
-
-        if not col_origem or not col_destino:
-            raise ValueError("Colunas de origem/destino não encontradas.")
-
-        for linha in leitor:
-            u = (linha.get(col_origem) or "").strip().lower()
-            v = (linha.get(col_destino) or "").strip().lower()
-            if not u or not v:
-                continue
-            peso = 1.0
-            if col_peso and linha.get(col_peso):
-                try:
-                    peso = float(linha[col_peso])
-                except ValueError:
-                    peso = 1.0
-            G.adicionar_aresta(u, v, peso)
-            G.adicionar_aresta(v, u, peso)
-    return G
+    return _carregar_dataset(
+        "bairros",
+        normalizar="minusculas",
+        peso_padrao=1.0,
+        arquivo=os.path.join(DATA_DIR, "adjacencias_bairros.csv"),
+        compilado=False,
+    )
 
 
 def carregar_mapa_bairro_micro() -> Dict[str, str]:
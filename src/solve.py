@@ -1,7 +1,7 @@
 import csv, json, unicodedata, re
 from pathlib import Path
-from .graphs.graph import Graph
-from .graphs.algorithms import dijkstra_path, dijkstra_path_length,  bfs_ordem_camadas_ciclos_dir,  dfs_ordem_camadas_ciclos_dir
+from .graphs.io import carregar_grafo, rotulos_originais
+from .graphs.algorithms import dijkstra_many_to_many,  bfs_ordem_camadas_ciclos_dir,  dfs_ordem_camadas_ciclos_dir
 
 
 def _normalize(nome: str) -> str:
@@ -24,23 +24,14 @@ def calcular_distancias():
     out_dir = base / "out"
     out_dir.mkdir(exist_ok=True)
 
-    # Monta o grafo a partir de adjacencias_bairros.csv
-    G = Graph()
-    with open(data_dir / "adjacencias_bairros.csv", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for r in reader:
-            u = _normalize(r["bairro_origem"])
-            v = _normalize(r["bairro_destino"])
-            w = float(r["peso"])
-            G.adicionar_aresta(u, v, w)
+    # Grafo de adjacencias_bairros.csv com nomes normalizados
+    G = carregar_grafo("bairros", normalizar="sem_acentos", compilado=False)
 
-    # Lê os pares de endereços de enderecos.csv e calcula distâncias
-    resultados = []
+    # Lê os pares de endereços de enderecos.csv
+    linhas = []
     with open(data_dir / "enderecos.csv", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for r in reader:
-            end_x = r["endereco_X"]
-            end_y = r["endereco_Y"]
             bx_raw = r["bairro_X"]
             by_raw = r["bairro_Y"]
 
@@ -52,17 +43,27 @@ def calcular_distancias():
             if not G.tem_no(by_norm):
                 raise KeyError(f"Bairro_Y '{by_raw}' não existe no grafo (normalizado: '{by_norm}').")
 
-            custo = dijkstra_path_length(G, bx_norm, by_norm)
-            caminho = dijkstra_path(G, bx_norm, by_norm)
+            linhas.append((r, bx_norm, by_norm))
 
-            resultados.append([end_x, end_y, bx_raw, by_raw, custo, " -> ".join(caminho)])
+    # Uma busca por bairro de origem, resultados na ordem do arquivo
+    rotas = dijkstra_many_to_many(G, [(bx, by) for _r, bx, by in linhas])
 
-            json_name = f"percurso_{_slug(bx_raw)}_{_slug(by_raw)}.json"
-            with open(out_dir / json_name, "w", encoding="utf-8") as jf:
-                json.dump(
-                    {"origem": bx_raw, "destino": by_raw, "custo": custo, "caminho": caminho},
-                    jf, ensure_ascii=False, indent=2
-                )
+    resultados = []
+    for (r, _bx, _by), rota in zip(linhas, rotas):
+        end_x = r["endereco_X"]
+        end_y = r["endereco_Y"]
+        bx_raw = r["bairro_X"]
+        by_raw = r["bairro_Y"]
+        custo, caminho = rota.cost, rota.path
+
+        resultados.append([end_x, end_y, bx_raw, by_raw, custo, " -> ".join(caminho)])
+
+        json_name = f"percurso_{_slug(bx_raw)}_{_slug(by_raw)}.json"
+        with open(out_dir / json_name, "w", encoding="utf-8") as jf:
+            json.dump(
+                {"origem": bx_raw, "destino": by_raw, "custo": custo, "caminho": caminho},
+                jf, ensure_ascii=False, indent=2
+            )
 
     with open(out_dir / "distancias_enderecos.csv", "w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
@@ -79,27 +80,9 @@ def gerar_grafo_interativo():
     out_dir = base / "out"
     out_dir.mkdir(exist_ok=True)
 
-    G = Graph()
-    label_map = {}
-    adj = {}
-
-    with open(data_dir / "adjacencias_bairros.csv", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for r in reader:
-            u_raw = r["bairro_origem"].strip()
-            v_raw = r["bairro_destino"].strip()
-            w = float(r["peso"])
-
-            u = _normalize(u_raw)
-            v = _normalize(v_raw)
-
-            G.adicionar_aresta(u, v, w)
-
-            label_map.setdefault(u, u_raw)
-            label_map.setdefault(v, v_raw)
-
-            adj.setdefault(u, []).append((v, w))
-            adj.setdefault(v, []).append((u, w))
+    G = carregar_grafo("bairros", normalizar="sem_acentos", compilado=False)
+    label_map = rotulos_originais("bairros", normalizar="sem_acentos")
+    adj = {u: G.vizinhos(u) for u in G.nos()}
 
     microrregioes = {}
     try:
@@ -496,26 +479,7 @@ def bfs():
     out_dir = base /"out"/ "parte2"/ "BFS"
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    G = Graph()
-    with open(data_dir / "LRH2016_00_Base_Completa.csv", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            mun_a = (row.get("nomemun_a") or "").strip()
-            mun_b = (row.get("nomemun_b") or "").strip()
-
-            if not mun_a or not mun_b:
-                continue
-
-            custo_str = (row.get("custo") or "").strip()
-            if not custo_str:
-                continue
-
-            try:
-                custo = float(custo_str)
-            except ValueError:
-                continue
-
-            G.adicionar_aresta(mun_a, mun_b, custo)
+    G = carregar_grafo("lrh2016", peso="custo")
 
     with open(data_dir / "enderecos_parte2.csv", encoding="utf-8") as f:
         reader = csv.DictReader(f)
@@ -567,26 +531,7 @@ def dfs():
     out_dir = base / "out" / "parte2"/ "DFS"
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    G = Graph()
-    with open(data_dir / "LRH2016_00_Base_Completa.csv", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            mun_a = (row.get("nomemun_a") or "").strip()
-            mun_b = (row.get("nomemun_b") or "").strip()
-
-            if not mun_a or not mun_b:
-                continue
-
-            custo_str = (row.get("custo") or "").strip()
-            if not custo_str:
-                continue
-
-            try:
-                custo = float(custo_str)
-            except ValueError:
-                continue
-
-            G.adicionar_aresta(mun_a, mun_b, custo)
+    G = carregar_grafo("lrh2016", peso="custo")
 
     with open(data_dir / "enderecos_parte2.csv", encoding="utf-8") as f:
         reader = csv.DictReader(f)
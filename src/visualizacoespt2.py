@@ -5,6 +5,8 @@ import os
 from pyvis.network import Network
 import numpy as np
 import seaborn as sns
+from src.graphs.io import carregar_grafo
+from src.graphs.apsp import matriz_distancias
 
 def load_and_plot_degrees(file_path, output_path):
     df = pd.read_csv(file_path)
@@ -35,34 +37,23 @@ def load_and_plot_degrees(file_path, output_path):
     
     plt.close()
 
-file_path = 'data/dataset_parte2/LRH2016_00_Base_Completa.csv'
-
-output_path = 'out/visualizacoespt2'
-
-load_and_plot_degrees(file_path, output_path)
-
 def create_distance_heatmap(file_path, output_path):
-    df = pd.read_csv(file_path)
-    
-    edges = df[['uf_a', 'codmundv_a', 'nomemun_a', 'uf_b', 'codmundv_b', 'nomemun_b', 'tempo']]
-    edges.columns = ['origem_uf', 'origem_cod', 'origem_nome', 'destino_uf', 'destino_cod', 'destino_nome', 'peso']
-    
-    nodes = pd.concat([edges['origem_nome'], edges['destino_nome']]).unique()
-    node_idx = {node: idx for idx, node in enumerate(nodes)}
-    
-    dist_matrix = np.zeros((len(nodes), len(nodes)))
-    for _, row in edges.iterrows():
-        origem_idx = node_idx[row['origem_nome']]
-        destino_idx = node_idx[row['destino_nome']]
-        dist_matrix[origem_idx, destino_idx] = row['peso']
+    # distâncias de caminho mínimo (tempo) entre todos os pares, não só os arcos.
+    # O tempo do LRH tem arcos <= 0 (inválidos para Dijkstra): ficam de fora.
+    G = carregar_grafo(
+        "lrh2016", peso="tempo", direcionado=True, descartar_nao_positivos=True, arquivo=file_path
+    )
+
+    os.makedirs(output_path, exist_ok=True)
+    matriz_file = os.path.join(output_path, 'distancias_tempo.npy')
+    dist_matrix, nodes, _ = matriz_distancias(G, matriz_file)
     
     plt.figure(figsize=(12, 8))
-    sns.heatmap(dist_matrix, xticklabels=nodes, yticklabels=nodes, cmap="YlGnBu", annot=False, fmt="g")
+    sns.heatmap(dist_matrix, mask=np.isinf(dist_matrix), xticklabels=nodes, yticklabels=nodes, cmap="YlGnBu", annot=False, fmt="g")
     plt.title('Heatmap de Distâncias (Tempo) entre os Nós', fontsize=16)
     plt.xlabel('Destino', fontsize=12)
     plt.ylabel('Origem', fontsize=12)
     
-    os.makedirs(output_path, exist_ok=True)
     output_file = os.path.join(output_path, 'heatmap_distancias.png')
     
     plt.savefig(output_file)
@@ -71,12 +62,6 @@ def create_distance_heatmap(file_path, output_path):
     
     plt.close()
 
-file_path = 'data/dataset_parte2/LRH2016_00_Base_Completa.csv'
-
-output_path = 'out/visualizacoespt2'
-create_distance_heatmap(file_path, output_path)
-
-
 def load_and_create_graph(file_path, output_path):
     df = pd.read_csv(file_path)
     
@@ -96,8 +81,12 @@ def load_and_create_graph(file_path, output_path):
     
     print(f'Grafo salvo em: {output_file}')
 
-file_path = 'data/dataset_parte2/LRH2016_00_Base_Completa.csv'
-
-output_path = 'out/visualizacoespt2'
+# o pool de processos de matriz_distancias reimporta este módulo quando não
+# usa fork: nada pode rodar no import
+if __name__ == "__main__":
+    file_path = 'data/dataset_parte2/LRH2016_00_Base_Completa.csv'
+    output_path = 'out/visualizacoespt2'
 
-load_and_create_graph(file_path, output_path)
+    load_and_plot_degrees(file_path, output_path)
+    create_distance_heatmap(file_path, output_path)
+    load_and_create_graph(file_path, output_path)
@@ -140,9 +140,12 @@ def subgrafo_top10_grau(G, arquivo_html: str = os.path.join(OUT_DIR, "subgrafo_t
         grau = graus[bairro]
         net.add_node(bairro, label=f"{bairro} (grau={grau})", size=20 + 3 * grau, color="#ff7f0e")
 
-    for u, v, peso in _iterar_arestas(G):
-        if u in top and v in top:
-            net.add_edge(u, v, title=f"Peso: {peso}")
+    # view do subgrafo: só as arestas entre os 10 bairros, sem varrer o grafo
+    S = G.subgraph_view(top)
+    for u in top:
+        for v, peso in S.vizinhos_view(u):
+            if u <= v:
+                net.add_edge(u, v, title=f"Peso: {float(peso)}")
 
     net.force_atlas_2based()
     _salvar_html(net, arquivo_html)
@@ -186,14 +189,7 @@ def ranking_densidade_microrregiao(
         V = len(ego)
         if V < 2:
             return 0.0
-        E = 0
-        ego = list(ego)
-        pos = {n: i for i, n in enumerate(ego)}
-        mat = [[0] * V for _ in range(V)]
-        for a, b, _ in _iterar_arestas(G):
-            if a in pos and b in pos and mat[pos[a]][pos[b]] == 0:
-                mat[pos[a]][pos[b]] = mat[pos[b]][pos[a]] = 1
-                E += 1
+        E = G.subgraph_view(ego).tamanho()
         return (2 * E) / (V * (V - 1))
 
     dens_por_bairro = {b: densidade_ego(b) for b in getattr(G, "adj", {}).keys()}
@@ -0,0 +1,436 @@
+import argparse
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from src.graphs.io import DATASETS, carregar_grafo, ler_grafo
+from src.graphs.algorithms import (
+    NegativeCycle,
+    NoPath,
+    bellman_ford_path_length,
+    bfs_ordem_camadas_ciclos_dir,
+    dijkstra_shortest_path,
+)
+from src.graphs.landmarks import alt_shortest_path, landmarks_do_cache
+from src.graphs.contraction import ch_shortest_path, hierarquia_do_cache, preparar_hierarquia
+from src.graphs.hub_labels import hub_path_length, preparar_rotulos, rotulos_do_cache
+from src.graphs.apsp import matriz_distancias
+from src.graphs.vetorizado import bfs_direcional, excentricidades, ms_bfs
+from src.graphs.alcance import alcance_do_cache
+
+
+def _cronometrar(fn, repeticoes: int = 1):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        resultado = fn()
+    tempo = (time.perf_counter() - inicio) / repeticoes
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, tempo, pico
+
+
+def _comparar(base, rotas) -> str:
+    # custos têm de bater sempre; caminhos só diferem em empates de custo
+    custos = all(a.cost == b.cost for a, b in zip(base, rotas))
+    caminhos = sum(a.path == b.path for a, b in zip(base, rotas))
+    return f"custos iguais: {custos} | caminhos iguais: {caminhos}/{len(base)}"
+
+
+#  Vizinhos: cópia (vizinhos) x view (vizinhos_view)
+def bench_vizinhos(repeticoes: int = 20):
+    G = carregar_grafo("lrh2016", peso="tempo", direcionado=True, compilado=False)
+    F = carregar_grafo("lrh2016", peso="tempo", direcionado=True)
+    nos = G.nos()
+
+    def varrer(fn):
+        def rodar():
+            total = 0.0
+            for u in nos:
+                for _v, w in fn(u):
+                    total += w
+            return total
+        return rodar
+
+    # bytes alocados por varredura completa só pelos contêineres de vizinhos
+    bytes_lista = sum(sys.getsizeof(G.vizinhos(u)) for u in nos)
+    bytes_view = sum(sys.getsizeof(G.vizinhos_view(u)) for u in nos)
+
+    def varrer_ids():
+        total = 0.0
+        for i in range(F.ordem()):
+            for _v, w in F.vizinhos_ids(i):
+                total += w
+        return total
+
+    print(f"Grafo: {G.ordem()} nós, {G.tamanho()} arcos | {repeticoes} varreduras")
+    casos = [
+        ("Graph.vizinhos (lista)", varrer(G.vizinhos), bytes_lista),
+        ("Graph.vizinhos_view", varrer(G.vizinhos_view), bytes_view),
+        ("FrozenGraph.vizinhos_ids", varrer_ids, None),
+    ]
+
+    for nome, fn, alocado in casos:
+        _, tempo, pico = _cronometrar(fn, repeticoes)
+        extra = f" | contêineres: {alocado / 1024:.1f} KiB/varredura" if alocado is not None else ""
+        print(f"  {nome:<28} {tempo * 1000:8.2f} ms/varredura | pico {pico / 1024:.1f} KiB{extra}")
+
+    # pertinência: lista de nós x O(1)
+    amostra = nos[:: max(1, len(nos) // 200)]
+    _, t_lista, _ = _cronometrar(lambda: [u in G.nos() for u in amostra])
+    _, t_o1, _ = _cronometrar(lambda: [u in G for u in amostra])
+    print(f"  'no in G.nos()' x 'no in G' ({len(amostra)} consultas): "
+          f"{t_lista * 1000:.2f} ms x {t_o1 * 1000:.3f} ms")
+
+
+#  Ingestão: DictReader linha a linha x faixas paralelas com numpy
+def bench_ingestao(arquivo=None, processos=None):
+    from src.graphs.ingest import ingerir_csv
+
+    opcoes = {"peso": "custo", "colunas": ("tempo",), "direcionado": True}
+
+    inicio = time.perf_counter()
+    referencia = ler_grafo("lrh2016", arquivo=arquivo, **opcoes).congelar()
+    t_csv = time.perf_counter() - inicio
+    print(f"DictReader + congelar: {t_csv:.2f} s ({referencia.ordem()} nós, {referencia.tamanho()} arcos)")
+
+    processos = processos or os.cpu_count() or 1
+    caminho = arquivo or DATASETS["lrh2016"]["arquivo"]
+    # faixas pequenas o bastante para ocupar todos os processos
+    bloco = max(64 << 10, os.path.getsize(caminho) // processos + 1)
+
+    for n in (1, processos):
+        grafo, rel = ingerir_csv("lrh2016", arquivo=arquivo, processos=n, tamanho_bloco=bloco, **opcoes)
+        igual = list(grafo.alvos) == list(referencia.alvos) and list(grafo.pesos) == list(referencia.pesos)
+        pico = rel["pico_memoria_bytes"]
+        pico_txt = f"{pico / 2**20:.0f} MiB" if pico is not None else "n/d"
+        print(f"ingerir_csv ({rel['processos']} processo(s), {rel['faixas']} faixas): "
+              f"{rel['segundos']:.2f} s | {rel['linhas_por_segundo']:,.0f} linhas/s | "
+              f"pico {pico_txt} | igual ao DictReader: {igual}")
+
+
+#  Dijkstra unidirecional x bidirecional em pares origem-destino aleatórios
+def bench_bidirecional(pares: int = 200, semente: int = 0):
+    G = carregar_grafo("lrh2016", peso="tempo", direcionado=True, descartar_nao_positivos=True)
+    nos = G.nos()
+    sorteio = random.Random(semente)
+    amostra = [tuple(sorteio.sample(nos, 2)) for _ in range(pares)]
+
+    print(f"Grafo: {G.ordem()} nós, {G.tamanho()} arcos | {pares} pares (semente {semente})")
+    totais = {}
+    resultados = {}
+    for bidirecional in (False, True):
+        inicio = time.perf_counter()
+        rotas = [dijkstra_shortest_path(G, s, t, bidirecional=bidirecional) for s, t in amostra]
+        tempo = time.perf_counter() - inicio
+        fechados = sum(r.settled for r in rotas)
+        totais[bidirecional] = (tempo, fechados)
+        resultados[bidirecional] = rotas
+        nome = "bidirecional" if bidirecional else "unidirecional"
+        print(f"  {nome:<14} {tempo * 1000 / pares:8.2f} ms/par | "
+              f"{fechados / pares:10.1f} nós fechados/par")
+
+    (t_uni, f_uni), (t_bi, f_bi) = totais[False], totais[True]
+    print(f"  ganho: {t_uni / t_bi:.2f}x no tempo, {f_uni / max(f_bi, 1):.2f}x em nós fechados | "
+          f"{_comparar(resultados[False], resultados[True])}")
+
+
+#  ALT (A* + landmarks) x dijkstra_path em pares origem-destino aleatórios
+def bench_alt(pares: int = 200, semente: int = 0, k: int = 16):
+    G = carregar_grafo("lrh2016", peso="tempo", direcionado=True, descartar_nao_positivos=True)
+    nos = G.nos()
+    sorteio = random.Random(semente)
+    amostra = [tuple(sorteio.sample(nos, 2)) for _ in range(pares)]
+
+    print(f"Grafo: {G.ordem()} nós, {G.tamanho()} arcos | {pares} pares (semente {semente})")
+    for selecao in ("farthest", "avoid"):
+        inicio = time.perf_counter()
+        landmarks = landmarks_do_cache(G, k=k, selecao=selecao)
+        t_prep = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        base = [dijkstra_shortest_path(G, s, t) for s, t in amostra]
+        t_dij = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        rotas = [alt_shortest_path(G, s, t, landmarks) for s, t in amostra]
+        t_alt = time.perf_counter() - inicio
+
+        f_dij = sum(r.settled for r in base)
+        f_alt = sum(r.settled for r in rotas)
+        iguais = all(a.cost == b.cost for a, b in zip(base, rotas))
+        print(f"  {selecao:<8} k={len(landmarks):<3} tabelas {t_prep:6.2f} s | "
+              f"dijkstra {t_dij * 1000 / pares:7.2f} ms/par, {f_dij / pares:8.1f} fechados | "
+              f"ALT {t_alt * 1000 / pares:7.2f} ms/par, {f_alt / pares:8.1f} fechados | "
+              f"busca {f_dij / max(f_alt, 1):.1f}x menor | custos iguais: {iguais}")
+
+
+#  Contraction Hierarchies x dijkstra_path: pré-processamento e consulta
+def bench_ch(pares: int = 200, semente: int = 0):
+    G = carregar_grafo("lrh2016", peso="tempo", direcionado=True, descartar_nao_positivos=True)
+    nos = G.nos()
+    sorteio = random.Random(semente)
+    amostra = [tuple(sorteio.sample(nos, 2)) for _ in range(pares)]
+    print(f"Grafo: {G.ordem()} nós, {G.tamanho()} arcos | {pares} pares (semente {semente})")
+
+    inicio = time.perf_counter()
+    preparar_hierarquia(G)
+    t_prep = time.perf_counter() - inicio
+    hierarquia_do_cache(G)  # grava em out/cache se ainda não existir
+    inicio = time.perf_counter()
+    hierarquia = hierarquia_do_cache(G)
+    t_carga = time.perf_counter() - inicio
+    print(f"  pré-processamento {t_prep:.2f} s | carga do cache {t_carga * 1000:.1f} ms | "
+          f"{hierarquia.num_atalhos()} atalhos")
+
+    inicio = time.perf_counter()
+    base = [dijkstra_shortest_path(G, s, t) for s, t in amostra]
+    t_dij = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    rotas = [ch_shortest_path(hierarquia, s, t) for s, t in amostra]
+    t_ch = time.perf_counter() - inicio
+
+    print(f"  dijkstra_path {t_dij * 1000 / pares:8.3f} ms/par, {sum(r.settled for r in base) / pares:8.1f} fechados")
+    print(f"  CH            {t_ch * 1000 / pares:8.3f} ms/par, {sum(r.settled for r in rotas) / pares:8.1f} fechados")
+    print(f"  ganho {t_dij / t_ch:.1f}x | {_comparar(base, rotas)}")
+
+
+#  Hub labels (PLL) x dijkstra_path_length: tamanho dos rótulos e consulta
+def bench_pll(pares: int = 200, semente: int = 0):
+    G = carregar_grafo("lrh2016", peso="tempo", direcionado=True, descartar_nao_positivos=True)
+    nos = G.nos()
+    sorteio = random.Random(semente)
+    amostra = [tuple(sorteio.sample(nos, 2)) for _ in range(pares)]
+    print(f"Grafo: {G.ordem()} nós, {G.tamanho()} arcos | {pares} pares (semente {semente})")
+
+    inicio = time.perf_counter()
+    preparar_rotulos(G)
+    t_prep = time.perf_counter() - inicio
+    rotulos_do_cache(G)  # grava em out/cache se ainda não existir
+    inicio = time.perf_counter()
+    rotulos = rotulos_do_cache(G)
+    t_carga = time.perf_counter() - inicio
+    est = rotulos.estatisticas()
+    print(f"  pré-processamento {t_prep:.2f} s | carga do cache {t_carga * 1000:.1f} ms")
+    print(f"  rótulos: {est['media_por_no']:.1f} entradas/nó (máx. {est['maximo_por_no']}) | "
+          f"{est['entradas']} entradas, {est['bytes'] / 2**20:.2f} MiB")
+
+    inicio = time.perf_counter()
+    base = [dijkstra_shortest_path(G, s, t).cost for s, t in amostra]
+    t_dij = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    custos = [hub_path_length(rotulos, s, t) for s, t in amostra]
+    t_pll = time.perf_counter() - inicio
+
+    print(f"  dijkstra_path_length {t_dij * 1e6 / pares:10.1f} µs/par")
+    print(f"  hub labels           {t_pll * 1e6 / pares:10.1f} µs/par")
+    # d(s, h) + d(h, t) soma em outra ordem que o caminho: iguais a menos de arredondamento
+    iguais = all(math.isclose(a, b, rel_tol=1e-12) for a, b in zip(base, custos))
+    print(f"  ganho {t_dij / t_pll:.1f}x | custos iguais: {iguais}")
+
+
+#  Matriz de distâncias (todos para todos): 1 processo x pool
+def bench_apsp(processos=None, origens: int | None = None):
+    G = carregar_grafo("lrh2016", peso="tempo", direcionado=True, descartar_nao_positivos=True)
+    fontes = G.nos()[:origens] if origens else None
+    destino = os.path.join("out", "cache", "bench_apsp.npy")
+    print(f"Grafo: {G.ordem()} nós, {G.tamanho()} arcos | {len(fontes) if fontes else G.ordem()} origens")
+
+    tempos = {}
+    for nome, p in (("1 processo", 1), (f"{processos or os.cpu_count()} processos", processos)):
+        inicio = time.perf_counter()
+        matriz, _, _ = matriz_distancias(G, destino, origens=fontes, processos=p)
+        tempos[nome] = time.perf_counter() - inicio
+        print(f"  {nome:<12} {tempos[nome]:8.2f} s | matriz {matriz.shape[0]}x{matriz.shape[1]} "
+              f"float32, {matriz.nbytes / 2**20:.1f} MiB")
+    t_um, t_pool = tempos.values()
+    print(f"  ganho {t_um / t_pool:.2f}x")
+
+
+#  Bellman–Ford: SPFA (bellman_ford) x rodadas vetorizadas (numpy)
+def bench_bf_vetorizado(pares: int = 20, semente: int = 0):
+    G = carregar_grafo("lrh2016", peso="tempo", direcionado=True)
+    nos = G.nos()
+    sorteio = random.Random(semente)
+    amostra = [tuple(sorteio.sample(nos, 2)) for _ in range(pares)]
+    print(f"Grafo: {G.ordem()} nós, {G.tamanho()} arcos | {pares} pares (semente {semente})")
+
+    def rodar(vetorizado):
+        saida = []
+        for s, t in amostra:
+            try:
+                saida.append(bellman_ford_path_length(G, s, t, vetorizado=vetorizado))
+            except NoPath:
+                saida.append(None)
+            except NegativeCycle:
+                saida.append("ciclo")
+        return saida
+
+    tempos, resultados = {}, {}
+    for nome, vetorizado in (("SPFA", False), ("vetorizado", True)):
+        inicio = time.perf_counter()
+        resultados[nome] = rodar(vetorizado)
+        tempos[nome] = time.perf_counter() - inicio
+        print(f"  {nome:<10} {tempos[nome] * 1000 / pares:9.2f} ms/par")
+
+    iguais = all(
+        a == b or (isinstance(a, float) and isinstance(b, float) and math.isclose(a, b, rel_tol=1e-12))
+        for a, b in zip(resultados["SPFA"], resultados["vetorizado"])
+    )
+    print(f"  ganho {tempos['SPFA'] / tempos['vetorizado']:.2f}x | resultados iguais: {iguais}")
+
+
+#  BFS: fila (bfs_ordem_camadas_ciclos_dir) x níveis vetorizados (só de
+#  cima para baixo e com direção otimizada)
+def bench_bfs_direcional(fontes: int = 20, semente: int = 0):
+    G = carregar_grafo("lrh2016", peso="tempo", direcionado=True)
+    amostra = random.Random(semente).sample(G.nos(), min(fontes, G.ordem()))
+    print(f"Grafo: {G.ordem()} nós, {G.tamanho()} arcos | {len(amostra)} fontes (semente {semente})")
+
+    variantes = {
+        "fila": lambda s: bfs_ordem_camadas_ciclos_dir(G, s, max_cycles=0)[1],
+        "de cima": lambda s: bfs_direcional(G, s, alpha=0)[0],
+        "direcional": lambda s: bfs_direcional(G, s)[0],
+    }
+    tempos, camadas = {}, {}
+    for nome, fn in variantes.items():
+        inicio = time.perf_counter()
+        camadas[nome] = [fn(s) for s in amostra]
+        tempos[nome] = time.perf_counter() - inicio
+        print(f"  {nome:<10} {tempos[nome] * 1000 / len(amostra):8.2f} ms/fonte")
+
+    iguais = all(
+        [sorted(c) for c in a] == [sorted(c) for c in b]
+        for a, b in zip(camadas["fila"], camadas["direcional"])
+    )
+    print(f"  ganho {tempos['fila'] / tempos['direcional']:.1f}x | camadas iguais: {iguais}")
+
+
+def bench_ms_bfs(fontes: int = 64, semente: int = 0, arquivo=None):
+    G = carregar_grafo("lrh2016", peso="tempo", direcionado=True, arquivo=arquivo)
+    amostra = random.Random(semente).sample(G.nos(), min(fontes, G.ordem()))
+    print(f"Grafo: {G.ordem()} nós, {G.tamanho()} arcos | {len(amostra)} fontes (semente {semente})")
+
+    inicio = time.perf_counter()
+    fila = [bfs_ordem_camadas_ciclos_dir(G, s, max_cycles=0)[1] for s in amostra]
+    t_fila = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    lote = [camadas for camadas, _ in ms_bfs(G, amostra)]
+    t_lote = time.perf_counter() - inicio
+    iguais = all(
+        [sorted(c) for c in a] == [sorted(c) for c in b] for a, b in zip(fila, lote)
+    )
+    print(f"  fila   {t_fila * 1000 / len(amostra):8.2f} ms/fonte")
+    print(f"  MS-BFS {t_lote * 1000 / len(amostra):8.2f} ms/fonte")
+    print(f"  ganho {t_fila / t_lote:.1f}x | camadas iguais: {iguais}")
+
+    inicio = time.perf_counter()
+    ecc = excentricidades(G)
+    print(f"  excentricidades de todos os {len(ecc)} nós: {time.perf_counter() - inicio:.2f} s "
+          f"(máxima {max(ecc.values())})")
+
+
+def bench_alcance(pares: int = 200, semente: int = 0):
+    G = carregar_grafo("lrh2016", peso="tempo", direcionado=True)
+    inicio = time.perf_counter()
+    alcance = alcance_do_cache(G)
+    print(f"Índice de alcance: {time.perf_counter() - inicio:.3f} s | {alcance.estatisticas()}")
+
+    rng = random.Random(semente)
+    nos = G.nos()
+    sem_caminho = []
+    for _ in range(pares * 1000):  # limite para grafos (quase) fortemente conexos
+        if len(sem_caminho) == pares or len(nos) < 2:
+            break
+        s, t = rng.sample(nos, 2)
+        if not alcance.alcanca(s, t):
+            sem_caminho.append((s, t))
+    if not sem_caminho:
+        print("  nenhum par sem caminho")
+        return
+    print(f"  {len(sem_caminho)} pares sem caminho (semente {semente})")
+
+    for rotulo, indice in (("sem índice", None), ("com índice", alcance)):
+        G.alcance = indice
+        inicio = time.perf_counter()
+        for s, t in sem_caminho:
+            dijkstra_shortest_path(G, s, t)
+        print(f"  {rotulo:<11} {(time.perf_counter() - inicio) * 1000 / len(sem_caminho):8.3f} ms/par")
+    G.alcance = alcance
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vizinhos", action="store_true",
+                        help="Compara a iteração de vizinhos com cópia e sem cópia.")
+    parser.add_argument("--ingestao", action="store_true",
+                        help="Compara a leitura do CSV linha a linha com a ingestão paralela.")
+    parser.add_argument("--csv", default=None,
+                        help="CSV alternativo no formato LRH para --ingestao e --ms-bfs "
+                             "(padrão: LRH2016_00_Base_Completa.csv).")
+    parser.add_argument("--processos", type=int, default=None)
+    parser.add_argument("--bidirecional", action="store_true",
+                        help="Compara Dijkstra unidirecional e bidirecional em pares aleatórios.")
+    parser.add_argument("--alt", action="store_true",
+                        help="Compara A* com landmarks (ALT) e Dijkstra em pares aleatórios.")
+    parser.add_argument("--landmarks", type=int, default=16)
+    parser.add_argument("--ch", action="store_true",
+                        help="Compara Contraction Hierarchies e Dijkstra (pré-processamento e consulta).")
+    parser.add_argument("--pll", action="store_true",
+                        help="Compara o oráculo de hub labels e Dijkstra (tamanho dos rótulos e consulta).")
+    parser.add_argument("--apsp", action="store_true",
+                        help="Mede a matriz de distâncias de todos para todos com 1 processo e com o pool.")
+    parser.add_argument("--origens", type=int, default=None,
+                        help="Limita --apsp às primeiras N origens.")
+    parser.add_argument("--bf-vetorizado", action="store_true",
+                        help="Compara o Bellman–Ford SPFA e o vetorizado em pares aleatórios.")
+    parser.add_argument("--bfs-direcional", action="store_true",
+                        help="Compara a BFS com fila e a BFS vetorizada com direção otimizada.")
+    parser.add_argument("--ms-bfs", action="store_true",
+                        help="Compara a BFS com fila e a MS-BFS (64 fontes por passada) e mede as excentricidades.")
+    parser.add_argument("--alcance", action="store_true",
+                        help="Mede o índice de alcance e o Dijkstra em pares sem caminho, com e sem ele.")
+    parser.add_argument("--pares", type=int, default=200)
+    parser.add_argument("--fontes", type=int, default=None,
+                        help="Fontes sorteadas em --bfs-direcional (padrão 20) e --ms-bfs (padrão 64).")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.vizinhos:
+        bench_vizinhos()
+
+    if args.ingestao:
+        bench_ingestao(args.csv, args.processos)
+
+    if args.bidirecional:
+        bench_bidirecional(args.pares, args.semente)
+
+    if args.alt:
+        bench_alt(args.pares, args.semente, args.landmarks)
+
+    if args.ch:
+        bench_ch(args.pares, args.semente)
+
+    if args.pll:
+        bench_pll(args.pares, args.semente)
+
+    if args.apsp:
+        bench_apsp(args.processos, args.origens)
+
+    if args.bf_vetorizado:
+        bench_bf_vetorizado(args.pares, args.semente)
+
+    if args.bfs_direcional:
+        bench_bfs_direcional(args.fontes or 20, args.semente)
+
+    if args.ms_bfs:
+        bench_ms_bfs(args.fontes or 64, args.semente, args.csv)
+
+    if args.alcance:
+        bench_alcance(args.pares, args.semente)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,13 @@ from .test_bellman_ford import calcular_distancias_bellman_ford as calcular_bell
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--calc-enderecos-parte2", action="store_true")
+    parser.add_argument("--johnson", action="store_true",
+                        help="Bellman–Ford dos pares via Johnson (um SPFA + um Dijkstra por origem).")
     args = parser.parse_args()
 
     if args.calc_enderecos_parte2:
         calcular_dijkstra()
-        calcular_bellmanford()
+        calcular_bellmanford(johnson=args.johnson)
 
 if __name__ == "__main__":
     main()
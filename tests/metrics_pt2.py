@@ -16,6 +16,7 @@ from src.graphs.algorithms import (
     NegativeCycle,
     NodeNotFound,
 )
+from src.graphs.vetorizado import ms_bfs
 
 # loader do dataset
 from tests.test_bfs_dfs import carregar_grafo_dataset
@@ -62,6 +63,32 @@ def run_bfs_metrics(G: graph.Graph, sources: List[str]) -> Dict[str, Any]:
     return results
 
 
+#  Métricas BFS com várias fontes por passada (MS-BFS, lotes de 64)
+def run_ms_bfs_metrics(G: graph.Graph, sources: List[str]) -> Dict[str, Any]:
+    validas = [s for s in sources if G.tem_no(s)]
+    por_fonte: Dict[str, Any] = {
+        s: {"error": f"source '{s}' not found"} for s in sources if not G.tem_no(s)
+    }
+    results: Dict[str, Any] = {"sources": por_fonte, "batch": {"sources": 0}}
+    if not validas:
+        return results
+    (resultado, tempo, memoria) = measure_time_and_memory(ms_bfs, G, validas)
+    for s, (camadas, _) in zip(validas, resultado):
+        por_fonte[s] = {
+            "layers": len(camadas),
+            "eccentricity": len(camadas) - 1,
+            "layer_sizes": [len(c) for c in camadas],
+            "total_nodes_visited": sum(len(c) for c in camadas),
+        }
+    results["batch"] = {
+        "sources": len(validas),
+        "time": tempo,
+        "time_per_source": tempo / len(validas),
+        "memory_peak_bytes": memoria,
+    }
+    return results
+
+
 #  Métricas DFS
 def run_dfs_metrics(G: graph.Graph, sources: List[str]) -> Dict[str, Any]:
     results = {}
@@ -174,6 +201,7 @@ def run_full_metrics(
         },
         "metrics": {
             "BFS": run_bfs_metrics(G, bfs_sources),
+            "MS-BFS": run_ms_bfs_metrics(G, bfs_sources),
             "DFS": run_dfs_metrics(G, dfs_sources),
             "Dijkstra": run_dijkstra_metrics(G, dijkstra_pairs),
             "Bellman-Ford": run_bellman_ford_metrics(G, bellman_pairs),
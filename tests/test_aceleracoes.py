@@ -0,0 +1,114 @@
+import math
+import random
+
+from src.graphs.graph import Graph, SubgraphView
+from src.graphs.algorithms import dijkstra_shortest_path
+from src.graphs.landmarks import alt_shortest_path, preparar_landmarks
+from src.graphs.contraction import ch_shortest_path, preparar_hierarquia
+from src.graphs.hub_labels import hub_path_length, preparar_rotulos
+
+
+def grafos_aleatorios(quantidade: int):
+    """
+    Grafos pequenos com pesos positivos, coluna extra "tempo" e nós isolados
+    ou só de chegada (pares sem caminho), como Graph, FrozenGraph e view
+    """
+    for semente in range(quantidade):
+        rng = random.Random(semente)
+        G = Graph(direcionado=semente % 2 == 0, colunas=("tempo",))
+        n = rng.randrange(2, 25)
+        for _ in range(rng.randrange(1, 3 * n)):
+            u, v = f"n{rng.randrange(n)}", f"n{rng.randrange(n)}"
+            G.adicionar_aresta(u, v, float(rng.randrange(1, 20)), tempo=rng.uniform(0.5, 5))
+        G.adicionar_no("isolado")
+        nos = G.nos()
+        filtro = set(rng.sample(nos, max(2, len(nos) * 2 // 3)))
+        F = G.congelar()
+        for grafo in (G, F, SubgraphView(G, filtro), SubgraphView(F, filtro)):
+            yield semente, grafo
+
+
+def _caminho_valido(grafo, caminho, origem, destino, custo, coluna) -> None:
+    assert caminho[0] == origem and caminho[-1] == destino
+    total = 0.0
+    for u, v in zip(caminho, caminho[1:]):
+        total += min(w for x, w in grafo.vizinhos_view(u, coluna) if x == v)
+    assert math.isclose(total, custo, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def _pares(grafo, semente):
+    nos = sorted(grafo.nos())
+    rng = random.Random(semente)
+    return [(rng.choice(nos), rng.choice(nos)) for _ in range(25)]
+
+
+def _conferir(grafo, pares, coluna, responder) -> int:
+    sem_caminho = 0
+    for origem, destino in pares:
+        esperado = dijkstra_shortest_path(grafo, origem, destino, coluna)
+        custo, caminho = responder(origem, destino)
+        assert custo == esperado.cost or math.isclose(custo, esperado.cost, rel_tol=1e-9)
+        if esperado.cost == math.inf:
+            sem_caminho += 1
+            assert not caminho
+        elif caminho is not None:
+            _caminho_valido(grafo, caminho, origem, destino, custo, coluna)
+    return sem_caminho
+
+
+def test_bidirecional():
+    sem_caminho = 0
+    for semente, grafo in grafos_aleatorios(60):
+        for coluna in (None, "tempo"):
+            def responder(origem, destino):
+                r = dijkstra_shortest_path(grafo, origem, destino, coluna, bidirecional=True)
+                return r.cost, r.path
+            sem_caminho += _conferir(grafo, _pares(grafo, semente), coluna, responder)
+    assert sem_caminho > 0
+
+
+def test_alt():
+    sem_caminho = 0
+    for semente, grafo in grafos_aleatorios(60):
+        for coluna in (None, "tempo"):
+            for selecao in ("avoid", "farthest"):
+                landmarks = preparar_landmarks(grafo, k=3, selecao=selecao, weight=coluna, semente=semente)
+
+                def responder(origem, destino):
+                    r = alt_shortest_path(grafo, origem, destino, landmarks, coluna)
+                    return r.cost, r.path
+                sem_caminho += _conferir(grafo, _pares(grafo, semente), coluna, responder)
+    assert sem_caminho > 0
+
+
+def test_contraction_hierarchies():
+    sem_caminho = 0
+    for semente, grafo in grafos_aleatorios(60):
+        for coluna in (None, "tempo"):
+            hierarquia = preparar_hierarquia(grafo, coluna)
+
+            def responder(origem, destino):
+                r = ch_shortest_path(hierarquia, origem, destino)
+                return r.cost, r.path
+            sem_caminho += _conferir(grafo, _pares(grafo, semente), coluna, responder)
+    assert sem_caminho > 0
+
+
+def test_hub_labels():
+    sem_caminho = 0
+    for semente, grafo in grafos_aleatorios(60):
+        for coluna in (None, "tempo"):
+            rotulos = preparar_rotulos(grafo, coluna)
+
+            def responder(origem, destino):
+                return hub_path_length(rotulos, origem, destino), None
+            sem_caminho += _conferir(grafo, _pares(grafo, semente), coluna, responder)
+    assert sem_caminho > 0
+
+
+if __name__ == "__main__":
+    test_bidirecional()
+    test_alt()
+    test_contraction_hierarchies()
+    test_hub_labels()
+    print("Bidirecional, ALT, CH e hub labels conferem com o Dijkstra.")
@@ -0,0 +1,160 @@
+import csv
+import random
+from collections import deque
+
+import pytest
+
+from src.graphs.graph import Graph
+from src.graphs.algorithms import NodeNotFound, alcanca, dijkstra_shortest_path
+from src.graphs.alcance import (
+    alcance_do_cache,
+    carregar_alcance,
+    preparar_alcance,
+    salvar_alcance,
+)
+from src.graphs.cache import caminho_tabela
+from src.graphs.io import carregar_grafo, limpar_registro
+
+
+def digrafos_aleatorios(quantidade: int):
+    """
+    Dígrafos esparsos (várias componentes fortes, nós só de saída ou de
+    chegada e nós isolados)
+    """
+    for semente in range(quantidade):
+        rng = random.Random(semente)
+        G = Graph(direcionado=semente % 4 != 0)
+        n = rng.randrange(1, 40)
+        for i in range(n):
+            G.adicionar_no(f"n{i}")
+        for _ in range(rng.randrange(0, 2 * n)):
+            G.adicionar_aresta(f"n{rng.randrange(n)}", f"n{rng.randrange(n)}", 1.0)
+        yield G
+
+
+def alcancaveis(G, fonte):
+    vistos = {fonte}
+    fila = deque([fonte])
+    while fila:
+        u = fila.popleft()
+        for v, _w in G.vizinhos_view(u):
+            if v not in vistos:
+                vistos.add(v)
+                fila.append(v)
+    return vistos
+
+
+def test_indice_igual_a_bfs():
+    for G in digrafos_aleatorios(200):
+        F = G.congelar()
+        indice = preparar_alcance(G)
+        for s in G.nos():
+            esperado = alcancaveis(G, s)
+            for t in G.nos():
+                assert indice.alcanca(s, t) == (t in esperado)
+                assert alcanca(G, s, t) == (t in esperado)
+                assert alcanca(F, s, t) == (t in esperado)
+
+        F.alcance = indice
+        try:
+            for s in G.nos():
+                esperado = alcancaveis(G, s)
+                for t in G.nos():
+                    assert alcanca(F, s, t) == (t in esperado)
+                    r = dijkstra_shortest_path(F, s, t)
+                    assert (r.cost != float("inf")) == (t in esperado)
+        finally:
+            F.alcance = None
+
+
+def test_nos_inexistentes():
+    G = Graph(direcionado=True)
+    G.adicionar_aresta("a", "b", 1.0)
+    F = G.congelar()
+    F.alcance = preparar_alcance(F)
+    for grafo in (G, F):
+        with pytest.raises(NodeNotFound):
+            alcanca(grafo, "x", "a")
+        with pytest.raises(NodeNotFound):
+            alcanca(grafo, "a", "x")
+    with pytest.raises(ValueError):
+        F.alcance.alcanca("x", "a")
+
+
+def test_salvar_e_carregar(tmp_path):
+    for k, G in enumerate(digrafos_aleatorios(30)):
+        indice = preparar_alcance(G)
+        destino = tmp_path / f"indice{k}.alc"
+        salvar_alcance(indice, destino)
+        carregado = carregar_alcance(destino)
+        assert carregado.nomes == indice.nomes
+        assert list(carregado.componente) == list(indice.componente)
+        for s in G.nos():
+            for t in G.nos():
+                assert carregado.alcanca(s, t) == indice.alcanca(s, t)
+
+    invalido = tmp_path / "invalido.alc"
+    invalido.write_bytes(b"GRAFOCSR" + bytes(32))
+    assert carregar_alcance(invalido) is None
+
+
+def test_indice_ao_lado_do_cache(tmp_path):
+    arquivo = tmp_path / "lrh.csv"
+    rng = random.Random(0)
+    with open(arquivo, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["nomemun_a", "nomemun_b", "custo", "tempo"])
+        for _ in range(120):
+            w.writerow([f"M{rng.randrange(60)}", f"M{rng.randrange(60)}", rng.randrange(1, 9), 1])
+
+    limpar_registro()
+    try:
+        G = carregar_grafo("lrh2016", arquivo=arquivo, direcionado=True, pasta_cache=tmp_path)
+        assert G.alcance is None
+        G = carregar_grafo("lrh2016", arquivo=arquivo, direcionado=True, pasta_cache=tmp_path, alcance=True)
+        assert G.alcance is not None
+
+        destino = caminho_tabela(G, "alc", {"indice": "fecho_scc"})
+        assert destino.exists()
+        antes = destino.stat().st_mtime_ns
+        # recarregado do arquivo, sem recalcular
+        indice = alcance_do_cache(G)
+        assert destino.stat().st_mtime_ns == antes
+        for s in G.nos():
+            esperado = alcancaveis(G, s)
+            for t in G.nos():
+                assert indice.alcanca(s, t) == (t in esperado)
+                assert alcanca(G, s, t) == (t in esperado)
+
+        # arquivo inválido: recalculado e regravado
+        destino.write_bytes(b"lixo")
+        indice = alcance_do_cache(G)
+        assert carregar_alcance(destino) is not None
+        assert all(indice.alcanca(s, s) for s in G.nos())
+
+        # grafo recompilado (CSV mudou): o índice antigo não serve mais
+        with open(arquivo, "a", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            for i in range(60):
+                w.writerow([f"M{i}", f"M{(i + 1) % 60}", 1, 1])
+        limpar_registro()
+        G = carregar_grafo("lrh2016", arquivo=arquivo, direcionado=True, pasta_cache=tmp_path, alcance=True)
+        assert all(G.alcance.alcanca(s, t) for s in G.nos() for t in G.nos())
+
+        with pytest.raises(ValueError):
+            carregar_grafo("lrh2016", arquivo=arquivo, compilado=False, alcance=True)
+    finally:
+        limpar_registro()
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    test_indice_igual_a_bfs()
+    test_nos_inexistentes()
+    with tempfile.TemporaryDirectory() as pasta:
+        test_salvar_e_carregar(Path(pasta))
+    with tempfile.TemporaryDirectory() as pasta:
+        test_indice_ao_lado_do_cache(Path(pasta))
+    print("Índice de alcance confere com a BFS.")
@@ -3,10 +3,10 @@ from pathlib import Path
 from time import time
 import tracemalloc
 
-from src.graphs.graph import Graph
+from src.graphs.io import carregar_grafo
 from src.graphs.algorithms import (
-    bellman_ford_path,
-    bellman_ford_path_length,
+    bellman_ford_shortest_path,
+    johnson_many_to_many,
     NoPath,
     NegativeCycle,
     NodeNotFound,
@@ -70,7 +70,22 @@ def analisar_ciclo_negativo(G, caminho, custo, origem, destino, excecao_ciclo=Fa
     
     return False
 
-def calcular_distancias_bellman_ford():
+def _rotas_johnson(G, rotas):
+    # Johnson para todos os pares válidos de uma vez (índice -> resultado);
+    # com ciclo negativo no grafo volta ao Bellman–Ford por par
+    validas = [
+        (idx, linha["municipio_inicio"], linha["municipio_destino"])
+        for idx, linha in enumerate(rotas, 1)
+        if G.tem_no(linha["municipio_inicio"]) and G.tem_no(linha["municipio_destino"])
+    ]
+    try:
+        resultados = johnson_many_to_many(G, [(o, d) for _idx, o, d in validas])
+    except NegativeCycle as e:
+        print(f"Johnson: {e} - usando Bellman–Ford por par")
+        return None
+    return {idx: rota for (idx, _o, _d), rota in zip(validas, resultados)}
+
+def calcular_distancias_bellman_ford(johnson=False):
     inicio_total = time()
     tracemalloc.start()
 
@@ -84,35 +99,13 @@ def calcular_distancias_bellman_ford():
     json_dir = out_root / "parte2"
     json_dir.mkdir(parents=True, exist_ok=True)
 
-    G = Graph(direcionado=True)
-
-    arestas_lidas = 0
-    arestas_negativas = 0
-
     try:
-        with open(
-            dataset_dir / "LRH2016_00_Base_Completa.csv",
-            newline="",
-            encoding="utf-8",
-        ) as file:
-            reader = csv.DictReader(file)
-
-            for linha in reader:
-                origem = linha["nomemun_a"]
-                destino = linha["nomemun_b"]
-                tempo_str = linha["tempo"]
-
-                try:
-                    peso = float(tempo_str)
-                except (TypeError, ValueError):
-                    continue
-
-                G.adicionar_aresta(origem, destino, peso)
-                arestas_lidas += 1
-
-                if peso < 0:
-                    arestas_negativas += 1
-
+        G = carregar_grafo(
+            "lrh2016",
+            peso="tempo",
+            direcionado=True,
+            alcance=True,
+        )
     except FileNotFoundError:
         print(f"ERRO: Arquivo de dados não encontrado em: {dataset_dir}")
         tracemalloc.stop()
@@ -130,6 +123,7 @@ def calcular_distancias_bellman_ford():
             reader = csv.DictReader(file)
             rotas = list(reader)
             total_rotas = len(rotas)
+            por_johnson = _rotas_johnson(G, rotas) if johnson else None
 
             for idx, linha in enumerate(rotas, 1):
                 origem = linha["municipio_inicio"]
@@ -155,12 +149,17 @@ def calcular_distancias_bellman_ford():
                     timeout_segundos = 30
 
                     try:
-                        custo = bellman_ford_path_length(G, origem, destino)
+                        if por_johnson is not None:
+                            rota = por_johnson[idx]
+                            if rota.cost == float("inf"):
+                                raise NoPath(f"Não há caminho de {origem} para {destino}", origem, destino)
+                        else:
+                            rota = bellman_ford_shortest_path(G, origem, destino)
 
                         if time() - inicio_rota > timeout_segundos:
                             raise TimeoutError(f"Timeout de {timeout_segundos}s atingido")
 
-                        caminho = bellman_ford_path(G, origem, destino)
+                        custo, caminho = rota.cost, rota.path
                         
                         tem_ciclo_negativo = analisar_ciclo_negativo(
                             G, caminho, custo, origem, destino, excecao_ciclo_negativo
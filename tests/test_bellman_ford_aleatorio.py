@@ -0,0 +1,81 @@
+import math
+import random
+
+import networkx as nx
+
+from src.graphs.graph import Graph
+from src.graphs.algorithms import (
+    NegativeCycle,
+    NoPath,
+    bellman_ford,
+    bellman_ford_shortest_path,
+    find_negative_cycle,
+)
+
+
+def grafos_aleatorios(quantidade: int):
+    """
+    Dígrafos pequenos com alguns pesos negativos (e, às vezes, ciclos negativos)
+    """
+    for semente in range(quantidade):
+        rng = random.Random(semente)
+        G = Graph(direcionado=True)
+        H = nx.DiGraph()
+        n = rng.randrange(2, 12)
+        for _ in range(rng.randrange(1, 4 * n)):
+            u, v = f"n{rng.randrange(n)}", f"n{rng.randrange(n)}"
+            if u == v:
+                continue
+            w = float(rng.randrange(-3, 10))
+            G.adicionar_aresta(u, v, w)
+            # Graph mantém o menor peso entre arcos paralelos
+            if not H.has_edge(u, v) or w < H[u][v]["weight"]:
+                H.add_edge(u, v, weight=w)
+        yield G, H
+
+
+def _ciclo_negativo_alcancavel(H: nx.DiGraph, fonte: str) -> bool:
+    alcancaveis = H.subgraph(nx.descendants(H, fonte) | {fonte}).copy()
+    return nx.negative_edge_cycle(alcancaveis)
+
+
+def test_distancias_e_ciclos_iguais_ao_networkx():
+    for G, H in grafos_aleatorios(500):
+        for fonte in G.nos():
+            if _ciclo_negativo_alcancavel(H, fonte):
+                try:
+                    bellman_ford(G, fonte, fonte)
+                except NegativeCycle as e:
+                    # o caminho do ciclo repete o primeiro nó no fim
+                    ciclo = e.path
+                    assert ciclo[0] == ciclo[-1]
+                    custo = sum(H[u][v]["weight"] for u, v in zip(ciclo, ciclo[1:]))
+                    assert custo < 0 and math.isclose(custo, e.cost)
+                else:
+                    raise AssertionError(f"ciclo negativo alcançável a partir de {fonte} não detectado")
+                assert find_negative_cycle(G, fonte) is not None
+                continue
+
+            esperado = nx.single_source_bellman_ford_path_length(H, fonte)
+            dist, _pred = bellman_ford(G, fonte, fonte)
+            assert dist.keys() == esperado.keys()
+            for v, d in esperado.items():
+                assert math.isclose(dist[v], d, abs_tol=1e-9)
+
+            for alvo in G.nos():
+                if alvo not in esperado:
+                    try:
+                        bellman_ford_shortest_path(G, fonte, alvo)
+                    except NoPath:
+                        continue
+                    raise AssertionError(f"{fonte} -> {alvo} não deveria ter caminho")
+                r = bellman_ford_shortest_path(G, fonte, alvo)
+                assert math.isclose(r.cost, esperado[alvo], abs_tol=1e-9)
+                assert r.path[0] == fonte and r.path[-1] == alvo
+                custo = sum(H[u][v]["weight"] for u, v in zip(r.path, r.path[1:]))
+                assert math.isclose(custo, r.cost, abs_tol=1e-9)
+
+
+if __name__ == "__main__":
+    test_distancias_e_ciclos_iguais_ao_networkx()
+    print("Bellman–Ford confere com o networkx em 500 grafos.")
@@ -0,0 +1,112 @@
+import csv
+import math
+import random
+
+import pytest
+
+from src.graphs.graph import Graph
+from src.graphs.io import BASE_DIR, LRH2016_CSV, carregar_grafo
+from src.graphs.algorithms import (
+    NegativeCycle,
+    NoPath,
+    bellman_ford,
+    bellman_ford_path_length,
+)
+from src.graphs.vetorizado import bellman_ford_vetorizado
+
+ENDERECOS = BASE_DIR / "data" / "dataset_parte2" / "enderecos_bellmanford.csv"
+
+
+def grafos_aleatorios(quantidade: int):
+    """
+    Dígrafos pequenos com arcos negativos (e, às vezes, ciclos negativos),
+    com uma coluna extra "tempo" também com negativos
+    """
+    for semente in range(quantidade):
+        rng = random.Random(semente)
+        G = Graph(direcionado=semente % 3 != 0, colunas=("tempo",))
+        n = rng.randrange(2, 12)
+        for _ in range(rng.randrange(1, 4 * n)):
+            u, v = f"n{rng.randrange(n)}", f"n{rng.randrange(n)}"
+            if u == v:
+                continue
+            if G.direcionado:
+                w, t = float(rng.randrange(-3, 10)), float(rng.randrange(-2, 10))
+            else:
+                # não direcionado: arco negativo já é ciclo negativo
+                w, t = float(rng.randrange(0, 10)), float(rng.randrange(-1, 10))
+            G.adicionar_aresta(u, v, w, tempo=t)
+        yield G
+
+
+def _custo_ciclo(G, ciclo, coluna) -> float:
+    assert ciclo[0] == ciclo[-1]
+    return sum(G.peso(u, v, coluna) for u, v in zip(ciclo, ciclo[1:]))
+
+
+def _conferir(G, fonte, coluna) -> None:
+    try:
+        esperado, _ = bellman_ford(G, fonte, fonte, coluna or "weight")
+    except NegativeCycle:
+        with pytest.raises(NegativeCycle) as erro:
+            bellman_ford_vetorizado(G, fonte, weight=coluna)
+        custo = _custo_ciclo(G, erro.value.path, coluna)
+        assert custo < 0 and math.isclose(custo, erro.value.cost, abs_tol=1e-9)
+        return
+
+    for grafo in (G, G.congelar()):
+        dist, pred = bellman_ford_vetorizado(grafo, fonte, weight=coluna)
+        assert dist.keys() == esperado.keys()
+        for v, d in esperado.items():
+            assert math.isclose(dist[v], d, abs_tol=1e-9)
+            # árvore de predecessores consistente com as distâncias
+            if pred[v] is not None:
+                assert math.isclose(dist[pred[v]] + G.peso(pred[v], v, coluna), d, abs_tol=1e-9)
+        assert pred[fonte] is None
+
+
+def test_igual_ao_bellman_ford_em_grafos_aleatorios():
+    for G in grafos_aleatorios(300):
+        for fonte in G.nos():
+            _conferir(G, fonte, None)
+            _conferir(G, fonte, "tempo")
+
+
+def test_caminho_vetorizado_igual():
+    for G in grafos_aleatorios(100):
+        nos = G.nos()
+        for fonte in nos[:3]:
+            for alvo in nos:
+                try:
+                    esperado = bellman_ford_path_length(G, fonte, alvo)
+                except (NoPath, NegativeCycle) as erro:
+                    with pytest.raises(type(erro)):
+                        bellman_ford_path_length(G, fonte, alvo, vetorizado=True)
+                    continue
+                assert math.isclose(bellman_ford_path_length(G, fonte, alvo, vetorizado=True), esperado, abs_tol=1e-9)
+
+
+@pytest.mark.skipif(not LRH2016_CSV.exists(), reason="dataset LRH2016 ausente")
+def test_rotas_do_dataset():
+    # mesmas rotas e grafo de tests/test_bellman_ford.py
+    G = carregar_grafo("lrh2016", peso="tempo", direcionado=True)
+    with open(ENDERECOS, newline="", encoding="utf-8") as f:
+        rotas = [(r["municipio_inicio"], r["municipio_destino"]) for r in csv.DictReader(f)]
+    for origem, destino in rotas:
+        if not (G.tem_no(origem) and G.tem_no(destino)):
+            continue
+        try:
+            esperado = bellman_ford_path_length(G, origem, destino)
+        except (NoPath, NegativeCycle) as erro:
+            with pytest.raises(type(erro)):
+                bellman_ford_path_length(G, origem, destino, vetorizado=True)
+            continue
+        assert math.isclose(bellman_ford_path_length(G, origem, destino, vetorizado=True), esperado, abs_tol=1e-6)
+
+
+if __name__ == "__main__":
+    test_igual_ao_bellman_ford_em_grafos_aleatorios()
+    test_caminho_vetorizado_igual()
+    if LRH2016_CSV.exists():
+        test_rotas_do_dataset()
+    print("Bellman–Ford vetorizado confere com o SPFA.")
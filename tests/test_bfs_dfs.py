@@ -1,7 +1,4 @@
-import csv
-from pathlib import Path
-
-from src.graphs.graph import Graph
+from src.graphs.io import carregar_grafo
 from src.graphs.algorithms import (
     bfs_ordem_camadas_ciclos_dir,
     dfs_ordem_camadas_ciclos_dir,
@@ -12,30 +9,11 @@ def carregar_grafo_dataset():
     """
     Carregando o dataset completo
     """
-    base = Path(__file__).resolve().parent.parent
-    dataset_dir = base / "data" / "dataset_parte2"
-
-    G = Graph(direcionado=True)
-
-    caminho_csv = dataset_dir / "LRH2016_00_Base_Completa.csv"
-    if not caminho_csv.exists():
-        raise FileNotFoundError(f"Dataset não encontrado: {caminho_csv}")
-
-    with open(caminho_csv, newline="", encoding="utf-8") as file:
-        reader = csv.DictReader(file)
-        for linha in reader:
-            origem = linha["nomemun_a"]
-            destino = linha["nomemun_b"]
-            tempo_str = linha["tempo"]
-
-            try:
-                peso = float(tempo_str)
-            except Exception:
-                continue
-
-            G.adicionar_aresta(origem, destino, peso)
-
-    return G
+    return carregar_grafo(
+        "lrh2016",
+        peso="tempo",
+        direcionado=True,
+    )
 
 
 def validar_resultado(nome_alg, fonte, ordem, camadas, ciclos):
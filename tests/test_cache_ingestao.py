@@ -0,0 +1,115 @@
+import csv
+import itertools
+import os
+import random
+
+from src.graphs.cache import caminho_cache
+from src.graphs.io import carregar_grafo, ler_grafo, limpar_registro
+from src.graphs.ingest import ingerir_csv
+
+NOMES = ["Recife", " recife", "RECIFE ", "Olinda", "São José", "Sao Jose", "Caruaru, PE", "Jaboatão", ""]
+
+
+def escrever_csv(caminho, semente: int, linhas: int = 300) -> None:
+    """
+    CSV no formato LRH com o que a leitura precisa tratar: grafias que a
+    normalização junta, nome vazio, vírgula entre aspas, arcos paralelos
+    e pesos vazios, inválidos, zero e negativos
+    """
+    rng = random.Random(semente)
+    pesos = ["", "abc", "0", "-2", " 3.5 ", "1e1"] + [str(rng.randrange(1, 50)) for _ in range(20)]
+    with open(caminho, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["id", "nomemun_a", "nomemun_b", "custo", "tempo"])
+        for i in range(linhas):
+            w.writerow([i, rng.choice(NOMES), rng.choice(NOMES), rng.choice(pesos), rng.choice(pesos)])
+
+
+def mesmo_grafo(a, b) -> bool:
+    return (
+        list(a.nomes) == list(b.nomes)
+        and list(a.offsets) == list(b.offsets)
+        and list(a.alvos) == list(b.alvos)
+        and list(a.pesos) == list(b.pesos)
+        and a.colunas == b.colunas
+        and all(list(a.valores_colunas[c]) == list(b.valores_colunas[c]) for c in a.colunas)
+        and a.direcionado == b.direcionado
+        and a.nome_peso == b.nome_peso
+    )
+
+
+OPCOES = [
+    dict(zip(("direcionado", "normalizar", "descartar_nao_positivos", "peso_padrao", "peso"), valores))
+    for valores in itertools.product(
+        (False, True), (None, "minusculas", "sem_acentos"), (False, True), (None, 1.0), ("custo", "tempo")
+    )
+]
+
+
+def test_ingestao_igual_ao_ler_grafo(tmp_path):
+    arquivo = tmp_path / "lrh.csv"
+    for semente in range(3):
+        escrever_csv(arquivo, semente)
+        for opcoes in OPCOES:
+            referencia = ler_grafo("lrh2016", arquivo=arquivo, colunas=("custo", "tempo"), **opcoes).congelar()
+            # uma faixa só e várias faixas pequenas (fronteiras no meio do arquivo)
+            for processos, bloco in ((1, 1 << 20), (1, 2048), (2, 2048)):
+                grafo, relatorio = ingerir_csv(
+                    "lrh2016", arquivo=arquivo, colunas=("custo", "tempo"),
+                    processos=processos, tamanho_bloco=bloco, **opcoes,
+                )
+                assert mesmo_grafo(grafo, referencia), (semente, opcoes, processos, bloco)
+                assert relatorio["linhas"] == 300
+
+
+def test_cache_ida_e_volta(tmp_path):
+    arquivo = tmp_path / "lrh.csv"
+    escrever_csv(arquivo, 0)
+    opcoes = {"peso": "custo", "colunas": ("tempo",), "direcionado": True, "normalizar": "sem_acentos"}
+    referencia = ler_grafo("lrh2016", arquivo=arquivo, **opcoes).congelar()
+
+    limpar_registro()
+    try:
+        for paralelo in (False, True):
+            G = carregar_grafo("lrh2016", arquivo=arquivo, pasta_cache=tmp_path, paralelo=paralelo, **opcoes)
+            assert mesmo_grafo(G, referencia)
+            assert G.arquivo is not None and os.path.dirname(G.arquivo) == str(tmp_path)
+            assert G.peso_minimo() == referencia.peso_minimo()
+            assert G.peso_minimo("tempo") == referencia.peso_minimo("tempo")
+
+        # processo novo: o grafo vem do arquivo, sem recompilar
+        cache = caminho_cache(arquivo, {
+            "peso": "custo", "direcionado": True, "normalizar": "sem_acentos",
+            "descartar_nao_positivos": False, "peso_padrao": None, "colunas": ("tempo",),
+        }, tmp_path)
+        assert cache.exists()
+        antes = cache.stat().st_mtime_ns
+        limpar_registro()
+        G = carregar_grafo("lrh2016", arquivo=arquivo, pasta_cache=tmp_path, **opcoes)
+        assert mesmo_grafo(G, referencia)
+        assert cache.stat().st_mtime_ns == antes
+
+        # CSV alterado: recompila
+        escrever_csv(arquivo, 1, linhas=310)
+        limpar_registro()
+        G = carregar_grafo("lrh2016", arquivo=arquivo, pasta_cache=tmp_path, **opcoes)
+        assert mesmo_grafo(G, ler_grafo("lrh2016", arquivo=arquivo, **opcoes).congelar())
+
+        # cache corrompido: descartado e recompilado
+        cache.write_bytes(b"lixo")
+        limpar_registro()
+        G = carregar_grafo("lrh2016", arquivo=arquivo, pasta_cache=tmp_path, **opcoes)
+        assert mesmo_grafo(G, ler_grafo("lrh2016", arquivo=arquivo, **opcoes).congelar())
+    finally:
+        limpar_registro()
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    with tempfile.TemporaryDirectory() as pasta:
+        test_ingestao_igual_ao_ler_grafo(Path(pasta))
+    with tempfile.TemporaryDirectory() as pasta:
+        test_cache_ida_e_volta(Path(pasta))
+    print("Cache e ingestão conferem com ler_grafo.")
@@ -0,0 +1,87 @@
+import random
+
+import networkx as nx
+
+from src.graphs.graph import Graph
+from src.graphs.algorithms import (
+    bfs_ordem_camadas_ciclos_dir,
+    dfs_ordem_camadas_ciclos_dir,
+    simple_cycles,
+    strongly_connected_components,
+)
+
+
+def grafos_aleatorios(quantidade: int, max_nos: int = 9):
+    """
+    Pares (Graph, nx.DiGraph/nx.Graph) pequenos com as mesmas arestas
+    """
+    for semente in range(quantidade):
+        rng = random.Random(semente)
+        direcionado = semente % 3 != 0
+        G = Graph(direcionado=direcionado)
+        H = nx.DiGraph() if direcionado else nx.Graph()
+        n = rng.randrange(2, max_nos)
+        for i in range(n):
+            G.adicionar_no(f"n{i}")
+            H.add_node(f"n{i}")
+        for _ in range(rng.randrange(1, 3 * n)):
+            u, v = f"n{rng.randrange(n)}", f"n{rng.randrange(n)}"
+            G.adicionar_aresta(u, v, 1.0)
+            H.add_edge(u, v)
+        yield G, H
+
+
+def _chave(ciclo, direcionado: bool):
+    k = ciclo.index(min(ciclo))
+    ciclo = ciclo[k:] + ciclo[:k]
+    if direcionado:
+        return tuple(ciclo)
+    return min(tuple(ciclo), tuple([ciclo[0]] + ciclo[:0:-1]))
+
+
+def _e_ciclo(G: Graph, ciclo) -> bool:
+    return len(set(ciclo)) == len(ciclo) and all(
+        v in G.adj.get(u, {}) for u, v in zip(ciclo, ciclo[1:] + ciclo[:1])
+    )
+
+
+def test_ciclos_iguais_ao_networkx():
+    for G, H in grafos_aleatorios(300):
+        esperados = {_chave(c, G.direcionado) for c in nx.simple_cycles(H) if len(c) >= 3}
+        achados = simple_cycles(G, max_cycles=10**6)
+        chaves = [_chave(c, G.direcionado) for c in achados]
+        assert len(chaves) == len(set(chaves))
+        assert set(chaves) == esperados
+        assert all(_e_ciclo(G, c) for c in achados)
+
+
+def test_componentes_iguais_ao_networkx():
+    for G, H in grafos_aleatorios(300):
+        if not G.direcionado:
+            continue
+        esperadas = {frozenset(c) for c in nx.strongly_connected_components(H)}
+        assert {frozenset(c) for c in strongly_connected_components(G)} == esperadas
+
+
+def test_ciclos_da_fonte_primeiro():
+    # os ciclos pela fonte vêm antes dos outros, em tamanho crescente
+    for G, H in grafos_aleatorios(300):
+        for fonte in G.nos():
+            for percurso in (bfs_ordem_camadas_ciclos_dir, dfs_ordem_camadas_ciclos_dir):
+                ciclos = percurso(G, fonte, max_cycles=10**6)[2]
+                pela_fonte = [c for c in ciclos if fonte in c]
+                assert ciclos[:len(pela_fonte)] == pela_fonte
+                assert all(c[0] == fonte for c in pela_fonte)
+                tamanhos = [len(c) for c in pela_fonte]
+                assert tamanhos == sorted(tamanhos)
+                assert all(_e_ciclo(G, c) for c in ciclos)
+
+                curtos = percurso(G, fonte, max_cycles=3)[2]
+                assert curtos == ciclos[:3]
+
+
+if __name__ == "__main__":
+    test_ciclos_iguais_ao_networkx()
+    test_componentes_iguais_ao_networkx()
+    test_ciclos_da_fonte_primeiro()
+    print("Ciclos e componentes conferem com o networkx.")
@@ -0,0 +1,68 @@
+import random
+
+from src.graphs.graph import Graph, SubgraphView
+from src.graphs.algorithms import (
+    bfs_ordem_camadas_ciclos_dir,
+    dfs_ordem_camadas_ciclos_dir,
+    dijkstra_shortest_path,
+)
+
+
+def grafo_aleatorio(semente: int, direcionado: bool) -> Graph:
+    """
+    Grafo pequeno com nós que só recebem arcos (sumidouros)
+    """
+    rng = random.Random(semente)
+    G = Graph(direcionado=direcionado)
+    n = rng.randrange(2, 40)
+    for _ in range(rng.randrange(1, 80)):
+        G.adicionar_aresta(f"n{rng.randrange(n)}", f"n{rng.randrange(n)}", rng.uniform(1, 5))
+    for k in range(rng.randrange(0, 4)):
+        G.adicionar_aresta(f"n{rng.randrange(n)}", f"Sink{k}", rng.uniform(1, 5))
+    return G
+
+
+def test_mesmos_nos():
+    for semente in range(200):
+        G = grafo_aleatorio(semente, direcionado=semente % 2 == 0)
+        F = G.congelar()
+        assert G.ordem() == F.ordem()
+        assert G.tamanho() == F.tamanho()
+        assert sorted(G.nos()) == F.nos()
+        for no in F.nos():
+            assert G.tem_no(no) and F.tem_no(no)
+
+
+def test_mesmos_resultados():
+    for semente in range(100):
+        G = grafo_aleatorio(semente, direcionado=semente % 2 == 0)
+        F = G.congelar()
+        for fonte in F.nos()[:5]:
+            assert bfs_ordem_camadas_ciclos_dir(G, fonte) == bfs_ordem_camadas_ciclos_dir(F, fonte)
+            assert dfs_ordem_camadas_ciclos_dir(G, fonte) == dfs_ordem_camadas_ciclos_dir(F, fonte)
+            for alvo in F.nos():
+                a = dijkstra_shortest_path(G, fonte, alvo)
+                b = dijkstra_shortest_path(F, fonte, alvo)
+                assert (a.cost, a.path) == (b.cost, b.path)
+
+
+def test_subgrafo_com_laco():
+    # view sobre todos os nós conta arestas como o grafo pai (laço incluso)
+    for direcionado in (False, True):
+        G = Graph(direcionado=direcionado)
+        G.adicionar_aresta("a", "a", 1.0)
+        G.adicionar_aresta("a", "b", 2.0)
+        for pai in (G, G.congelar()):
+            view = SubgraphView(pai, pai.nos())
+            assert view.tamanho() == pai.tamanho()
+            assert view.ordem() == pai.ordem()
+            assert sorted(view.nos()) == sorted(pai.nos())
+            for no in pai.nos():
+                assert view.grau(no) == pai.grau(no)
+
+
+if __name__ == "__main__":
+    test_mesmos_nos()
+    test_mesmos_resultados()
+    test_subgrafo_com_laco()
+    print("Graph e FrozenGraph concordam.")
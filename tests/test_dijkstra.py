@@ -2,11 +2,9 @@ import csv, json, unicodedata, re
 from pathlib import Path
 from time import time 
 import tracemalloc
-from src.graphs.graph import Graph
+from src.graphs.io import carregar_grafo
 from src.graphs.algorithms import (
-    dijkstra_path,
-    dijkstra_path_length,
-    NoPath,
+    dijkstra_many_to_many,
 )
 
 
@@ -31,29 +29,15 @@ def calcular_distancias():
     json_dir = out_root / "parte2"
     json_dir.mkdir(parents=True, exist_ok=True)
 
-    G = Graph(direcionado=True)
+    # arestas espelhadas (ida e volta) com peso "tempo" positivo
+    G = carregar_grafo(
+        "lrh2016",
+        peso="tempo",
+        direcionado=False,
+        descartar_nao_positivos=True,
+    )
 
-    with open(dataset_dir / "LRH2016_00_Base_Completa.csv",
-              newline="", encoding="utf-8") as file:
-        reader = csv.DictReader(file)
-
-        for linha in reader:
-            origem = linha["nomemun_a"]
-            destino = linha["nomemun_b"]
-            tempo_str = linha["tempo"]
-
-            try:
-                peso = float(tempo_str)
-            except (TypeError, ValueError):
-                continue
-
-            if peso <= 0:
-                continue
-
-            G.adicionar_aresta(origem, destino, peso)
-            G.adicionar_aresta(destino, origem, peso)
-
-    resultados = []
+    pares = []
 
     with open(dataset_dir / "enderecos_parte2.csv",
               newline="", encoding="utf-8") as file:
@@ -72,31 +56,32 @@ def calcular_distancias():
                     f"Destino '{destino}' não existe no grafo (normalizado: '{destino}')."
                 )
 
-            try:
-                custo = dijkstra_path_length(G, origem, destino)
-                caminho = dijkstra_path(G, origem, destino)
-            except NoPath:
-                custo = None
-                caminho = []
+            pares.append((origem, destino))
 
-            resultados.append(
-                [origem, destino, custo, " -> ".join(caminho)]
+    # uma busca por origem distinta, resultados na ordem do arquivo
+    resultados = []
+    for rota in dijkstra_many_to_many(G, pares):
+        origem, destino = rota.source, rota.target
+        custo, caminho = rota.cost, rota.path
+
+        resultados.append(
+            [origem, destino, custo, " -> ".join(caminho)]
+        )
+
+        json_name = f"percurso_{_slug(origem)}_{_slug(destino)}.json"
+        with open(json_dir / json_name, "w", encoding="utf-8") as jf:
+            json.dump(
+                {
+                    "origem": origem,
+                    "destino": destino,
+                    "custo": custo,
+                    "caminho": caminho,
+                },
+                jf,
+                ensure_ascii=False,
+                indent=2,
             )
 
-            json_name = f"percurso_{_slug(origem)}_{_slug(destino)}.json"
-            with open(json_dir / json_name, "w", encoding="utf-8") as jf:
-                json.dump(
-                    {
-                        "origem": origem,
-                        "destino": destino,
-                        "custo": custo,
-                        "caminho": caminho,
-                    },
-                    jf,
-                    ensure_ascii=False,
-                    indent=2,
-                )
-
     csv_path = json_dir / "distancias_enderecos_parte2.csv"
     with open(csv_path, "w", newline="", encoding="utf-8") as file:
         w = csv.writer(file)
@@ -0,0 +1,169 @@
+import random
+
+import pytest
+
+from src.graphs.graph import Graph
+
+COLUNAS = ("tempo",)
+
+
+def copia(G: Graph) -> Graph:
+    """
+    Cópia independente (sem snapshot/COW) da versão atual de G
+    """
+    H = Graph(direcionado=G.direcionado, colunas=G.colunas)
+    for u in G.nos():
+        H.adicionar_no(u)
+    for u in G.nos():
+        tempos = dict(G.vizinhos_view(u, "tempo"))
+        for v, w in G.vizinhos_view(u):
+            H.adicionar_aresta(u, v, w, tempo=tempos[v])
+    return H
+
+
+def estado(G: Graph):
+    arcos = {}
+    for u in G.nos():
+        tempos = dict(G.vizinhos_view(u, "tempo"))
+        for v, w in G.vizinhos_view(u):
+            arcos[(u, v)] = (w, tempos[v])
+    graus = {u: (G.grau_saida(u), G.grau_entrada(u)) for u in G.nos()}
+    return (
+        sorted(G.nos()),
+        arcos,
+        graus,
+        G.tamanho(),
+        G.peso_minimo(),
+        G.peso_minimo("tempo"),
+        G.possui_peso_negativo(),
+    )
+
+
+def mutar(G: Graph, rng: random.Random, n: int) -> None:
+    arcos = [(u, v) for u in G.nos() for v, _w in G.vizinhos_view(u)]
+    op = rng.random()
+    if op < 0.5 or not arcos:
+        u, v = f"n{rng.randrange(n)}", f"n{rng.randrange(n)}"
+        G.adicionar_aresta(u, v, float(rng.randrange(-2, 10)), tempo=float(rng.randrange(0, 10)))
+    elif op < 0.7:
+        G.remover_aresta(*rng.choice(arcos))
+    elif op < 0.8:
+        G.atualizar_peso(*rng.choice(arcos), peso=float(rng.randrange(-2, 10)))
+    elif op < 0.9:
+        G.atualizar_peso(*rng.choice(arcos), tempo=float(rng.randrange(0, 10)))
+    else:
+        G.adicionar_no(f"n{rng.randrange(n + 5)}")
+
+
+def reaplicar(H: Graph, mudancas) -> None:
+    for m in mudancas:
+        extras = m.extras or {}
+        if m.operacao == "adicionar_no":
+            H.adicionar_no(m.origem)
+        elif m.operacao == "adicionar":
+            H.adicionar_aresta(m.origem, m.destino, m.peso, **extras)
+        elif m.operacao == "remover":
+            H.remover_aresta(m.origem, m.destino)
+        else:
+            H.atualizar_peso(m.origem, m.destino, m.peso, **extras)
+
+
+def test_snapshots_isolados():
+    for semente in range(150):
+        rng = random.Random(semente)
+        G = Graph(direcionado=semente % 2 == 0, colunas=COLUNAS)
+        n = rng.randrange(2, 12)
+        guardados = []
+        for passo in range(rng.randrange(10, 80)):
+            mutar(G, rng, n)
+            if rng.random() < 0.2:
+                guardados.append((G.snapshot(), copia(G), G.versao))
+            elif rng.random() < 0.1:
+                G.congelar()
+
+        for snap, referencia, versao in guardados:
+            # o snapshot não vê as escritas feitas depois dele
+            assert snap.versao == versao
+            assert estado(snap) == estado(referencia)
+            # o log a partir do snapshot leva a cópia até a versão atual
+            reaplicar(referencia, G.mudancas_desde(versao))
+            assert estado(referencia) == estado(G)
+        assert estado(G) == estado(copia(G))
+
+
+def test_snapshot_somente_leitura():
+    G = Graph(direcionado=True, colunas=COLUNAS)
+    G.adicionar_aresta("a", "b", 1.0, tempo=2.0)
+    snap = G.snapshot()
+    with pytest.raises(TypeError):
+        snap.adicionar_aresta("a", "c", 1.0)
+    with pytest.raises(TypeError):
+        snap.remover_aresta("a", "b")
+    with pytest.raises(TypeError):
+        snap.atualizar_peso("a", "b", 5.0)
+    assert estado(snap) == estado(G)
+
+
+def test_log_comeca_no_primeiro_snapshot():
+    G = Graph(direcionado=True)
+    for i in range(50):
+        G.adicionar_aresta(f"n{i % 7}", f"n{(i * 3) % 7}", float(i))
+    assert G._log == []
+    with pytest.raises(ValueError):
+        G.mudancas_desde(0)
+
+    snap = G.snapshot()
+    assert G.mudancas_desde(snap.versao) == []
+    with pytest.raises(ValueError):
+        G.mudancas_desde(snap.versao - 1)
+
+    G.adicionar_aresta("x", "y", 1.0)
+    G.remover_aresta("x", "y")
+    assert [m.operacao for m in G.mudancas_desde(snap.versao)] == ["adicionar", "remover"]
+    assert snap.mudancas_desde(snap.versao) == []
+
+
+def test_congelar_inicia_log_e_ignora_insercao_sem_efeito():
+    G = Graph(direcionado=False, colunas=COLUNAS)
+    G.adicionar_aresta("a", "b", 3.0, tempo=3.0)
+    F = G.congelar()
+    versao = G.versao
+    # arco existente sem peso menor: nada muda
+    G.adicionar_aresta("b", "a", 4.0, tempo=3.0)
+    assert G.versao == versao and G.congelar() is F
+    G.adicionar_aresta("b", "a", 4.0, tempo=1.0)
+    assert [m.operacao for m in G.mudancas_desde(F.versao)] == ["adicionar"]
+    assert G.peso("a", "b", "tempo") == 1.0 and G.peso("a", "b") == 3.0
+
+
+def test_peso_minimo_depois_de_remocao():
+    for semente in range(100):
+        rng = random.Random(semente)
+        G = Graph(direcionado=True, colunas=COLUNAS)
+        n = rng.randrange(2, 10)
+        for _ in range(rng.randrange(1, 30)):
+            u, v = f"n{rng.randrange(n)}", f"n{rng.randrange(n)}"
+            G.adicionar_aresta(u, v, float(rng.randrange(-5, 10)), tempo=float(rng.randrange(0, 10)))
+        snap = G.snapshot()
+        antes = (snap.peso_minimo(), snap.peso_minimo("tempo"))
+        while G.tamanho():
+            # sempre remove um arco de menor peso
+            u, v = min(
+                ((u, v) for u in G.nos() for v, _w in G.vizinhos_view(u)),
+                key=lambda a: G.peso(*a),
+            )
+            G.remover_aresta(u, v)
+            referencia = copia(G)
+            assert G.peso_minimo() == referencia.peso_minimo()
+            assert G.peso_minimo("tempo") == referencia.peso_minimo("tempo")
+            assert G.possui_peso_negativo() == referencia.possui_peso_negativo()
+        assert (snap.peso_minimo(), snap.peso_minimo("tempo")) == antes
+
+
+if __name__ == "__main__":
+    test_snapshots_isolados()
+    test_snapshot_somente_leitura()
+    test_log_comeca_no_primeiro_snapshot()
+    test_congelar_inicia_log_e_ignora_insercao_sem_efeito()
+    test_peso_minimo_depois_de_remocao()
+    print("Snapshots, log e mínimos conferem.")